@@ -0,0 +1,98 @@
+"""
+Compara el tiempo de evaluación serial, con hilos y con procesos para distintos tipos
+de función objetivo.
+
+Uso:
+    python benchmarks/evaluadores.py [--valores N] [--trabajadores N] [--repeticiones N]
+
+- Con una función barata y vectorizada, la evaluación serial suele ganar: el reparto
+  en bloques cuesta más que la propia evaluación.
+- Con una función que libera el GIL (álgebra lineal de NumPy), los hilos ganan a la
+  evaluación serial y evitan el coste de serialización de los procesos.
+- Con una función en Python puro que retiene el GIL, solo los procesos escalan.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# Añadir directorio raíz al path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from funciones.objetivo import funcion_objetivo
+from genetico.evaluacion import EvaluadorSerial, EvaluadorHilos, EvaluadorProcesos
+
+_MATRIZ = np.random.default_rng(0).random((150, 150))
+
+
+def funcion_numpy(x):
+    """Función costosa que pasa casi todo su tiempo en BLAS, sin el GIL."""
+    producto = np.linalg.matrix_power(_MATRIZ * (1 + 1e-3 * math.sin(x)), 4)
+    return float(np.log(np.abs(np.trace(producto)) + 1))
+
+
+def funcion_python(x):
+    """Función costosa en Python puro, que retiene el GIL."""
+    total = 0.0
+    for k in range(1, 3000):
+        total += math.sin(k * x) / k
+    return total
+
+
+funcion_numpy.vectorizada = False
+funcion_python.vectorizada = False
+
+
+def medir(evaluador, funcion, valores, repeticiones):
+    """Devuelve el mejor tiempo de varias evaluaciones completas."""
+    vectorizada = bool(getattr(funcion, 'vectorizada', False))
+
+    # Primera llamada para arrancar el pool y estimar el coste por valor
+    evaluador.evaluar(funcion, valores, vectorizada)
+
+    mejor = np.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        evaluador.evaluar(funcion, valores, vectorizada)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--valores', type=int, default=400)
+    parser.add_argument('--trabajadores', type=int, default=os.cpu_count())
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    valores = np.linspace(10.60, 18.20, args.valores)
+    funciones = [
+        ('vectorizada barata', funcion_objetivo),
+        ('NumPy (libera el GIL)', funcion_numpy),
+        ('Python puro (GIL)', funcion_python),
+    ]
+
+    print(f"{args.valores} valores, {args.trabajadores} trabajadores\n")
+    print(f"{'Función':<24}{'Serial':>10}{'Hilos':>10}{'Procesos':>10}")
+
+    for nombre, funcion in funciones:
+        tiempos = []
+        for evaluador in (
+                EvaluadorSerial(),
+                EvaluadorHilos(n_trabajadores=args.trabajadores),
+                EvaluadorProcesos(n_trabajadores=args.trabajadores)
+        ):
+            with evaluador:
+                tiempos.append(medir(evaluador, funcion, valores, args.repeticiones))
+
+        print(f"{nombre:<24}" + "".join(f"{t * 1000:>8.1f}ms" for t in tiempos))
+
+
+if __name__ == "__main__":
+    main()
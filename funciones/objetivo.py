@@ -6,22 +6,41 @@ def funcion_objetivo(x):
     Función objetivo a maximizar:
     f(x) = ln(10 + 3 cos(7x) - 5 sen(13x) + abs(x))
 
+    Acepta tanto escalares como arrays; con arrays el cálculo se hace en el
+    lugar sobre dos buffers del tamaño de la entrada.
+
     Args:
         x: Valor(es) de entrada
 
     Returns:
         Valor(es) de la función
     """
-    # Asegurarse que el argumento del logaritmo sea positivo
-    argumento = 10 + 3 * np.cos(7 * x) - 5 * np.sin(13 * x) + np.abs(x)
-
-    # Si algún valor es menor o igual a cero, retornar un valor muy negativo
-    if np.any(argumento <= 0):
-        if np.isscalar(argumento):
-            return -np.inf
-        else:
-            resultado = np.log(np.maximum(argumento, 1e-10))
-            resultado[argumento <= 0] = -np.inf
-            return resultado
-
-    return np.log(argumento)
\ No newline at end of file
+    x = np.asarray(x, dtype=float)
+
+    # argumento = 10 + 3 cos(7x) - 5 sen(13x) + abs(x), reutilizando buffers
+    argumento = np.empty_like(x)
+    auxiliar = np.empty_like(x)
+
+    np.multiply(x, 7, out=argumento)
+    np.cos(argumento, out=argumento)
+    argumento *= 3
+    argumento += 10
+
+    np.multiply(x, 13, out=auxiliar)
+    np.sin(auxiliar, out=auxiliar)
+    auxiliar *= 5
+    argumento -= auxiliar
+
+    np.abs(x, out=auxiliar)
+    argumento += auxiliar
+
+    # Si el argumento es menor o igual a cero el logaritmo vale -inf
+    np.maximum(argumento, 0, out=argumento)
+    with np.errstate(divide='ignore'):
+        np.log(argumento, out=argumento)
+
+    return argumento[()]
+
+
+# La función acepta la población completa en una sola llamada
+funcion_objetivo.vectorizada = True
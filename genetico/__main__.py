@@ -0,0 +1,267 @@
+"""
+Ejecuta AlgoritmoGenetico desde la línea de comandos, sin interfaz gráfica.
+
+Uso:
+    python -m genetico [--semilla N] [--generaciones N] [--salida resultados.json|.csv] [opciones]
+
+Solo importa NumPy y el paquete genetico; matplotlib se importa únicamente si se pide
+una gráfica con --graficar. La salida JSON incluye el resumen y los historiales; la
+salida CSV, una fila de resumen con los parámetros y los resultados.
+"""
+import argparse
+import csv
+import importlib
+import json
+import sys
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from genetico.algoritmo import AlgoritmoGenetico
+from genetico.historial import POLITICAS
+
+# Columnas de resultados de la salida CSV (a continuación de los parámetros)
+COLUMNAS_RESULTADO = (
+    'semilla',
+    'mejor_fitness',
+    'mejor_valor_real',
+    'generaciones',
+    'evaluaciones',
+    'criterio_parada',
+    'tiempo'
+)
+
+
+def cargar_funcion(referencia: str) -> Callable:
+    """
+    Importa una función a partir de una referencia 'modulo:nombre'.
+
+    Args:
+        referencia: Ruta de importación del módulo y nombre de la función
+
+    Returns:
+        La función referenciada
+    """
+    modulo, separador, nombre = referencia.partition(':')
+    if not separador or not modulo or not nombre:
+        raise ValueError(f"Referencia de función no válida (se espera modulo:nombre): {referencia}")
+    return getattr(importlib.import_module(modulo), nombre)
+
+
+def _booleano_opcional(valor: str) -> Optional[bool]:
+    """Convierte 'si'/'no'/'auto' en True/False/None."""
+    opciones = {'si': True, 'no': False, 'auto': None}
+    if valor not in opciones:
+        raise argparse.ArgumentTypeError(f"valor no válido: {valor} (opciones: si, no, auto)")
+    return opciones[valor]
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog='python -m genetico', description=__doc__.splitlines()[1])
+
+    ejecucion = parser.add_argument_group('ejecución')
+    ejecucion.add_argument('--funcion', default='funciones.objetivo:funcion_objetivo',
+                           help="función objetivo como modulo:nombre")
+    ejecucion.add_argument('--semilla', type=int, default=None, help="semilla del generador de NumPy")
+    ejecucion.add_argument('--generaciones', type=int, default=None,
+                           help="generación final de la ejecución (por defecto, --max-generaciones)")
+    ejecucion.add_argument('--salida', default='-', help="fichero de resultados ('-' para la salida estándar)")
+    ejecucion.add_argument('--formato', choices=('json', 'csv'), default=None,
+                           help="formato de salida (por defecto, según la extensión de --salida)")
+    ejecucion.add_argument('--graficar', metavar='RUTA', default=None,
+                           help="guarda la gráfica de evolución en esta imagen (importa matplotlib)")
+    ejecucion.add_argument('--evaluador', choices=('serial', 'hilos', 'procesos'), default='serial')
+    ejecucion.add_argument('--trabajadores', type=int, default=None,
+                           help="hilos o procesos del evaluador (por defecto, uno por CPU)")
+
+    parametros = parser.add_argument_group('parámetros del algoritmo')
+    parametros.add_argument('--rango-min', type=float, default=10.60)
+    parametros.add_argument('--rango-max', type=float, default=18.20)
+    parametros.add_argument('--precision', type=float, default=0.04)
+    parametros.add_argument('--tamano-poblacion', type=int, default=100)
+    parametros.add_argument('--tasa-mutacion-individuo', type=float, default=0.3)
+    parametros.add_argument('--tasa-mutacion-gen', type=float, default=0.1)
+    parametros.add_argument('--max-generaciones', type=int, default=50)
+    parametros.add_argument('--factor-crecimiento', type=float, default=1.5)
+    parametros.add_argument('--n-elites', type=int, default=1)
+    parametros.add_argument('--evaluacion-vectorizada', type=_booleano_opcional, default=None,
+                            metavar='{si,no,auto}')
+    parametros.add_argument('--umbral-tabla-fitness', type=int, default=2 ** 16)
+    parametros.add_argument('--tamano-cache-fitness', type=int, default=2 ** 16)
+    parametros.add_argument('--empaquetado', action='store_true')
+    parametros.add_argument('--mutacion-mismo-sorteo', action='store_true',
+                            help="con --empaquetado, muta con los mismos sorteos que sin empaquetar")
+    parametros.add_argument('--registrar-diversidad', action='store_true')
+    parametros.add_argument('--instrumentar', action='store_true')
+    parametros.add_argument('--memoria-compartida', action='store_true')
+    parametros.add_argument('--politica-historial', choices=POLITICAS, default='completo')
+    parametros.add_argument('--retencion-historial', type=int, default=None)
+
+    parada = parser.add_argument_group('criterios de parada anticipada')
+    parada.add_argument('--fitness-objetivo', type=float, default=None)
+    parada.add_argument('--ventana-estancamiento', type=int, default=None)
+    parada.add_argument('--tolerancia-estancamiento', type=float, default=0.0)
+    parada.add_argument('--tiempo-maximo', type=float, default=None)
+    parada.add_argument('--max-evaluaciones', type=int, default=None)
+    parada.add_argument('--parar-al-converger', action='store_true')
+
+    checkpoints = parser.add_argument_group('checkpoints')
+    checkpoints.add_argument('--checkpoint', metavar='RUTA', default=None, help="guarda checkpoints periódicos")
+    checkpoints.add_argument('--checkpoint-cada-generaciones', type=int, default=None)
+    checkpoints.add_argument('--checkpoint-cada-segundos', type=float, default=None)
+    checkpoints.add_argument('--reanudar', metavar='RUTA', default=None,
+                             help="continúa desde un checkpoint (ignora los parámetros del algoritmo)")
+
+    return parser
+
+
+def _parametros_algoritmo(argumentos: argparse.Namespace) -> dict:
+    """Extrae los parámetros del constructor de AlgoritmoGenetico."""
+    nombres = (
+        'rango_min', 'rango_max', 'precision', 'tamano_poblacion', 'tasa_mutacion_individuo',
+        'tasa_mutacion_gen', 'max_generaciones', 'factor_crecimiento', 'n_elites',
+        'evaluacion_vectorizada', 'umbral_tabla_fitness', 'tamano_cache_fitness', 'empaquetado',
+        'mutacion_mismo_sorteo', 'registrar_diversidad', 'instrumentar', 'memoria_compartida',
+        'politica_historial', 'retencion_historial'
+    )
+    return {nombre: getattr(argumentos, nombre) for nombre in nombres}
+
+
+def _crear_evaluador(argumentos: argparse.Namespace):
+    """Crea el evaluador pedido (None para el serial por defecto)."""
+    if argumentos.evaluador == 'serial':
+        return None
+
+    from genetico.evaluacion import EvaluadorHilos, EvaluadorProcesos
+    clase = EvaluadorHilos if argumentos.evaluador == 'hilos' else EvaluadorProcesos
+    return clase(n_trabajadores=argumentos.trabajadores)
+
+
+def _a_json(valor):
+    """Convierte los tipos de NumPy en tipos nativos para json.dump."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def _graficar(ruta: str, estadisticas: dict) -> None:
+    """Guarda la gráfica de evolución (matplotlib se importa solo aquí)."""
+    from visualizacion.graficador import graficar_evolucion
+
+    figura = graficar_evolucion(
+        estadisticas['mejor_fitness_historico'],
+        estadisticas['fitness_promedio_historico'],
+        generaciones=estadisticas['generaciones_historico']
+    )
+    figura.savefig(ruta)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, los de sys.argv)
+
+    Returns:
+        Código de salida
+    """
+    parser = crear_parser()
+    argumentos = parser.parse_args(argv)
+
+    try:
+        funcion_objetivo = cargar_funcion(argumentos.funcion)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(f"no se pudo cargar la función objetivo: {e}")
+    evaluador = _crear_evaluador(argumentos)
+    parametros = _parametros_algoritmo(argumentos)
+
+    if argumentos.semilla is not None:
+        np.random.seed(argumentos.semilla)
+
+    inicio = time.perf_counter()
+    try:
+        if argumentos.reanudar is not None:
+            # El checkpoint restaura también el estado del generador aleatorio
+            algoritmo = AlgoritmoGenetico.desde_checkpoint(argumentos.reanudar, funcion_objetivo, evaluador=evaluador)
+            parametros = dict(algoritmo.parametros)
+        else:
+            algoritmo = AlgoritmoGenetico(funcion_objetivo, evaluador=evaluador, **parametros)
+
+        generaciones = argumentos.generaciones
+        if generaciones is None:
+            generaciones = algoritmo.max_generaciones
+
+        algoritmo.evolucionar(
+            max(0, generaciones - algoritmo.generacion_actual),
+            fitness_objetivo=argumentos.fitness_objetivo,
+            ventana_estancamiento=argumentos.ventana_estancamiento,
+            tolerancia_estancamiento=argumentos.tolerancia_estancamiento,
+            tiempo_maximo=argumentos.tiempo_maximo,
+            max_evaluaciones=argumentos.max_evaluaciones,
+            parar_al_converger=argumentos.parar_al_converger,
+            ruta_checkpoint=argumentos.checkpoint,
+            checkpoint_cada_generaciones=argumentos.checkpoint_cada_generaciones,
+            checkpoint_cada_segundos=argumentos.checkpoint_cada_segundos
+        )
+        tiempo = time.perf_counter() - inicio
+        estadisticas = algoritmo.obtener_estadisticas()
+        algoritmo.cerrar()
+    finally:
+        if evaluador is not None:
+            evaluador.cerrar()
+
+    resumen = {
+        **parametros,
+        'semilla': argumentos.semilla,
+        'mejor_fitness': estadisticas['mejor_fitness'],
+        'mejor_valor_real': estadisticas['mejor_valor_real'],
+        'generaciones': estadisticas['generacion_actual'],
+        'evaluaciones': estadisticas['evaluaciones'],
+        'criterio_parada': algoritmo.criterio_parada,
+        'tiempo': tiempo
+    }
+
+    formato = argumentos.formato
+    if formato is None:
+        formato = 'csv' if argumentos.salida.lower().endswith('.csv') else 'json'
+
+    salida = sys.stdout if argumentos.salida == '-' else open(argumentos.salida, 'w', newline='')
+    try:
+        if formato == 'csv':
+            escritor = csv.DictWriter(salida, fieldnames=list(parametros) + list(COLUMNAS_RESULTADO))
+            escritor.writeheader()
+            escritor.writerow(json.loads(json.dumps(resumen, default=_a_json)))
+        else:
+            json.dump({
+                **resumen,
+                'mejor_solucion_binaria': estadisticas['mejor_solucion_binaria'],
+                'aciertos_cache': estadisticas['aciertos_cache'],
+                'fallos_cache': estadisticas['fallos_cache'],
+                'convergencia': estadisticas['convergencia'],
+                'instrumentacion': estadisticas['instrumentacion'],
+                'historial': {
+                    'generaciones': estadisticas['generaciones_historico'],
+                    'mejor_fitness': estadisticas['mejor_fitness_historico'],
+                    'fitness_promedio': estadisticas['fitness_promedio_historico'],
+                    'mejor_valor_real': estadisticas['mejor_individuo_historico'],
+                    'diversidad': estadisticas['diversidad_historico']
+                }
+            }, salida, default=_a_json, indent=2)
+            salida.write('\n')
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    if argumentos.graficar is not None:
+        _graficar(argumentos.graficar, estadisticas)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,41 @@
-import numpy as np
-from typing import Callable, Tuple, List
 import time
+import numpy as np
+from typing import Callable, Iterator, Tuple, Optional
 
 from genetico.operadores import (
     emparejamiento_aleatorio,
-    cruza_dos_puntos,
-    mutacion_complemento,
+    cruza_dos_puntos_poblacion,
+    mutacion_complemento_inplace,
     poda_aleatoria_conservando_mejor
 )
+from genetico.cache import (
+    CacheFitness,
+    construir_tabla_fitness
+)
+from genetico.checkpoint import guardar_checkpoint, cargar_checkpoint
+from genetico.convergencia import DetectorConvergencia
+from genetico.evaluacion import (
+    EvaluadorSerial,
+    detectar_vectorizacion
+)
+from genetico.empaquetado import (
+    inicializar_poblacion_empaquetada,
+    empaquetar_poblacion,
+    desempaquetar_poblacion,
+    cruza_dos_puntos_empaquetada,
+    mutacion_complemento_empaquetada_inplace,
+    binario_a_decimal_empaquetada,
+    binario_a_real_empaquetada,
+    calcular_diversidad_hamming_empaquetada
+)
+from genetico.historial import HistorialNumerico
+from genetico.instrumentacion import Instrumentacion
 from genetico.utils import (
     contar_bits_valor_real,
-    binario_a_real
+    binario_a_real,
+    binario_a_real_poblacion,
+    binario_a_decimal_poblacion,
+    calcular_diversidad_hamming
 )
 
 
@@ -25,7 +50,20 @@ class AlgoritmoGenetico:
             tasa_mutacion_individuo: float = 0.3,
             tasa_mutacion_gen: float = 0.1,
             max_generaciones: int = 50,
-            factor_crecimiento: float = 1.5
+            factor_crecimiento: float = 1.5,
+            n_elites: int = 1,
+            evaluacion_vectorizada: Optional[bool] = None,
+            umbral_tabla_fitness: int = 2 ** 16,
+            tamano_cache_fitness: int = 2 ** 16,
+            empaquetado: bool = False,
+            mutacion_mismo_sorteo: bool = False,
+            registrar_diversidad: bool = False,
+            instrumentar: bool = False,
+            callback_generacion: Optional[Callable[[dict], None]] = None,
+            evaluador: Optional[EvaluadorSerial] = None,
+            memoria_compartida: bool = False,
+            politica_historial: str = 'completo',
+            retencion_historial: Optional[int] = None
     ):
         """
         Inicializa el algoritmo genético.
@@ -40,7 +78,55 @@ class AlgoritmoGenetico:
             tasa_mutacion_gen: Umbral PMG (porcentaje de mutación del gen)
             max_generaciones: Número máximo de generaciones
             factor_crecimiento: Factor de crecimiento de la población tras cruza
+            n_elites: Número de mejores individuos que la poda conserva siempre
+            evaluacion_vectorizada: Si la función objetivo acepta la población completa
+                en una sola llamada (si es None, se detecta en la primera evaluación)
+            umbral_tabla_fitness: Si 2**bits no supera este valor, se precalcula el fitness
+                de todos los genotipos (0 lo desactiva)
+            tamano_cache_fitness: Capacidad de la caché LRU de fitness usada por encima
+                del umbral (0 la desactiva; desactivar ambas para funciones no deterministas)
+            empaquetado: Si la población se guarda empaquetada a 8 genes por byte (uint8);
+                la mejor solución y los individuos devueltos siguen siendo arrays de bits
+            mutacion_mismo_sorteo: Con empaquetado, si la mutación sortea un real por gen como
+                sin empaquetar (mismos hijos con la misma semilla) en lugar de construir la
+                máscara por bytes, que es más rápida pero solo estadísticamente equivalente
+            registrar_diversidad: Si se guarda la diversidad de Hamming de cada generación
+            instrumentar: Si se miden el tiempo y la memoria de cada etapa de la generación
+            callback_generacion: Función llamada al final de cada generación con su registro
+                de instrumentación (activa la instrumentación)
+            evaluador: Estrategia de evaluación de la función objetivo (por defecto
+                EvaluadorSerial); quien lo crea es responsable de cerrarlo
+            memoria_compartida: Si las arenas de población y fitness se guardan en memoria
+                compartida (multiprocessing.shared_memory); con un EvaluadorMemoriaCompartida
+                los trabajadores decodifican y evalúan sus filas sin copias
+            politica_historial: Retención de los historiales: 'completo', 'ultimos' (los
+                últimos retencion_historial valores) o 'decimado' (uno de cada
+                retencion_historial generaciones, con el mínimo y el máximo de cada bloque)
+            retencion_historial: Parámetro de la política de historial
         """
+        # Parámetros serializables del constructor, guardados en los checkpoints
+        self.parametros = {
+            'rango_min': rango_min,
+            'rango_max': rango_max,
+            'precision': precision,
+            'tamano_poblacion': tamano_poblacion,
+            'tasa_mutacion_individuo': tasa_mutacion_individuo,
+            'tasa_mutacion_gen': tasa_mutacion_gen,
+            'max_generaciones': max_generaciones,
+            'factor_crecimiento': factor_crecimiento,
+            'n_elites': n_elites,
+            'evaluacion_vectorizada': evaluacion_vectorizada,
+            'umbral_tabla_fitness': umbral_tabla_fitness,
+            'tamano_cache_fitness': tamano_cache_fitness,
+            'empaquetado': empaquetado,
+            'mutacion_mismo_sorteo': mutacion_mismo_sorteo,
+            'registrar_diversidad': registrar_diversidad,
+            'instrumentar': instrumentar,
+            'memoria_compartida': memoria_compartida,
+            'politica_historial': politica_historial,
+            'retencion_historial': retencion_historial
+        }
+
         self.funcion_objetivo = funcion_objetivo
         self.rango_min = rango_min
         self.rango_max = rango_max
@@ -50,23 +136,241 @@ class AlgoritmoGenetico:
         self.tasa_mutacion_gen = tasa_mutacion_gen
         self.max_generaciones = max_generaciones
         self.factor_crecimiento = factor_crecimiento
+        self.n_elites = n_elites
+        self.evaluacion_vectorizada = evaluacion_vectorizada
+        self.umbral_tabla_fitness = umbral_tabla_fitness
+        self.tamano_cache_fitness = tamano_cache_fitness
+        self.empaquetado = empaquetado
+        self.mutacion_mismo_sorteo = mutacion_mismo_sorteo
+        self.registrar_diversidad = registrar_diversidad
+        self.callback_generacion = callback_generacion
+        self.evaluador = evaluador if evaluador is not None else EvaluadorSerial()
 
         # Calcular bits necesarios
         self.bits = contar_bits_valor_real(rango_min, rango_max, precision)
 
+        # Tabla de fitness por genotipo (se construye en la primera evaluación)
+        self.usar_tabla_fitness = 0 < 2 ** self.bits <= umbral_tabla_fitness
+        self.tabla_fitness = None
+
+        # Caché de fitness para codificaciones demasiado grandes para la tabla
+        self.cache_fitness = None
+        if not self.usar_tabla_fitness and tamano_cache_fitness > 0:
+            self.cache_fitness = CacheFitness(tamano_cache_fitness)
+
+        # Número de evaluaciones de la función objetivo
+        self.evaluaciones = 0
+
+        # Medición de tiempos por etapa (None si está desactivada)
+        self.instrumentacion = None
+        if instrumentar or callback_generacion is not None:
+            self.instrumentacion = Instrumentacion()
+
         # Crear población inicial
-        self.poblacion = np.random.randint(2, size=(tamano_poblacion, self.bits))
+        if empaquetado:
+            poblacion_inicial = inicializar_poblacion_empaquetada(tamano_poblacion, self.bits)
+        else:
+            poblacion_inicial = np.random.randint(2, size=(tamano_poblacion, self.bits))
+
+        # Arenas de población: los padres ocupan las primeras filas y los hijos de cada
+        # generación se escriben a continuación. La poda copia los supervivientes a la
+        # otra arena y ambas se intercambian, así que las generaciones no reservan memoria
+        # para la población (self.poblacion es una vista que se reutiliza dos generaciones
+        # después: copiarla si hay que conservarla)
+        n_parejas_max = (min(2 * tamano_poblacion, int(tamano_poblacion * 2 * factor_crecimiento)) + 1) // 2
+        filas_arena = tamano_poblacion + 2 * n_parejas_max
+        forma_fila = poblacion_inicial.shape[1:]
+        # Con memoria compartida, las arenas viven en segmentos de multiprocessing.shared_memory
+        self._segmentos_poblacion = None
+        self._segmentos_fitness = None
+        if memoria_compartida:
+            # multiprocessing.shared_memory solo se importa si se usa
+            from genetico.memoria_compartida import ArrayCompartido
+
+            self._segmentos_poblacion = [
+                ArrayCompartido.crear((filas_arena,) + forma_fila, poblacion_inicial.dtype) for _ in range(2)
+            ]
+            self._segmentos_fitness = [ArrayCompartido.crear((filas_arena,), np.float64) for _ in range(2)]
+            self._arenas_poblacion = [segmento.array for segmento in self._segmentos_poblacion]
+            self._arenas_fitness = [segmento.array for segmento in self._segmentos_fitness]
+        else:
+            self._arenas_poblacion = [
+                np.empty((filas_arena,) + forma_fila, dtype=poblacion_inicial.dtype) for _ in range(2)
+            ]
+            self._arenas_fitness = [np.empty(filas_arena) for _ in range(2)]
+        self._buffers_padres = [
+            np.empty((n_parejas_max,) + forma_fila, dtype=poblacion_inicial.dtype) for _ in range(2)
+        ]
+
+        self.poblacion = self._arenas_poblacion[0][:tamano_poblacion]
+        self.poblacion[:] = poblacion_inicial
+
+        # Fitness de la población actual (None mientras no se haya evaluado)
+        self.fitness = None
 
         # Historial para graficar
-        self.mejor_fitness_historico = []
-        self.fitness_promedio_historico = []
-        self.mejor_individuo_historico = []
+        self.mejor_fitness_historico = HistorialNumerico(politica_historial, retencion_historial)
+        self.fitness_promedio_historico = HistorialNumerico(politica_historial, retencion_historial)
+        self.mejor_individuo_historico = HistorialNumerico(politica_historial, retencion_historial)
+        self.diversidad_historico = HistorialNumerico(politica_historial, retencion_historial)
+        self.ultimo_mejor_valor_real = None
+        self.ultima_diversidad = None
         self.generacion_actual = 0
 
+        # Seguimiento incremental de la convergencia
+        self.detector_convergencia = DetectorConvergencia(politica=politica_historial, retencion=retencion_historial)
+
+        # Criterio que detuvo la última llamada a iterar o evolucionar
+        self.criterio_parada = None
+
         # Para almacenar resultados
         self.mejor_solucion = None
         self.mejor_fitness = -np.inf
 
+    def _individuo_binario(self, individuo: np.ndarray) -> np.ndarray:
+        """
+        Devuelve un individuo de la población como array de bits, desempaquetándolo si hace falta.
+
+        Args:
+            individuo: Fila de la población
+
+        Returns:
+            Array con la representación binaria del individuo
+        """
+        if self.empaquetado:
+            return desempaquetar_poblacion(individuo, self.bits)
+        return individuo
+
+    def calcular_diversidad(self) -> float:
+        """
+        Calcula la diversidad de Hamming de la población actual.
+
+        Returns:
+            Distancia de Hamming promedio entre pares de individuos
+        """
+        if self.empaquetado:
+            return calcular_diversidad_hamming_empaquetada(self.poblacion, self.bits)
+        return calcular_diversidad_hamming(self.poblacion)
+
+    def _evaluar_valores(self, valores_reales: np.ndarray) -> np.ndarray:
+        """
+        Evalúa la función objetivo sobre un conjunto de valores reales.
+
+        Args:
+            valores_reales: Array con los valores reales a evaluar
+
+        Returns:
+            Array con los valores de fitness
+        """
+        # Detectar una sola vez si la función objetivo acepta arrays
+        if self.evaluacion_vectorizada is None:
+            self.evaluacion_vectorizada = detectar_vectorizacion(self.funcion_objetivo, valores_reales)
+
+        self.evaluaciones += len(valores_reales)
+        return self.evaluador.evaluar(self.funcion_objetivo, valores_reales, self.evaluacion_vectorizada)
+
+    def _decodificar(self, individuos: np.ndarray) -> np.ndarray:
+        """
+        Convierte de binario a valor real toda una matriz de individuos a la vez.
+
+        Args:
+            individuos: Matriz binaria (n, bits) con los individuos
+
+        Returns:
+            Array con el valor real de cada individuo
+        """
+        decodificar = binario_a_real_empaquetada if self.empaquetado else binario_a_real_poblacion
+        return decodificar(
+            individuos,
+            self.rango_min,
+            self.rango_max,
+            self.bits
+        )
+
+    def _evaluar_individuos_directo(self, individuos: np.ndarray) -> np.ndarray:
+        """
+        Decodifica y evalúa un conjunto de individuos sin pasar por la tabla ni la caché.
+
+        Args:
+            individuos: Matriz binaria (n, bits) con los individuos a evaluar
+
+        Returns:
+            Array con los valores de fitness
+        """
+        return self._evaluar_valores(self._decodificar(individuos))
+
+    def _evaluar_filas_compartidas(self, inicio: int, fin: int) -> np.ndarray:
+        """
+        Evalúa las filas [inicio, fin) de la arena actual en los trabajadores de un
+        EvaluadorMemoriaCompartida, que las leen y escriben su fitness en la arena de
+        fitness sin copias.
+
+        Args:
+            inicio: Primera fila a evaluar
+            fin: Fila siguiente a la última
+
+        Returns:
+            Vista de la arena de fitness con los valores de esas filas
+        """
+        # La detección de vectorización necesita unos pocos valores decodificados
+        if self.evaluacion_vectorizada is None:
+            self.evaluacion_vectorizada = detectar_vectorizacion(
+                self.funcion_objetivo,
+                self._decodificar(self._arenas_poblacion[0][inicio:min(fin, inicio + 4)])
+            )
+
+        self.evaluaciones += fin - inicio
+        self.evaluador.evaluar_filas(
+            self.funcion_objetivo,
+            self._segmentos_poblacion[0].descriptor(),
+            self._segmentos_fitness[0].descriptor(),
+            inicio,
+            fin,
+            (self.rango_min, self.rango_max, self.bits, self.empaquetado),
+            self.evaluacion_vectorizada
+        )
+        return self._arenas_fitness[0][inicio:fin]
+
+    def _evaluar_individuos(self, individuos: np.ndarray, filas: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """
+        Evalúa el fitness de un conjunto de individuos.
+
+        Args:
+            individuos: Matriz binaria (n, bits) con los individuos a evaluar
+            filas: Filas [inicio, fin) que ocupan los individuos en la arena actual, si
+                son filas de la arena (permite evaluarlos en memoria compartida)
+
+        Returns:
+            Array con los valores de fitness
+        """
+        if self.usar_tabla_fitness:
+            # Evaluar todos los genotipos una sola vez y después solo indexar
+            if self.tabla_fitness is None:
+                self.tabla_fitness = construir_tabla_fitness(
+                    self._evaluar_valores,
+                    self.rango_min,
+                    self.rango_max,
+                    self.bits
+                )
+            if self.empaquetado:
+                return self.tabla_fitness[binario_a_decimal_empaquetada(individuos, self.bits)]
+            return self.tabla_fitness[binario_a_decimal_poblacion(individuos)]
+
+        if self.cache_fitness is not None:
+            return self.cache_fitness.evaluar(
+                individuos,
+                self._evaluar_individuos_directo,
+                empaquetados=self.empaquetado
+            )
+
+        if filas is not None and self._segmentos_poblacion is not None:
+            from genetico.memoria_compartida import EvaluadorMemoriaCompartida
+
+            if isinstance(self.evaluador, EvaluadorMemoriaCompartida):
+                return self._evaluar_filas_compartidas(*filas)
+
+        return self._evaluar_individuos_directo(individuos)
+
     def _evaluar_poblacion(self) -> np.ndarray:
         """
         Evalúa el fitness de todos los individuos en la población.
@@ -74,28 +378,80 @@ class AlgoritmoGenetico:
         Returns:
             Array con los valores de fitness
         """
-        fitness = np.zeros(len(self.poblacion))
+        # La población ocupa las primeras filas de la arena actual
+        return self._evaluar_individuos(self.poblacion, filas=(0, len(self.poblacion)))
 
-        for i, individuo in enumerate(self.poblacion):
-            # Convertir de binario a valor real
-            valor_real = binario_a_real(
-                individuo,
-                self.rango_min,
-                self.rango_max,
-                self.bits
-            )
+    def _asegurar_fitness(self) -> np.ndarray:
+        """
+        Devuelve el fitness de la población actual, evaluándola solo si no se conoce.
+
+        Returns:
+            Array con los valores de fitness de la población
+        """
+        if self.fitness is None:
+            self._fijar_fitness(self._evaluar_poblacion())
 
-            # Evaluar la función objetivo
-            fitness[i] = self.funcion_objetivo(valor_real)
+        return self.fitness
 
-        return fitness
+    def _fijar_fitness(self, fitness: np.ndarray) -> None:
+        """
+        Copia el fitness de la población actual en su arena.
 
-    def _cruzar_poblacion(self, parejas: List[Tuple[int, int]]) -> np.ndarray:
+        Args:
+            fitness: Valores de fitness de la población
+        """
+        destino = self._arenas_fitness[0][:len(self.poblacion)]
+        destino[:] = fitness
+        self.fitness = destino
+
+    def obtener_mejores(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtiene los n mejores individuos de la población actual.
+
+        Args:
+            n: Número de individuos
+
+        Returns:
+            Matriz binaria (n, bits) con los individuos y array con su fitness
+        """
+        fitness = self._asegurar_fitness()
+        n = min(n, len(fitness))
+        indices = np.argsort(fitness)[::-1][:n]
+
+        individuos = self.poblacion[indices]
+        if self.empaquetado:
+            individuos = desempaquetar_poblacion(individuos, self.bits)
+
+        return individuos, fitness[indices].copy()
+
+    def recibir_inmigrantes(self, individuos: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Sustituye a los peores individuos de la población por individuos llegados de fuera.
+
+        Args:
+            individuos: Matriz binaria (m, bits) con los inmigrantes
+            fitness: Fitness de los inmigrantes
+        """
+        fitness_actual = self._asegurar_fitness()
+
+        # Conservar siempre al menos al mejor individuo propio
+        n_inmigrantes = min(len(individuos), self.tamano_poblacion - 1)
+        if n_inmigrantes <= 0:
+            return
+
+        indices_peores = np.argpartition(fitness_actual, n_inmigrantes - 1)[:n_inmigrantes]
+
+        if self.empaquetado:
+            individuos = empaquetar_poblacion(individuos)
+        self.poblacion[indices_peores] = individuos[:n_inmigrantes]
+        fitness_actual[indices_peores] = fitness[:n_inmigrantes]
+
+    def _cruzar_poblacion(self, parejas: np.ndarray) -> np.ndarray:
         """
         Aplica cruza entre las parejas seleccionadas.
 
         Args:
-            parejas: Lista de tuplas con los índices de los padres
+            parejas: Array (n, 2) con los índices de los padres
 
         Returns:
             Nueva población tras la cruza
@@ -103,31 +459,27 @@ class AlgoritmoGenetico:
         # Número de parejas
         n_parejas = len(parejas)
 
-        # Crear una nueva población para los hijos
-        tamano_poblacion_hijos = int(n_parejas * 2 * self.factor_crecimiento)
-        poblacion_hijos = np.zeros((tamano_poblacion_hijos, self.bits), dtype=int)
-
-        # Índice actual en la población de hijos
-        idx_hijo = 0
+        # Cada pareja produce dos hijos, limitados por el factor de crecimiento
+        tamano_poblacion_hijos = min(2 * n_parejas, int(n_parejas * 2 * self.factor_crecimiento))
+        parejas = parejas[:(tamano_poblacion_hijos + 1) // 2]
 
-        # Aplicar cruza a cada pareja
-        for idx_padre1, idx_padre2 in parejas:
-            padre1 = self.poblacion[idx_padre1]
-            padre2 = self.poblacion[idx_padre2]
+        # Los hijos se escriben en la arena, justo detrás de los padres
+        n_padres = len(self.poblacion)
+        poblacion_hijos = self._arenas_poblacion[0][n_padres:n_padres + 2 * len(parejas)]
 
-            # Realizar cruza de dos puntos
-            hijo1, hijo2 = cruza_dos_puntos(padre1, padre2)
+        # Reunir a los padres en buffers preasignados (los índices son válidos: mode='clip' evita copias)
+        padres1 = np.take(self.poblacion, parejas[:, 0], axis=0, out=self._buffers_padres[0][:len(parejas)],
+                          mode='clip')
+        padres2 = np.take(self.poblacion, parejas[:, 1], axis=0, out=self._buffers_padres[1][:len(parejas)],
+                          mode='clip')
 
-            # Añadir hijos a la nueva población
-            if idx_hijo < tamano_poblacion_hijos:
-                poblacion_hijos[idx_hijo] = hijo1
-                idx_hijo += 1
+        # Aplicar cruza a todas las parejas a la vez
+        if self.empaquetado:
+            cruza_dos_puntos_empaquetada(padres1, padres2, self.bits, salida=poblacion_hijos)
+        else:
+            cruza_dos_puntos_poblacion(padres1, padres2, salida=poblacion_hijos)
 
-            if idx_hijo < tamano_poblacion_hijos:
-                poblacion_hijos[idx_hijo] = hijo2
-                idx_hijo += 1
-
-        return poblacion_hijos[:idx_hijo]  # Devolver solo los hijos generados
+        return poblacion_hijos[:tamano_poblacion_hijos]  # Devolver solo los hijos generados
 
     def paso_generacion(self) -> Tuple[float, float, np.ndarray]:
         """
@@ -136,12 +488,18 @@ class AlgoritmoGenetico:
         Returns:
             Tupla con mejor fitness, fitness promedio y mejor individuo
         """
-        # Evaluar población actual
-        fitness = self._evaluar_poblacion()
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.iniciar_generacion(self.evaluaciones)
+
+        # Evaluar población actual solo si su fitness no viene de la generación anterior
+        fitness = self._asegurar_fitness()
+        if instrumentacion is not None:
+            instrumentacion.marcar('evaluacion')
 
         # Encontrar el mejor individuo y su fitness
         idx_mejor = np.argmax(fitness)
-        mejor_individuo = self.poblacion[idx_mejor]
+        mejor_individuo = self._individuo_binario(self.poblacion[idx_mejor]).copy()
         mejor_fitness = fitness[idx_mejor]
 
         # Actualizar mejor solución global si corresponde
@@ -151,8 +509,9 @@ class AlgoritmoGenetico:
 
         # Guardar estadísticas
         fitness_promedio = np.mean(fitness)
-        self.mejor_fitness_historico.append(mejor_fitness)
-        self.fitness_promedio_historico.append(fitness_promedio)
+        self.mejor_fitness_historico.agregar(mejor_fitness)
+        self.fitness_promedio_historico.agregar(fitness_promedio)
+        self.detector_convergencia.actualizar(mejor_fitness)
 
         # Valor real del mejor individuo
         mejor_valor_real = binario_a_real(
@@ -161,63 +520,390 @@ class AlgoritmoGenetico:
             self.rango_max,
             self.bits
         )
-        self.mejor_individuo_historico.append(mejor_valor_real)
+        self.mejor_individuo_historico.agregar(mejor_valor_real)
+        self.ultimo_mejor_valor_real = mejor_valor_real
+
+        if self.registrar_diversidad:
+            self.ultima_diversidad = self.calcular_diversidad()
+            self.diversidad_historico.agregar(self.ultima_diversidad)
+
+        if instrumentacion is not None:
+            instrumentacion.marcar('estadisticas')
 
         # Seleccionar parejas para cruza
         parejas = emparejamiento_aleatorio(self.poblacion)
+        if instrumentacion is not None:
+            instrumentacion.marcar('emparejamiento')
 
         # Crear nueva población por cruza
         poblacion_hijos = self._cruzar_poblacion(parejas)
-
-        # Aplicar mutación
-        poblacion_hijos = mutacion_complemento(
-            poblacion_hijos,
-            self.tasa_mutacion_individuo,
-            self.tasa_mutacion_gen
-        )
-
-        # Evaluar fitness de los hijos
-        fitness_hijos = np.zeros(len(poblacion_hijos))
-        for i, individuo in enumerate(poblacion_hijos):
-            valor_real = binario_a_real(
-                individuo,
-                self.rango_min,
-                self.rango_max,
-                self.bits
+        if instrumentacion is not None:
+            instrumentacion.marcar('cruza')
+
+        # Aplicar mutación sobre los hijos recién creados, sin copiarlos
+        if self.empaquetado:
+            poblacion_hijos = mutacion_complemento_empaquetada_inplace(
+                poblacion_hijos,
+                self.bits,
+                self.tasa_mutacion_individuo,
+                self.tasa_mutacion_gen,
+                mismo_sorteo=self.mutacion_mismo_sorteo
             )
-            fitness_hijos[i] = self.funcion_objetivo(valor_real)
-
-        # Combinar poblaciones (padres + hijos)
-        poblacion_combinada = np.vstack([self.poblacion, poblacion_hijos])
-        fitness_combinado = np.concatenate([fitness, fitness_hijos])
-
-        # Aplicar poda para volver al tamaño original
-        self.poblacion, _ = poda_aleatoria_conservando_mejor(
+        else:
+            poblacion_hijos = mutacion_complemento_inplace(
+                poblacion_hijos,
+                self.tasa_mutacion_individuo,
+                self.tasa_mutacion_gen
+            )
+        if instrumentacion is not None:
+            instrumentacion.marcar('mutacion')
+
+        # Evaluar fitness de los hijos (ocupan la arena justo detrás de los padres)
+        n_padres = len(self.poblacion)
+        n_combinada = n_padres + len(poblacion_hijos)
+        fitness_hijos = self._evaluar_individuos(poblacion_hijos, filas=(n_padres, n_combinada))
+        if instrumentacion is not None:
+            instrumentacion.marcar('evaluacion_hijos')
+
+        # Combinar poblaciones (padres + hijos): los hijos ya están detrás de los padres en la arena
+        arena, arena_fitness = self._arenas_poblacion[0], self._arenas_fitness[0]
+        arena_fitness[n_padres:n_combinada] = fitness_hijos
+        poblacion_combinada = arena[:n_combinada]
+        fitness_combinado = arena_fitness[:n_combinada]
+        if instrumentacion is not None:
+            instrumentacion.marcar('combinacion')
+
+        # Aplicar poda para volver al tamaño original, escribiendo los supervivientes en la
+        # otra arena (que pasa a ser la actual)
+        salida = self._arenas_poblacion[1]
+        salida_fitness = self._arenas_fitness[1]
+        self._intercambiar_arenas()
+
+        self.poblacion, self.fitness = poda_aleatoria_conservando_mejor(
             poblacion_combinada,
             fitness_combinado,
-            self.tamano_poblacion
+            self.tamano_poblacion,
+            n_elites=self.n_elites,
+            salida=salida,
+            salida_fitness=salida_fitness
         )
 
         # Incrementar contador de generación
         self.generacion_actual += 1
 
+        if instrumentacion is not None:
+            instrumentacion.marcar('poda')
+            registro = instrumentacion.terminar_generacion(self.generacion_actual, self.evaluaciones)
+            if self.callback_generacion is not None:
+                self.callback_generacion(registro)
+
         return mejor_fitness, fitness_promedio, mejor_individuo
 
-    def evolucionar(self, pasos: int = None) -> Tuple[np.ndarray, float, float]:
+    def _intercambiar_arenas(self) -> None:
+        """Convierte la otra arena en la actual (junto con sus segmentos compartidos)."""
+        for arenas in (self._arenas_poblacion, self._arenas_fitness, self._segmentos_poblacion,
+                       self._segmentos_fitness):
+            if arenas is not None:
+                arenas.reverse()
+
+    def descriptores_memoria_compartida(self) -> dict:
         """
-        Ejecuta el algoritmo genético durante un número de generaciones.
+        Obtiene los descriptores con los que otros procesos pueden adjuntarse a la población.
+
+        La población ocupa las primeras n_individuos filas de la arena actual. Las arenas
+        se alternan en cada generación, así que los descriptores solo valen hasta la
+        siguiente llamada a paso_generacion.
+
+        Returns:
+            Diccionario con los descriptores de 'poblacion' y 'fitness' y 'n_individuos'
+            (vacío si no se usa memoria compartida)
+        """
+        if self._segmentos_poblacion is None:
+            return {}
+
+        return {
+            'poblacion': self._segmentos_poblacion[0].descriptor(),
+            'fitness': self._segmentos_fitness[0].descriptor(),
+            'n_individuos': len(self.poblacion)
+        }
+
+    def cerrar(self) -> None:
+        """
+        Libera los segmentos de memoria compartida, pasando la población a arenas locales.
+
+        El evaluador no se cierra: pertenece a quien lo creó.
+        """
+        if self._segmentos_poblacion is None:
+            return
+
+        # Solo la arena actual tiene datos; la otra es espacio de trabajo
+        n = len(self.poblacion)
+        self._arenas_poblacion = [self._arenas_poblacion[0].copy(), np.empty_like(self._arenas_poblacion[1])]
+        self._arenas_fitness = [self._arenas_fitness[0].copy(), np.empty_like(self._arenas_fitness[1])]
+        self.poblacion = self._arenas_poblacion[0][:n]
+        if self.fitness is not None:
+            self.fitness = self._arenas_fitness[0][:n]
+
+        for segmento in self._segmentos_poblacion + self._segmentos_fitness:
+            segmento.cerrar()
+        self._segmentos_poblacion = None
+        self._segmentos_fitness = None
+
+    def obtener_estado(self) -> dict:
+        """
+        Obtiene todo el estado necesario para continuar la evolución más adelante.
+
+        Incluye el estado del generador global de NumPy, de modo que una ejecución
+        restaurada continúa exactamente igual que la original. No incluye la función
+        objetivo, el evaluador ni el callback, que no son serializables.
+
+        Returns:
+            Diccionario con valores serializables en JSON y arrays de NumPy
+        """
+        algoritmo_rng, claves_rng, posicion_rng, tiene_gauss, gauss = np.random.get_state()
+
+        estado = {
+            'parametros': self.parametros,
+            'evaluacion_vectorizada': self.evaluacion_vectorizada,
+            'rng': {
+                'algoritmo': algoritmo_rng,
+                'claves': claves_rng,
+                'posicion': posicion_rng,
+                'tiene_gauss': tiene_gauss,
+                'gauss': gauss
+            },
+            'poblacion': self.poblacion,
+            'generacion_actual': self.generacion_actual,
+            'evaluaciones': self.evaluaciones,
+            'mejor_fitness': self.mejor_fitness,
+            'ultimo_mejor_valor_real': self.ultimo_mejor_valor_real,
+            'ultima_diversidad': self.ultima_diversidad,
+            'historiales': {
+                'mejor_fitness': self.mejor_fitness_historico.obtener_estado(),
+                'fitness_promedio': self.fitness_promedio_historico.obtener_estado(),
+                'mejor_individuo': self.mejor_individuo_historico.obtener_estado(),
+                'diversidad': self.diversidad_historico.obtener_estado()
+            },
+            'convergencia': self.detector_convergencia.obtener_estado()
+        }
+
+        # Opcionales: se omiten si todavía no existen
+        if self.fitness is not None:
+            estado['fitness'] = self.fitness
+        if self.mejor_solucion is not None:
+            estado['mejor_solucion'] = self.mejor_solucion
+        if self.tabla_fitness is not None:
+            estado['tabla_fitness'] = self.tabla_fitness
+        if self.cache_fitness is not None:
+            estado['cache_fitness'] = self.cache_fitness.obtener_estado()
+
+        return estado
+
+    def restaurar_estado(self, estado: dict) -> None:
+        """
+        Devuelve el algoritmo (y el generador global de NumPy) al punto guardado con
+        obtener_estado(). Los arrays se copian, así que el estado puede venir de un
+        checkpoint proyectado en memoria.
 
         Args:
-            pasos: Número de pasos de evolución (si es None, usa max_generaciones)
+            estado: Estado guardado con los mismos parámetros de construcción
+        """
+        self.evaluacion_vectorizada = estado['evaluacion_vectorizada']
+
+        rng = estado['rng']
+        np.random.set_state((
+            rng['algoritmo'],
+            np.array(rng['claves'], dtype=np.uint32),
+            rng['posicion'],
+            rng['tiene_gauss'],
+            rng['gauss']
+        ))
+
+        self.poblacion[:] = estado['poblacion']
+
+        self.fitness = None
+        if 'fitness' in estado:
+            self._fijar_fitness(estado['fitness'])
+
+        self.mejor_solucion = np.array(estado['mejor_solucion']) if 'mejor_solucion' in estado else None
+        self.mejor_fitness = np.float64(estado['mejor_fitness'])
+        self.generacion_actual = estado['generacion_actual']
+        self.evaluaciones = estado['evaluaciones']
+        self.ultimo_mejor_valor_real = estado['ultimo_mejor_valor_real']
+        self.ultima_diversidad = estado['ultima_diversidad']
+
+        historiales = estado['historiales']
+        self.mejor_fitness_historico.restaurar_estado(historiales['mejor_fitness'])
+        self.fitness_promedio_historico.restaurar_estado(historiales['fitness_promedio'])
+        self.mejor_individuo_historico.restaurar_estado(historiales['mejor_individuo'])
+        self.diversidad_historico.restaurar_estado(historiales['diversidad'])
+        self.detector_convergencia.restaurar_estado(estado['convergencia'])
+
+        self.tabla_fitness = np.array(estado['tabla_fitness']) if 'tabla_fitness' in estado else None
+        if self.cache_fitness is not None and 'cache_fitness' in estado:
+            self.cache_fitness.restaurar_estado(estado['cache_fitness'])
+
+    def guardar_checkpoint(self, ruta: str) -> None:
+        """
+        Guarda el estado actual en un checkpoint (escritura atómica).
+
+        Args:
+            ruta: Ruta del archivo de checkpoint
+        """
+        guardar_checkpoint(ruta, self.obtener_estado())
+
+    @classmethod
+    def desde_checkpoint(
+            cls,
+            ruta: str,
+            funcion_objetivo: Callable[[float], float],
+            callback_generacion: Optional[Callable[[dict], None]] = None,
+            evaluador: Optional[EvaluadorSerial] = None
+    ) -> 'AlgoritmoGenetico':
+        """
+        Reconstruye un algoritmo a partir de un checkpoint para continuar su evolución.
+
+        Continuar con iterar o evolucionar produce exactamente los mismos resultados que
+        la ejecución original sin interrumpir, siempre que se use la misma función objetivo.
+
+        Args:
+            ruta: Ruta del archivo de checkpoint
+            funcion_objetivo: Función a maximizar (la misma de la ejecución original)
+            callback_generacion: Función llamada al final de cada generación
+            evaluador: Estrategia de evaluación de la función objetivo
 
         Returns:
-            Mejor individuo encontrado, su valor de fitness y su valor real
+            Algoritmo en el punto guardado
+        """
+        estado = cargar_checkpoint(ruta)
+        algoritmo = cls(
+            funcion_objetivo,
+            callback_generacion=callback_generacion,
+            evaluador=evaluador,
+            **estado['parametros']
+        )
+        algoritmo.restaurar_estado(estado)
+        return algoritmo
+
+    def iterar(
+            self,
+            pasos: int = None,
+            fitness_objetivo: Optional[float] = None,
+            ventana_estancamiento: Optional[int] = None,
+            tolerancia_estancamiento: float = 0.0,
+            tiempo_maximo: Optional[float] = None,
+            max_evaluaciones: Optional[int] = None,
+            parar_al_converger: bool = False,
+            ruta_checkpoint: Optional[str] = None,
+            checkpoint_cada_generaciones: Optional[int] = None,
+            checkpoint_cada_segundos: Optional[float] = None
+    ) -> Iterator[dict]:
+        """
+        Ejecuta el algoritmo generación a generación, devolviendo un registro por cada una.
+
+        La evolución se detiene al agotar los pasos o al cumplirse el primer criterio de
+        parada; el criterio que la detuvo queda en self.criterio_parada.
+
+        Args:
+            pasos: Número máximo de generaciones (si es None, usa max_generaciones)
+            fitness_objetivo: Parar cuando el mejor fitness global lo alcance
+            ventana_estancamiento: Parar si el mejor fitness global no mejora más de
+                tolerancia_estancamiento durante este número de generaciones
+            tolerancia_estancamiento: Mejora mínima que cuenta como progreso
+            tiempo_maximo: Parar al superar este tiempo de ejecución en segundos
+            max_evaluaciones: Parar al alcanzar este número de evaluaciones de la función
+                (se comprueba al terminar cada generación, así que puede superarse en lo que
+                evalúe una generación: sus hijos, como mucho 2 * tamano_poblacion, más la
+                población inicial en la primera, o 2**bits si es la que construye la tabla)
+            parar_al_converger: Parar en cuanto el detector de convergencia la detecte
+            ruta_checkpoint: Si se indica, guarda checkpoints periódicos en esta ruta
+                (sobrescribiendo el anterior); se reanudan con desde_checkpoint
+            checkpoint_cada_generaciones: Generaciones entre checkpoints
+            checkpoint_cada_segundos: Segundos mínimos entre checkpoints (si no se indica
+                ningún intervalo, se guarda uno en cada generación)
+
+        Yields:
+            Diccionario con generacion, mejor_fitness, fitness_promedio, mejor_valor_real,
+            mejor_fitness_global, diversidad, evaluaciones, tiempos y tiempo_transcurrido
         """
         if pasos is None:
             pasos = self.max_generaciones
 
+        self.criterio_parada = None
+        inicio = time.perf_counter()
+        referencia_estancamiento = self.mejor_fitness
+        generaciones_sin_mejora = 0
+        ultimo_checkpoint = inicio
+        if checkpoint_cada_generaciones is None and checkpoint_cada_segundos is None:
+            checkpoint_cada_generaciones = 1
+
         for _ in range(pasos):
-            self.paso_generacion()
+            mejor_fitness, fitness_promedio, _ = self.paso_generacion()
+            tiempo_transcurrido = time.perf_counter() - inicio
+
+            # Guardar el checkpoint antes de ceder el control, por si no se vuelve
+            if ruta_checkpoint is not None:
+                ahora = time.perf_counter()
+                por_generaciones = (checkpoint_cada_generaciones is not None
+                                    and self.generacion_actual % checkpoint_cada_generaciones == 0)
+                por_tiempo = (checkpoint_cada_segundos is not None
+                              and ahora - ultimo_checkpoint >= checkpoint_cada_segundos)
+                if por_generaciones or por_tiempo:
+                    self.guardar_checkpoint(ruta_checkpoint)
+                    ultimo_checkpoint = ahora
+
+            tiempos = None
+            if self.instrumentacion is not None:
+                tiempos = self.instrumentacion.ultima_generacion['tiempos']
+
+            yield {
+                'generacion': self.generacion_actual,
+                'mejor_fitness': mejor_fitness,
+                'fitness_promedio': fitness_promedio,
+                'mejor_valor_real': self.ultimo_mejor_valor_real,
+                'mejor_fitness_global': self.mejor_fitness,
+                'diversidad': self.ultima_diversidad,
+                'evaluaciones': self.evaluaciones,
+                'tiempos': tiempos,
+                'tiempo_transcurrido': tiempo_transcurrido
+            }
+
+            # Comprobar los criterios de parada
+            if self.mejor_fitness > referencia_estancamiento + tolerancia_estancamiento:
+                referencia_estancamiento = self.mejor_fitness
+                generaciones_sin_mejora = 0
+            else:
+                generaciones_sin_mejora += 1
+
+            if fitness_objetivo is not None and self.mejor_fitness >= fitness_objetivo:
+                self.criterio_parada = 'fitness_objetivo'
+            elif ventana_estancamiento is not None and generaciones_sin_mejora >= ventana_estancamiento:
+                self.criterio_parada = 'estancamiento'
+            elif tiempo_maximo is not None and tiempo_transcurrido >= tiempo_maximo:
+                self.criterio_parada = 'tiempo'
+            elif max_evaluaciones is not None and self.evaluaciones >= max_evaluaciones:
+                self.criterio_parada = 'evaluaciones'
+            elif parar_al_converger and self.detector_convergencia.convergido:
+                self.criterio_parada = 'convergencia'
+
+            if self.criterio_parada is not None:
+                return
+
+        self.criterio_parada = 'generaciones'
+
+    def evolucionar(self, pasos: int = None, **criterios_parada) -> Tuple[np.ndarray, float, float]:
+        """
+        Ejecuta el algoritmo genético durante un número de generaciones.
+
+        Args:
+            pasos: Número de pasos de evolución (si es None, usa max_generaciones)
+            **criterios_parada: Criterios de parada anticipada (ver iterar)
+
+        Returns:
+            Mejor individuo encontrado, su valor de fitness y su valor real
+        """
+        for _ in self.iterar(pasos, **criterios_parada):
+            pass
 
         # Convertir la mejor solución a valor real
         mejor_valor_real = binario_a_real(
@@ -233,6 +919,9 @@ class AlgoritmoGenetico:
         """
         Obtiene estadísticas del proceso evolutivo.
 
+        Los historiales se devuelven como vistas de los arrays internos, sin copiarlos
+        (salvo con la política 'ultimos', en la que se copia la ventana conservada).
+
         Returns:
             Diccionario con estadísticas
         """
@@ -246,11 +935,18 @@ class AlgoritmoGenetico:
             )
 
         return {
-            'mejor_fitness_historico': self.mejor_fitness_historico,
-            'fitness_promedio_historico': self.fitness_promedio_historico,
-            'mejor_individuo_historico': self.mejor_individuo_historico,
+            'mejor_fitness_historico': self.mejor_fitness_historico.valores(),
+            'fitness_promedio_historico': self.fitness_promedio_historico.valores(),
+            'mejor_individuo_historico': self.mejor_individuo_historico.valores(),
+            'diversidad_historico': self.diversidad_historico.valores(),
+            'generaciones_historico': self.mejor_fitness_historico.generaciones(),
             'generacion_actual': self.generacion_actual,
             'mejor_solucion_binaria': self.mejor_solucion,
             'mejor_fitness': self.mejor_fitness,
-            'mejor_valor_real': mejor_valor_real
+            'mejor_valor_real': mejor_valor_real,
+            'aciertos_cache': self.cache_fitness.aciertos if self.cache_fitness is not None else 0,
+            'fallos_cache': self.cache_fitness.fallos if self.cache_fitness is not None else 0,
+            'evaluaciones': self.evaluaciones,
+            'convergencia': self.detector_convergencia.estadisticas(),
+            'instrumentacion': self.instrumentacion.resumen() if self.instrumentacion is not None else None
         }
\ No newline at end of file
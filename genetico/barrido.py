@@ -0,0 +1,253 @@
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from genetico.algoritmo import AlgoritmoGenetico
+
+# Columnas de resultados que se añaden a los parámetros de cada ejecución
+COLUMNAS_RESULTADO = (
+    'mejor_fitness',
+    'mejor_valor_real',
+    'generaciones',
+    'evaluaciones',
+    'tiempo'
+)
+
+
+def generar_configuraciones(
+        espacio: Dict[str, Union[Sequence, Tuple[float, float]]],
+        modo: str = 'rejilla',
+        n_muestras: int = 10,
+        semilla: Optional[int] = None
+) -> List[dict]:
+    """
+    Genera las configuraciones de parámetros de AlgoritmoGenetico a explorar.
+
+    Args:
+        espacio: Diccionario parámetro -> valores. En modo 'rejilla' cada entrada es una
+            lista de valores; en modo 'aleatorio' puede ser una lista (se elige uno) o una
+            tupla (mínimo, máximo) de la que se muestrea uniformemente (entera si ambos
+            extremos son enteros)
+        modo: 'rejilla' (producto cartesiano) o 'aleatorio'
+        n_muestras: Número de configuraciones en modo 'aleatorio'
+        semilla: Semilla del muestreo en modo 'aleatorio'
+
+    Returns:
+        Lista de diccionarios de parámetros, en un orden reproducible
+    """
+    nombres = list(espacio)
+
+    if modo == 'rejilla':
+        return [dict(zip(nombres, valores)) for valores in itertools.product(*(espacio[n] for n in nombres))]
+
+    if modo != 'aleatorio':
+        raise ValueError(f"Modo de barrido desconocido: {modo}")
+
+    generador = np.random.default_rng(semilla)
+    configuraciones = []
+    for _ in range(n_muestras):
+        configuracion = {}
+        for nombre in nombres:
+            valores = espacio[nombre]
+            if isinstance(valores, tuple) and len(valores) == 2:
+                minimo, maximo = valores
+                if isinstance(minimo, int) and isinstance(maximo, int):
+                    configuracion[nombre] = int(generador.integers(minimo, maximo + 1))
+                else:
+                    configuracion[nombre] = float(generador.uniform(minimo, maximo))
+            else:
+                configuracion[nombre] = valores[int(generador.integers(len(valores)))]
+        configuraciones.append(configuracion)
+
+    return configuraciones
+
+
+def _ejecutar_configuracion(
+        funcion_objetivo: Callable,
+        parametros: dict,
+        secuencia: np.random.SeedSequence,
+        generaciones: Optional[int]
+) -> dict:
+    """
+    Ejecuta una configuración con una semilla dentro de un trabajador.
+
+    Returns:
+        Diccionario con los resultados de la ejecución
+    """
+    # El algoritmo usa el generador global de NumPy: sembrarlo con la secuencia derivada
+    np.random.seed(secuencia.generate_state(4))
+
+    inicio = time.perf_counter()
+    algoritmo = AlgoritmoGenetico(funcion_objetivo, **parametros)
+    _, mejor_fitness, mejor_valor_real = algoritmo.evolucionar(generaciones)
+
+    return {
+        'mejor_fitness': float(mejor_fitness),
+        'mejor_valor_real': float(mejor_valor_real),
+        'generaciones': algoritmo.generacion_actual,
+        'evaluaciones': algoritmo.evaluaciones,
+        'tiempo': time.perf_counter() - inicio
+    }
+
+
+def calcular_huella(
+        funcion_objetivo: Callable,
+        parametros: dict,
+        generaciones: Optional[int],
+        semilla: int,
+        id_configuracion: int,
+        indice_semilla: int
+) -> str:
+    """
+    Identifica una ejecución por todo lo que determina su resultado.
+
+    Args:
+        funcion_objetivo: Función a maximizar (se identifica por su nombre completo)
+        parametros: Parámetros completos de AlgoritmoGenetico (fijos y de la configuración)
+        generaciones: Generaciones por ejecución
+        semilla: Semilla raíz del barrido
+        id_configuracion: Posición de la configuración (determina su secuencia de semillas)
+        indice_semilla: Índice de la semilla dentro de la configuración
+
+    Returns:
+        Huella hexadecimal de la ejecución
+    """
+    descripcion = json.dumps({
+        'funcion': f"{funcion_objetivo.__module__}.{funcion_objetivo.__qualname__}",
+        'parametros': parametros,
+        'generaciones': generaciones,
+        'semilla': semilla,
+        'id_configuracion': id_configuracion,
+        'indice_semilla': indice_semilla
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(descripcion.encode('utf-8')).hexdigest()[:16]
+
+
+def leer_completadas(ruta_salida: str, columnas: Optional[List[str]] = None) -> Set[str]:
+    """
+    Lee qué ejecuciones ya están en un fichero de resultados.
+
+    Args:
+        ruta_salida: Ruta del CSV de resultados
+        columnas: Columnas que debe tener el fichero (si se indican y no coinciden con
+            su cabecera, se lanza ValueError)
+
+    Returns:
+        Conjunto de huellas (ver calcular_huella) de las ejecuciones completadas
+    """
+    if not os.path.exists(ruta_salida) or os.path.getsize(ruta_salida) == 0:
+        return set()
+
+    with open(ruta_salida, newline='') as fichero:
+        lector = csv.DictReader(fichero)
+        if columnas is not None and lector.fieldnames != list(columnas):
+            raise ValueError(
+                f"La cabecera de {ruta_salida} no coincide con la de este barrido "
+                f"({lector.fieldnames} frente a {list(columnas)}); usar otro fichero de resultados"
+            )
+        return {fila['huella'] for fila in lector if fila.get('mejor_fitness') and fila.get('huella')}
+
+
+def ejecutar_barrido(
+        funcion_objetivo: Callable[[float], float],
+        espacio: Dict[str, Union[Sequence, Tuple[float, float]]],
+        ruta_salida: str,
+        modo: str = 'rejilla',
+        n_muestras: int = 10,
+        n_semillas: int = 5,
+        semilla: int = 0,
+        generaciones: Optional[int] = None,
+        n_trabajadores: Optional[int] = None,
+        parametros_fijos: Optional[dict] = None
+) -> List[dict]:
+    """
+    Ejecuta un barrido de hiperparámetros de AlgoritmoGenetico en un pool de procesos.
+
+    Cada configuración se ejecuta con n_semillas semillas derivadas con
+    SeedSequence.spawn, de modo que cada ejecución es reproducible. Cada resultado se
+    añade al CSV en cuanto termina, junto con todos sus parámetros (fijos y de la
+    configuración), las generaciones pedidas y una huella de la ejecución. Si el fichero
+    ya existe, se omiten las ejecuciones cuya huella contiene, lo que permite reanudar
+    un barrido interrumpido; si su cabecera no coincide con la de este barrido (otro
+    espacio o parámetros fijos), se lanza ValueError en lugar de mezclar resultados.
+
+    Args:
+        funcion_objetivo: Función a maximizar (debe poder serializarse con pickle)
+        espacio: Espacio de búsqueda (ver generar_configuraciones)
+        ruta_salida: Ruta del CSV de resultados
+        modo: 'rejilla' o 'aleatorio'
+        n_muestras: Número de configuraciones en modo 'aleatorio'
+        n_semillas: Número de semillas por configuración
+        semilla: Semilla raíz del barrido
+        generaciones: Generaciones por ejecución (si es None, usa max_generaciones)
+        n_trabajadores: Número de procesos (si es None, uno por CPU)
+        parametros_fijos: Parámetros comunes a todas las configuraciones
+
+    Returns:
+        Filas de resultados calculadas en esta llamada
+    """
+    parametros_fijos = parametros_fijos or {}
+    configuraciones = generar_configuraciones(espacio, modo, n_muestras, semilla)
+
+    # Columnas: identificación, todos los parámetros (sin repetir los del espacio) y resultados
+    nombres_parametros = [nombre for nombre in parametros_fijos if nombre not in espacio] + list(espacio)
+    columnas = (['id_configuracion', 'indice_semilla', 'huella'] + nombres_parametros
+                + ['generaciones_pedidas'] + list(COLUMNAS_RESULTADO))
+    completadas = leer_completadas(ruta_salida, columnas)
+
+    # Una secuencia por configuración y, dentro de ella, una por semilla
+    secuencias = [
+        secuencia_configuracion.spawn(n_semillas)
+        for secuencia_configuracion in np.random.SeedSequence(semilla).spawn(len(configuraciones))
+    ]
+
+    escribir_cabecera = not os.path.exists(ruta_salida) or os.path.getsize(ruta_salida) == 0
+    filas = []
+
+    with open(ruta_salida, 'a', newline='') as fichero, \
+            ProcessPoolExecutor(max_workers=n_trabajadores) as ejecutor:
+        escritor = csv.DictWriter(fichero, fieldnames=columnas)
+        if escribir_cabecera:
+            escritor.writeheader()
+            fichero.flush()
+
+        futuros = {}
+        for id_configuracion, configuracion in enumerate(configuraciones):
+            parametros = {**parametros_fijos, **configuracion}
+            for indice_semilla in range(n_semillas):
+                huella = calcular_huella(
+                    funcion_objetivo, parametros, generaciones, semilla, id_configuracion, indice_semilla
+                )
+                if huella in completadas:
+                    continue
+
+                futuro = ejecutor.submit(
+                    _ejecutar_configuracion,
+                    funcion_objetivo,
+                    parametros,
+                    secuencias[id_configuracion][indice_semilla],
+                    generaciones
+                )
+                futuros[futuro] = (id_configuracion, indice_semilla, huella, parametros)
+
+        for futuro in as_completed(futuros):
+            id_configuracion, indice_semilla, huella, parametros = futuros[futuro]
+            fila = {
+                'id_configuracion': id_configuracion,
+                'indice_semilla': indice_semilla,
+                'huella': huella,
+                **parametros,
+                'generaciones_pedidas': generaciones,
+                **futuro.result()
+            }
+            escritor.writerow(fila)
+            fichero.flush()
+            filas.append(fila)
+
+    return filas
@@ -0,0 +1,147 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Callable
+
+
+def construir_tabla_fitness(
+        evaluar: Callable[[np.ndarray], np.ndarray],
+        rango_min: float,
+        rango_max: float,
+        bits: int
+) -> np.ndarray:
+    """
+    Precalcula el fitness de todos los genotipos posibles de una codificación.
+
+    La posición i de la tabla contiene el fitness del individuo cuyo valor
+    decimal es i, por lo que evaluar una población se reduce a indexar la tabla.
+
+    Args:
+        evaluar: Función que recibe un array de valores reales y devuelve su fitness
+        rango_min: Valor mínimo del rango
+        rango_max: Valor máximo del rango
+        bits: Número de bits usados para la codificación
+
+    Returns:
+        Array de tamaño 2**bits con el fitness de cada genotipo
+    """
+    valores_decimales = np.arange(2 ** bits, dtype=np.int64)
+    max_decimal = 2 ** bits - 1
+    valores_reales = rango_min + (valores_decimales / max_decimal) * (rango_max - rango_min)
+    return np.asarray(evaluar(valores_reales), dtype=float)
+
+
+class CacheFitness:
+    """
+    Caché LRU acotada de valores de fitness indexada por el genotipo empaquetado.
+    """
+
+    def __init__(self, capacidad: int):
+        """
+        Inicializa la caché.
+
+        Args:
+            capacidad: Número máximo de genotipos almacenados
+        """
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def evaluar(
+            self,
+            individuos: np.ndarray,
+            evaluar: Callable[[np.ndarray], np.ndarray],
+            empaquetados: bool = False
+    ) -> np.ndarray:
+        """
+        Obtiene el fitness de los individuos, evaluando solo los genotipos que no están en caché.
+
+        Args:
+            individuos: Matriz binaria (n, bits) con los individuos
+            evaluar: Función que recibe una matriz de individuos y devuelve su fitness
+            empaquetados: Si los individuos ya vienen empaquetados (8 genes por byte)
+
+        Returns:
+            Array con los valores de fitness
+        """
+        if len(individuos) == 0:
+            return np.empty(0)
+
+        claves = np.ascontiguousarray(individuos if empaquetados else np.packbits(individuos, axis=1))
+
+        # Agrupar los individuos por genotipo: el diccionario se recorre una vez por genotipo distinto
+        filas = claves.view(np.dtype((np.void, claves.shape[1]))).ravel()
+        unicas, representantes, inverso, repeticiones = np.unique(
+            filas,
+            return_index=True,
+            return_inverse=True,
+            return_counts=True
+        )
+        fitness_unicas = np.empty(len(unicas))
+        encontradas = np.zeros(len(unicas), dtype=bool)
+        claves_unicas = unicas.tolist()
+
+        for j, clave in enumerate(claves_unicas):
+            valor = self._entradas.get(clave)
+            if valor is not None:
+                self._entradas.move_to_end(clave)
+                fitness_unicas[j] = valor
+                encontradas[j] = True
+
+        self.aciertos += int(repeticiones[encontradas].sum())
+        self.fallos += int(repeticiones[~encontradas].sum())
+
+        pendientes = np.flatnonzero(~encontradas)
+        if len(pendientes) > 0:
+            # Evaluar una sola vez cada genotipo distinto que falta
+            fitness_unicas[pendientes] = evaluar(individuos[representantes[pendientes]])
+
+            for j in pendientes.tolist():
+                self._entradas[claves_unicas[j]] = float(fitness_unicas[j])
+
+            # Descartar los genotipos usados hace más tiempo
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+
+        return fitness_unicas[inverso.ravel()]
+
+    def obtener_estado(self) -> dict:
+        """
+        Obtiene el contenido de la caché para guardarlo en un checkpoint.
+
+        Returns:
+            Diccionario con la capacidad, los contadores y las entradas en orden de uso
+            (claves como matriz uint8 de genotipos empaquetados y sus valores)
+        """
+        claves = list(self._entradas)
+        longitud = len(claves[0]) if claves else 0
+        return {
+            'capacidad': self.capacidad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'claves': np.frombuffer(b''.join(claves), dtype=np.uint8).reshape(len(claves), longitud),
+            'valores': np.fromiter(self._entradas.values(), dtype=float, count=len(claves))
+        }
+
+    def restaurar_estado(self, estado: dict) -> None:
+        """
+        Sustituye el contenido de la caché por uno obtenido con obtener_estado().
+
+        Args:
+            estado: Estado guardado
+        """
+        self.capacidad = estado['capacidad']
+        self.aciertos = estado['aciertos']
+        self.fallos = estado['fallos']
+        self._entradas = OrderedDict(
+            (fila.tobytes(), float(valor)) for fila, valor in zip(estado['claves'], estado['valores'])
+        )
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia los contadores."""
+        self._entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
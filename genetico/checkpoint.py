@@ -0,0 +1,172 @@
+import json
+import os
+import struct
+import tempfile
+import numpy as np
+from typing import Tuple
+
+# Cabecera del formato: firma, longitud de la cabecera JSON y cabecera JSON
+MAGIA = b'AGCKPT01'
+_LONGITUD = struct.Struct('<Q')
+
+# Alineación (en bytes) del inicio de cada array dentro del archivo
+ALINEACION = 64
+
+
+def _alinear(posicion: int) -> int:
+    """Redondea una posición al siguiente múltiplo de ALINEACION."""
+    return -(-posicion // ALINEACION) * ALINEACION
+
+
+def _separar_arrays(estado: dict, prefijo: str, arrays: dict) -> dict:
+    """
+    Copia un estado anidado sustituyendo cada array por una referencia a su nombre.
+
+    Args:
+        estado: Diccionario con valores serializables en JSON y arrays de NumPy
+        prefijo: Prefijo del nombre de los arrays de este nivel
+        arrays: Diccionario nombre -> array que se va llenando
+
+    Returns:
+        Estado sin arrays, serializable en JSON
+    """
+    resultado = {}
+    for clave, valor in estado.items():
+        nombre = f"{prefijo}{clave}"
+        if isinstance(valor, dict):
+            resultado[clave] = _separar_arrays(valor, nombre + '.', arrays)
+        elif isinstance(valor, np.ndarray):
+            arrays[nombre] = np.ascontiguousarray(valor)
+            resultado[clave] = {'__array__': nombre}
+        elif isinstance(valor, np.generic):
+            resultado[clave] = valor.item()
+        else:
+            resultado[clave] = valor
+    return resultado
+
+
+def _unir_arrays(estado: dict, arrays: dict) -> dict:
+    """
+    Operación inversa de _separar_arrays.
+
+    Args:
+        estado: Estado leído de la cabecera JSON
+        arrays: Diccionario nombre -> array
+
+    Returns:
+        Estado con los arrays en su sitio
+    """
+    resultado = {}
+    for clave, valor in estado.items():
+        if isinstance(valor, dict):
+            if set(valor) == {'__array__'}:
+                resultado[clave] = arrays[valor['__array__']]
+            else:
+                resultado[clave] = _unir_arrays(valor, arrays)
+        else:
+            resultado[clave] = valor
+    return resultado
+
+
+def guardar_checkpoint(ruta: str, estado: dict) -> None:
+    """
+    Escribe un checkpoint de forma atómica.
+
+    El archivo se escribe completo en un temporal del mismo directorio y después
+    sustituye al anterior con os.replace, de modo que una interrupción nunca deja
+    un checkpoint a medio escribir. Formato: firma MAGIA, longitud de la cabecera
+    (uint64 little-endian), cabecera JSON y los datos de cada array alineados a
+    ALINEACION bytes, que pueden leerse con np.memmap.
+
+    Args:
+        ruta: Ruta del archivo de checkpoint
+        estado: Diccionario (posiblemente anidado) con valores serializables en JSON
+            y arrays de NumPy
+    """
+    arrays = {}
+    escalares = _separar_arrays(estado, '', arrays)
+
+    # Calcular la posición de cada array; la cabecera se rellena hasta quedar alineada
+    descripcion = {}
+    posicion = 0
+    for nombre, array in arrays.items():
+        descripcion[nombre] = {
+            'dtype': array.dtype.str,
+            'forma': list(array.shape),
+            'desplazamiento': posicion
+        }
+        posicion = _alinear(posicion + array.nbytes)
+
+    cabecera = json.dumps({'estado': escalares, 'arrays': descripcion}).encode('utf-8')
+    inicio_datos = _alinear(len(MAGIA) + _LONGITUD.size + len(cabecera))
+    cabecera += b' ' * (inicio_datos - len(MAGIA) - _LONGITUD.size - len(cabecera))
+
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=directorio, prefix='.checkpoint-', suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as archivo:
+            archivo.write(MAGIA)
+            archivo.write(_LONGITUD.pack(len(cabecera)))
+            archivo.write(cabecera)
+            for nombre, array in arrays.items():
+                archivo.seek(inicio_datos + descripcion[nombre]['desplazamiento'])
+                archivo.write(array.tobytes())
+            archivo.truncate(inicio_datos + posicion)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_temporal, ruta)
+    except BaseException:
+        try:
+            os.unlink(ruta_temporal)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _leer_cabecera(ruta: str) -> Tuple[dict, int]:
+    """
+    Lee y valida la cabecera de un checkpoint.
+
+    Args:
+        ruta: Ruta del archivo de checkpoint
+
+    Returns:
+        Cabecera decodificada y posición en la que empiezan los datos
+    """
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(len(MAGIA)) != MAGIA:
+            raise ValueError(f"{ruta} no es un checkpoint de AlgoritmoGenetico")
+        (longitud,) = _LONGITUD.unpack(archivo.read(_LONGITUD.size))
+        cabecera = json.loads(archivo.read(longitud).decode('utf-8'))
+    return cabecera, len(MAGIA) + _LONGITUD.size + longitud
+
+
+def cargar_checkpoint(ruta: str, mapear: bool = True) -> dict:
+    """
+    Lee un checkpoint escrito con guardar_checkpoint.
+
+    Args:
+        ruta: Ruta del archivo de checkpoint
+        mapear: Si los arrays se proyectan en memoria (np.memmap de solo lectura) en
+            lugar de leerse completos
+
+    Returns:
+        Estado guardado, con los arrays en su sitio
+    """
+    cabecera, inicio_datos = _leer_cabecera(ruta)
+
+    arrays = {}
+    for nombre, descripcion in cabecera['arrays'].items():
+        dtype = np.dtype(descripcion['dtype'])
+        forma = tuple(descripcion['forma'])
+        desplazamiento = inicio_datos + descripcion['desplazamiento']
+
+        if int(np.prod(forma)) == 0:
+            arrays[nombre] = np.empty(forma, dtype=dtype)
+        elif mapear:
+            arrays[nombre] = np.memmap(ruta, dtype=dtype, mode='r', offset=desplazamiento, shape=forma)
+        else:
+            arrays[nombre] = np.fromfile(ruta, dtype=dtype, count=int(np.prod(forma)),
+                                         offset=desplazamiento).reshape(forma)
+
+    return _unir_arrays(cabecera['estado'], arrays)
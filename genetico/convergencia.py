@@ -0,0 +1,194 @@
+import numpy as np
+from typing import Optional
+
+from genetico.historial import HistorialNumerico
+
+
+# Generaciones finales que se examinan para detectar estancamiento (como en
+# calcular_estadisticas_convergencia)
+GENERACIONES_ESTANCAMIENTO = 20
+
+
+class DetectorConvergencia:
+    """
+    Seguimiento incremental de la convergencia a partir del mejor fitness de cada generación.
+
+    Cada llamada a actualizar() cuesta O(1). El detector solo guarda lo que necesita
+    estadisticas(): el primer y el último valor, los GENERACIONES_ESTANCAMIENTO últimos y
+    un historial con la política indicada para leer el valor de la generación central.
+    Con la política 'completo', estadisticas() devuelve, sin recorrer el historial, los
+    mismos valores que calcular_estadisticas_convergencia sobre la misma secuencia (con
+    los valores por defecto de umbral y ventana). Con 'ultimos' o 'decimado' la memoria
+    queda acotada y el valor central se toma de la muestra conservada más cercana
+    anterior a él (la más antigua si ya se descartó), así que las tasas de mejora son
+    aproximadas; la generación de convergencia y el estancamiento siguen siendo exactos.
+    """
+
+    def __init__(
+            self,
+            umbral: float = 1e-6,
+            ventana: int = 5,
+            politica: str = 'completo',
+            retencion: Optional[int] = None
+    ):
+        """
+        Inicializa el detector.
+
+        Args:
+            umbral: Diferencia entre generaciones por debajo de la cual no hay mejora
+            ventana: Generaciones seguidas sin mejora que indican convergencia
+            politica: Política del historial interno (ver HistorialNumerico)
+            retencion: Parámetro de la política del historial
+        """
+        self.umbral = umbral
+        self.ventana = ventana
+
+        self._mejor_fitness_historico = HistorialNumerico(politica, retencion)
+        self._recientes = HistorialNumerico('ultimos', GENERACIONES_ESTANCAMIENTO)
+        self._primero = None
+        self._ultimo = None
+
+        # Diferencias consecutivas por debajo del umbral que terminan en la última
+        self.racha_sin_mejora = 0
+
+        # Primera generación en la que empezó una racha de 'ventana' diferencias pequeñas
+        self._inicio_primera_racha = -1
+
+    def __len__(self) -> int:
+        return self._mejor_fitness_historico.total
+
+    def obtener_estado(self) -> dict:
+        """
+        Obtiene el estado del detector para guardarlo en un checkpoint.
+
+        Returns:
+            Diccionario con los parámetros, los contadores y los historiales
+        """
+        return {
+            'umbral': self.umbral,
+            'ventana': self.ventana,
+            'racha_sin_mejora': self.racha_sin_mejora,
+            'inicio_primera_racha': self._inicio_primera_racha,
+            'primero': self._primero,
+            'ultimo': self._ultimo,
+            'historial': self._mejor_fitness_historico.obtener_estado(),
+            'recientes': self._recientes.obtener_estado()
+        }
+
+    def restaurar_estado(self, estado: dict) -> None:
+        """
+        Devuelve el detector al punto guardado con obtener_estado().
+
+        Args:
+            estado: Estado guardado
+        """
+        self.umbral = estado['umbral']
+        self.ventana = estado['ventana']
+        self.racha_sin_mejora = estado['racha_sin_mejora']
+        self._inicio_primera_racha = estado['inicio_primera_racha']
+        self._primero = estado['primero']
+        self._ultimo = estado['ultimo']
+        self._mejor_fitness_historico.restaurar_estado(estado['historial'])
+        self._recientes.restaurar_estado(estado['recientes'])
+
+    def actualizar(self, mejor_fitness: float) -> None:
+        """
+        Incorpora el mejor fitness de una nueva generación.
+
+        Args:
+            mejor_fitness: Mejor fitness de la generación
+        """
+        n_gen = len(self)
+
+        if n_gen > 0:
+            diferencia = mejor_fitness - self._ultimo
+            if abs(diferencia) < self.umbral:
+                self.racha_sin_mejora += 1
+                if self.racha_sin_mejora == self.ventana and self._inicio_primera_racha == -1:
+                    # Índice (en las diferencias) de la primera diferencia de la racha
+                    self._inicio_primera_racha = n_gen - self.ventana
+            else:
+                self.racha_sin_mejora = 0
+        else:
+            self._primero = mejor_fitness
+
+        self._ultimo = mejor_fitness
+        self._mejor_fitness_historico.agregar(mejor_fitness)
+        self._recientes.agregar(mejor_fitness)
+
+    def _valor_en(self, generacion: int) -> float:
+        """
+        Obtiene el mejor fitness de una generación a partir del historial conservado.
+
+        Args:
+            generacion: Índice de la generación
+
+        Returns:
+            Valor de esa generación, o de la muestra conservada más cercana anterior a ella
+        """
+        historico = self._mejor_fitness_historico
+        if historico.politica == 'completo':
+            return historico.valores()[generacion]
+
+        posicion = np.searchsorted(historico.generaciones(), generacion, side='right') - 1
+        return historico.valores()[max(posicion, 0)]
+
+    @property
+    def generacion_convergencia(self) -> int:
+        """
+        Generación en la que se detectó la convergencia (-1 si todavía no).
+
+        Como en calcular_estadisticas_convergencia, la racha debe estar seguida de al
+        menos una diferencia más para contar.
+        """
+        inicio = self._inicio_primera_racha
+        n_diferencias = len(self) - 1
+        if inicio != -1 and inicio + self.ventana < n_diferencias:
+            return inicio
+        return -1
+
+    @property
+    def convergido(self) -> bool:
+        """Si ya se detectó la convergencia."""
+        return self.generacion_convergencia != -1
+
+    def estadisticas(self) -> dict:
+        """
+        Obtiene las estadísticas de convergencia de la secuencia vista hasta ahora.
+
+        Returns:
+            Diccionario con las mismas claves y valores que calcular_estadisticas_convergencia
+        """
+        n_gen = len(self)
+
+        if n_gen < 2:
+            return {
+                'convergencia_rapida': False,
+                'generacion_convergencia': -1,
+                'tasa_mejora_temprana': 0.0,
+                'tasa_mejora_tardia': 0.0,
+                'estancamiento': False
+            }
+
+        gen_convergencia = self.generacion_convergencia
+
+        # Tasas de mejora de cada mitad del historial
+        mitad = n_gen // 2
+        valor_mitad = self._valor_en(mitad)
+        tasa_mejora_temprana = (valor_mitad - self._primero) / mitad
+        tasa_mejora_tardia = (self._ultimo - valor_mitad) / (n_gen - mitad)
+
+        # Estancamiento: poca mejora en la última parte
+        ultimas_gen = min(GENERACIONES_ESTANCAMIENTO, n_gen // 4)
+        estancamiento = False
+        if ultimas_gen > 0 and n_gen > ultimas_gen:
+            mejora_reciente = self._ultimo - self._recientes.valores()[-ultimas_gen]
+            estancamiento = mejora_reciente < self.umbral * ultimas_gen
+
+        return {
+            'convergencia_rapida': gen_convergencia < n_gen // 3 and gen_convergencia != -1,
+            'generacion_convergencia': gen_convergencia,
+            'tasa_mejora_temprana': tasa_mejora_temprana,
+            'tasa_mejora_tardia': tasa_mejora_tardia,
+            'estancamiento': estancamiento
+        }
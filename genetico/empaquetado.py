@@ -0,0 +1,336 @@
+import numpy as np
+from typing import Optional
+
+from genetico.operadores import sortear_puntos_cruza
+from genetico.utils import diversidad_hamming_desde_conteos
+
+# Número de bits a 1 de cada valor posible de un byte
+_UNOS_POR_BYTE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Cifras binarias con las que se aproxima la probabilidad de mutación de cada gen
+BITS_PROBABILIDAD = 16
+
+
+def bytes_por_individuo(bits: int) -> int:
+    """
+    Calcula cuántos bytes ocupa un individuo empaquetado.
+
+    Args:
+        bits: Longitud en bits del individuo
+
+    Returns:
+        Número de bytes por individuo
+    """
+    return (bits + 7) // 8
+
+
+def empaquetar_poblacion(poblacion: np.ndarray) -> np.ndarray:
+    """
+    Empaqueta una población binaria a 8 genes por byte (el primer gen en el bit más alto).
+
+    Args:
+        poblacion: Matriz binaria (n, bits)
+
+    Returns:
+        Matriz uint8 (n, ceil(bits / 8)) con los bits de relleno a cero
+    """
+    return np.packbits(np.asarray(poblacion) != 0, axis=-1)
+
+
+def desempaquetar_poblacion(poblacion_empaquetada: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Recupera la representación de un gen por posición de una población empaquetada.
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, ceil(bits / 8))
+        bits: Longitud en bits de los individuos
+
+    Returns:
+        Matriz binaria (n, bits)
+    """
+    return np.unpackbits(poblacion_empaquetada, axis=-1, count=bits).astype(int)
+
+
+def inicializar_poblacion_empaquetada(tamano_poblacion: int, bits: int) -> np.ndarray:
+    """
+    Crea una población inicial aleatoria directamente en forma empaquetada.
+
+    Args:
+        tamano_poblacion: Número de individuos
+        bits: Longitud en bits de cada individuo
+
+    Returns:
+        Matriz uint8 (tamano_poblacion, ceil(bits / 8))
+    """
+    n_bytes = bytes_por_individuo(bits)
+    poblacion = np.random.randint(0, 256, size=(tamano_poblacion, n_bytes), dtype=np.uint8)
+
+    # Dejar a cero los bits de relleno del último byte
+    relleno = 8 * n_bytes - bits
+    poblacion[:, -1] &= np.uint8((0xFF << relleno) & 0xFF)
+
+    return poblacion
+
+
+def mascara_segmento(inicio: np.ndarray, fin: np.ndarray, n_bytes: int) -> np.ndarray:
+    """
+    Construye, byte a byte, la máscara de los bits en [inicio, fin) de cada fila.
+
+    Args:
+        inicio: Primer bit del segmento de cada fila
+        fin: Bit siguiente al último del segmento de cada fila
+        n_bytes: Bytes por individuo
+
+    Returns:
+        Matriz uint8 (n, n_bytes) con la máscara
+    """
+    posicion_byte = 8 * np.arange(n_bytes)
+    desde = np.clip(inicio[:, np.newaxis] - posicion_byte, 0, 8)
+    hasta = np.clip(fin[:, np.newaxis] - posicion_byte, 0, 8)
+    return ((0xFF >> desde) & ~(0xFF >> hasta)).astype(np.uint8)
+
+
+def cruza_dos_puntos_empaquetada(
+        padres1: np.ndarray,
+        padres2: np.ndarray,
+        bits: int,
+        salida: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Realiza la cruza de dos puntos de todas las parejas operando sobre bytes completos.
+
+    Sortea los puntos de corte igual que cruza_dos_puntos_poblacion, por lo que con la
+    misma semilla produce los mismos hijos que la representación sin empaquetar.
+
+    Args:
+        padres1: Matriz empaquetada (m, n_bytes) con el primer padre de cada pareja
+        padres2: Matriz empaquetada (m, n_bytes) con el segundo padre de cada pareja
+        bits: Longitud en bits de los individuos
+        salida: Matriz (2m, n_bytes) donde escribir los hijos (opcional)
+
+    Returns:
+        Matriz empaquetada (2m, n_bytes); los hijos de la pareja i ocupan las filas 2i y 2i + 1
+    """
+    n_parejas, n_bytes = padres1.shape
+
+    if salida is None:
+        salida = np.empty((2 * n_parejas, n_bytes), dtype=np.uint8)
+
+    hijos1 = salida[0::2]
+    hijos2 = salida[1::2]
+
+    # Asegurarse de que el tamaño sea suficiente para dos puntos de cruza
+    if bits <= 2 or n_parejas == 0:
+        np.copyto(hijos1, padres1)
+        np.copyto(hijos2, padres2)
+        return salida
+
+    inicio, fin = sortear_puntos_cruza(n_parejas, bits)
+
+    # Bits del segmento central en los que los padres difieren
+    diferencia = np.bitwise_xor(padres1, padres2)
+    diferencia &= mascara_segmento(inicio, fin, n_bytes)
+
+    # Intercambiar esos bits entre los padres
+    np.bitwise_xor(padres1, diferencia, out=hijos1)
+    np.bitwise_xor(padres2, diferencia, out=hijos2)
+
+    return salida
+
+
+def mascara_genes_empaquetada(n: int, bits: int, probabilidad: float) -> np.ndarray:
+    """
+    Genera directamente en forma empaquetada una máscara en la que cada gen vale 1 con
+    la probabilidad indicada, sin crear ningún valor por gen.
+
+    Cada byte de la máscara combina bytes aleatorios según las cifras binarias de la
+    probabilidad, de la menos significativa a la más: con un 1 se hace OR y con un 0,
+    AND. Así cada bit vale 1 con la probabilidad redondeada a BITS_PROBABILIDAD cifras,
+    usando como mucho BITS_PROBABILIDAD bytes aleatorios por cada 8 genes.
+
+    Args:
+        n: Número de individuos
+        bits: Longitud en bits de los individuos
+        probabilidad: Probabilidad de que cada gen valga 1
+
+    Returns:
+        Matriz uint8 (n, ceil(bits / 8)) con los bits de relleno a cero
+    """
+    n_bytes = bytes_por_individuo(bits)
+    escala = 1 << BITS_PROBABILIDAD
+    cifras = int(np.clip(round(probabilidad * escala), 0, escala))
+
+    if cifras == 0:
+        return np.zeros((n, n_bytes), dtype=np.uint8)
+
+    if cifras == escala:
+        mascara = np.full((n, n_bytes), 0xFF, dtype=np.uint8)
+    else:
+        # Las cifras a 0 por debajo de la primera a 1 no cambian una máscara vacía
+        mascara = None
+        for posicion in range(BITS_PROBABILIDAD):
+            cifra = (cifras >> posicion) & 1
+            if mascara is None and not cifra:
+                continue
+
+            aleatorios = np.random.randint(0, 256, size=(n, n_bytes), dtype=np.uint8)
+            if mascara is None:
+                mascara = aleatorios
+            elif cifra:
+                mascara |= aleatorios
+            else:
+                mascara &= aleatorios
+
+    # Dejar a cero los bits de relleno del último byte
+    relleno = 8 * n_bytes - bits
+    mascara[:, -1] &= np.uint8((0xFF << relleno) & 0xFF)
+
+    return mascara
+
+
+def mutacion_complemento_empaquetada_inplace(
+        poblacion_empaquetada: np.ndarray,
+        bits: int,
+        pmi: float,
+        pmg: float,
+        mismo_sorteo: bool = False
+) -> np.ndarray:
+    """
+    Aplica la mutación por complemento sobre una población empaquetada, en el lugar.
+
+    Los umbrales son los de mutacion_complemento_inplace. Por defecto la máscara de genes
+    se construye byte a byte con mascara_genes_empaquetada, que consume otros números
+    aleatorios y redondea PMG a BITS_PROBABILIDAD cifras binarias: el resultado solo es
+    estadísticamente equivalente al de la representación sin empaquetar. Con mismo_sorteo
+    se sortea un real por gen, como sin empaquetar (con la misma semilla muta los mismos
+    genes, a cambio de un temporal de 8 bytes por gen).
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, n_bytes) (se modifica en el lugar)
+        bits: Longitud en bits de los individuos
+        pmi: Umbral PMI (porcentaje de mutación del individuo)
+        pmg: Umbral PMG (porcentaje de mutación del gen)
+        mismo_sorteo: Si se usan los mismos sorteos que mutacion_complemento_inplace
+
+    Returns:
+        La misma población, ya mutada
+    """
+    tam_poblacion = len(poblacion_empaquetada)
+
+    # Decidir qué individuos mutan (solo mutan los que NO superan el umbral)
+    individuos_mutan = np.flatnonzero(np.random.random(tam_poblacion) > pmi)
+    if len(individuos_mutan) == 0:
+        return poblacion_empaquetada
+
+    # Decidir qué genes mutan (solo mutan los que NO superan el umbral) y complementarlos
+    # con un XOR por byte
+    if mismo_sorteo:
+        mascara = np.packbits(np.random.random((len(individuos_mutan), bits)) > pmg, axis=-1)
+    else:
+        mascara = mascara_genes_empaquetada(len(individuos_mutan), bits, 1.0 - pmg)
+    poblacion_empaquetada[individuos_mutan] ^= mascara
+
+    return poblacion_empaquetada
+
+
+def binario_a_decimal_empaquetada(poblacion_empaquetada: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Convierte una población empaquetada a valores decimales acumulando byte a byte.
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, n_bytes)
+        bits: Longitud en bits de los individuos
+
+    Returns:
+        Array con el valor decimal de cada individuo (entero si cabe en 63 bits, real si no)
+    """
+    n_bytes = poblacion_empaquetada.shape[-1]
+    relleno = 8 * n_bytes - bits
+
+    if bits <= 63:
+        valores = np.zeros(poblacion_empaquetada.shape[:-1], dtype=np.uint64)
+        for j in range(n_bytes):
+            valores <<= np.uint64(8)
+            valores |= poblacion_empaquetada[..., j]
+        valores >>= np.uint64(relleno)
+        return valores.astype(np.int64)
+
+    valores = np.zeros(poblacion_empaquetada.shape[:-1])
+    for j in range(n_bytes):
+        valores *= 256.0
+        valores += poblacion_empaquetada[..., j]
+    return valores / 2.0 ** relleno
+
+
+def binario_a_real_empaquetada(
+        poblacion_empaquetada: np.ndarray,
+        rango_min: float,
+        rango_max: float,
+        bits: int
+) -> np.ndarray:
+    """
+    Convierte una población empaquetada a sus valores reales en el rango especificado.
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, n_bytes)
+        rango_min: Valor mínimo del rango
+        rango_max: Valor máximo del rango
+        bits: Longitud en bits de los individuos
+
+    Returns:
+        Array con el valor real de cada individuo
+    """
+    valores_decimales = binario_a_decimal_empaquetada(poblacion_empaquetada, bits)
+    max_decimal = 2 ** bits - 1
+    return rango_min + (valores_decimales / max_decimal) * (rango_max - rango_min)
+
+
+def distancia_hamming_empaquetada(individuos1: np.ndarray, individuos2: np.ndarray) -> np.ndarray:
+    """
+    Calcula la distancia de Hamming entre individuos empaquetados contando bits por byte.
+
+    Args:
+        individuos1: Individuo(s) empaquetado(s)
+        individuos2: Individuo(s) empaquetado(s), con forma compatible con individuos1
+
+    Returns:
+        Número de bits diferentes entre cada par de individuos
+    """
+    return _UNOS_POR_BYTE[np.bitwise_xor(individuos1, individuos2)].sum(axis=-1, dtype=np.int64)
+
+
+def contar_unos_por_columna_empaquetada(poblacion_empaquetada: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Cuenta cuántos individuos tienen un 1 en cada posición, recorriendo los bytes una vez por bit.
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, n_bytes)
+        bits: Longitud en bits de los individuos
+
+    Returns:
+        Array de longitud bits con el número de unos de cada posición
+    """
+    n_bytes = poblacion_empaquetada.shape[-1]
+    unos = np.empty(8 * n_bytes, dtype=np.int64)
+
+    for b in range(8):
+        unos[b::8] = np.count_nonzero(poblacion_empaquetada & np.uint8(0x80 >> b), axis=0)
+
+    return unos[:bits]
+
+
+def calcular_diversidad_hamming_empaquetada(poblacion_empaquetada: np.ndarray, bits: int) -> float:
+    """
+    Calcula la distancia de Hamming promedio entre pares de una población empaquetada.
+
+    Args:
+        poblacion_empaquetada: Matriz uint8 (n, n_bytes)
+        bits: Longitud en bits de los individuos
+
+    Returns:
+        Diversidad promedio (distancia de Hamming promedio entre pares de individuos)
+    """
+    return diversidad_hamming_desde_conteos(
+        contar_unos_por_columna_empaquetada(poblacion_empaquetada, bits),
+        len(poblacion_empaquetada)
+    )
@@ -0,0 +1,253 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import Executor, Future
+from typing import Callable, List, Optional
+
+
+def declarada_vectorizada(funcion: Callable) -> Optional[bool]:
+    """
+    Indica si una función objetivo declara que acepta arrays completos.
+
+    Una función lo declara con el atributo ``vectorizada`` (por ejemplo
+    ``funcion.vectorizada = True``).
+
+    Args:
+        funcion: Función objetivo
+
+    Returns:
+        True o False si la función lo declara, None si no lo declara
+    """
+    declaracion = getattr(funcion, 'vectorizada', None)
+    return None if declaracion is None else bool(declaracion)
+
+
+def detectar_vectorizacion(funcion: Callable, valores: np.ndarray, tamano_muestra: int = 4) -> bool:
+    """
+    Determina si una función objetivo puede evaluar un array completo en una sola llamada.
+
+    Si la función no lo declara, se prueba con una pequeña muestra de valores y se
+    compara el resultado con la evaluación escalar de esos mismos valores.
+
+    Args:
+        funcion: Función objetivo
+        valores: Valores reales de los que se toma la muestra
+        tamano_muestra: Número de valores usados en la prueba
+
+    Returns:
+        True si la función acepta arrays, False si hay que evaluarla valor a valor
+    """
+    declaracion = declarada_vectorizada(funcion)
+    if declaracion is not None:
+        return declaracion
+
+    muestra = np.asarray(valores, dtype=float)[:tamano_muestra]
+    if len(muestra) == 0:
+        return False
+
+    try:
+        resultado_vectorial = np.asarray(funcion(muestra), dtype=float)
+    except Exception:
+        return False
+
+    if resultado_vectorial.shape != muestra.shape:
+        return False
+
+    resultado_escalar = np.array([funcion(valor) for valor in muestra], dtype=float)
+    return bool(np.allclose(resultado_vectorial, resultado_escalar, equal_nan=True))
+
+
+def evaluar_valores(funcion: Callable, valores: np.ndarray, vectorizada: bool) -> np.ndarray:
+    """
+    Evalúa la función objetivo sobre un conjunto de valores reales.
+
+    Args:
+        funcion: Función objetivo
+        valores: Array con los valores reales a evaluar
+        vectorizada: Si la función acepta el array completo en una sola llamada
+
+    Returns:
+        Array con los valores de fitness
+    """
+    if vectorizada:
+        return np.asarray(funcion(valores), dtype=float)
+
+    fitness = np.zeros(len(valores))
+    for i, valor in enumerate(valores):
+        fitness[i] = funcion(valor)
+    return fitness
+
+
+def _evaluar_bloque(funcion: Callable, bloque: np.ndarray, vectorizada: bool) -> np.ndarray:
+    """Evalúa un bloque de valores dentro de un trabajador."""
+    return evaluar_valores(funcion, bloque, vectorizada)
+
+
+class EvaluadorSerial:
+    """
+    Evaluador por defecto: evalúa la función objetivo en el propio proceso.
+    """
+
+    def evaluar(self, funcion: Callable, valores: np.ndarray, vectorizada: bool) -> np.ndarray:
+        """
+        Evalúa la función objetivo sobre un conjunto de valores reales.
+
+        Args:
+            funcion: Función objetivo
+            valores: Array con los valores reales a evaluar
+            vectorizada: Si la función acepta el array completo en una sola llamada
+
+        Returns:
+            Array con los valores de fitness
+        """
+        return evaluar_valores(funcion, valores, vectorizada)
+
+    def cerrar(self) -> None:
+        """No hay recursos que liberar."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+class EvaluadorProcesos(EvaluadorSerial):
+    """
+    Evalúa la función objetivo repartiendo los valores en bloques entre un pool de procesos.
+
+    El pool se crea en la primera evaluación y se conserva entre generaciones hasta
+    llamar a cerrar(). Los bloques se recogen en el orden en que se enviaron, por lo que
+    el resultado no depende del número de trabajadores. La función objetivo debe poder
+    serializarse con pickle (definida a nivel de módulo).
+    """
+
+    def __init__(
+            self,
+            n_trabajadores: Optional[int] = None,
+            tamano_bloque: Optional[int] = None,
+            duracion_bloque: float = 0.05
+    ):
+        """
+        Inicializa el evaluador.
+
+        Args:
+            n_trabajadores: Número de trabajadores (si es None, uno por CPU)
+            tamano_bloque: Valores por bloque fijo (si es None, se adapta al coste por valor)
+            duracion_bloque: Duración deseada de cada bloque en segundos al adaptar su tamaño
+        """
+        self.n_trabajadores = n_trabajadores or os.cpu_count() or 1
+        self.tamano_bloque = tamano_bloque
+        self.duracion_bloque = duracion_bloque
+
+        # Estimación del coste de evaluar un valor, actualizada en cada llamada
+        self.segundos_por_valor = None
+
+        self._ejecutor = None
+
+    def _crear_ejecutor(self) -> Executor:
+        """Crea el pool de trabajadores (multiprocessing solo se importa aquí)."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=self.n_trabajadores)
+
+    def _calcular_tamano_bloque(self, n_valores: int) -> int:
+        """
+        Decide cuántos valores enviar en cada bloque.
+
+        Args:
+            n_valores: Número total de valores a evaluar
+
+        Returns:
+            Tamaño de bloque
+        """
+        if self.tamano_bloque is not None:
+            return max(1, self.tamano_bloque)
+
+        # Como mínimo un bloque por trabajador
+        maximo = -(-n_valores // self.n_trabajadores)
+
+        # Sin estimación de coste todavía: unos cuatro bloques por trabajador
+        if self.segundos_por_valor is None:
+            return max(1, -(-n_valores // (4 * self.n_trabajadores)))
+
+        # Bloques que tarden aproximadamente duracion_bloque
+        tamano = int(self.duracion_bloque / max(self.segundos_por_valor, 1e-12))
+        return int(np.clip(tamano, 1, maximo))
+
+    def evaluar(self, funcion: Callable, valores: np.ndarray, vectorizada: bool) -> np.ndarray:
+        """
+        Evalúa la función objetivo sobre un conjunto de valores reales en los trabajadores.
+
+        Args:
+            funcion: Función objetivo
+            valores: Array con los valores reales a evaluar
+            vectorizada: Si la función acepta el array completo en una sola llamada
+
+        Returns:
+            Array con los valores de fitness, en el mismo orden que los valores
+        """
+        valores = np.asarray(valores, dtype=float)
+        n_valores = len(valores)
+
+        if n_valores == 0:
+            return np.zeros(0)
+
+        if self._ejecutor is None:
+            self._ejecutor = self._crear_ejecutor()
+
+        tamano = self._calcular_tamano_bloque(n_valores)
+        inicio = time.perf_counter()
+
+        futuros = [
+            self._ejecutor.submit(_evaluar_bloque, funcion, valores[i:i + tamano], vectorizada)
+            for i in range(0, n_valores, tamano)
+        ]
+
+        return np.concatenate(self._medir_bloques(futuros, n_valores, inicio))
+
+    def _medir_bloques(self, futuros: List[Future], n_valores: int, inicio: float) -> List:
+        """
+        Espera los bloques en el orden de envío y actualiza el coste estimado por valor.
+
+        Args:
+            futuros: Bloques enviados, en orden
+            n_valores: Número total de valores evaluados
+            inicio: Instante (time.perf_counter) en que se empezaron a enviar
+
+        Returns:
+            Resultados de los bloques, en el mismo orden
+        """
+        resultados = [futuro.result() for futuro in futuros]
+
+        # Actualizar el coste estimado por valor (media móvil)
+        trabajadores_usados = min(self.n_trabajadores, len(futuros))
+        coste = (time.perf_counter() - inicio) * trabajadores_usados / n_valores
+        if self.segundos_por_valor is None:
+            self.segundos_por_valor = coste
+        else:
+            self.segundos_por_valor = 0.7 * self.segundos_por_valor + 0.3 * coste
+
+        return resultados
+
+    def cerrar(self) -> None:
+        """Detiene el pool de trabajadores."""
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=True)
+            self._ejecutor = None
+
+
+class EvaluadorHilos(EvaluadorProcesos):
+    """
+    Evalúa la función objetivo repartiendo los valores en bloques entre un pool de hilos.
+
+    Solo aporta paralelismo real si la función libera el GIL (cálculo intensivo con
+    NumPy o extensiones en C); a cambio no serializa ni la función ni los valores,
+    por lo que admite también funciones no serializables como lambdas.
+    """
+
+    def _crear_ejecutor(self) -> Executor:
+        """Crea el pool de hilos."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.n_trabajadores)
@@ -0,0 +1,206 @@
+import numpy as np
+from typing import Optional
+
+POLITICAS = ('completo', 'ultimos', 'decimado')
+
+
+class HistorialNumerico:
+    """
+    Historial de valores reales guardado en arrays de NumPy con retención configurable.
+
+    Políticas:
+        - 'completo': guarda todos los valores en un array que crece por duplicación.
+        - 'ultimos': guarda solo los últimos `retencion` valores en un buffer circular.
+        - 'decimado': guarda un valor de cada `retencion` generaciones, junto con el
+          mínimo y el máximo de cada bloque.
+
+    valores(), minimos() y maximos() devuelven vistas, no copias, salvo valores() de un
+    historial 'ultimos', que copia la ventana (como mucho `retencion` valores) porque el
+    siguiente valor añadido sobrescribe el buffer circular. Las vistas de 'completo' no
+    cambian al añadir valores; en 'decimado', el mínimo y el máximo del último bloque
+    siguen actualizándose hasta que empieza el bloque siguiente.
+    """
+
+    def __init__(self, politica: str = 'completo', retencion: Optional[int] = None, capacidad_inicial: int = 256):
+        """
+        Inicializa un historial vacío.
+
+        Args:
+            politica: 'completo', 'ultimos' o 'decimado'
+            retencion: Número de valores conservados ('ultimos') o cada cuántas
+                generaciones se guarda un valor ('decimado')
+            capacidad_inicial: Capacidad inicial de los arrays que crecen
+        """
+        if politica not in POLITICAS:
+            raise ValueError(f"Política de historial desconocida: {politica} (opciones: {', '.join(POLITICAS)})")
+        if politica != 'completo' and (retencion is None or retencion < 1):
+            raise ValueError(f"La política '{politica}' necesita una retención positiva")
+
+        self.politica = politica
+        self.retencion = retencion
+
+        # Número total de valores añadidos (incluidos los descartados)
+        self.total = 0
+
+        if politica == 'ultimos':
+            # Cada valor se escribe dos veces para que la ventana sea siempre contigua
+            self._valores = np.empty(2 * retencion)
+        else:
+            self._valores = np.empty(max(1, capacidad_inicial))
+
+        self._minimos = None
+        self._maximos = None
+        if politica == 'decimado':
+            self._minimos = np.empty_like(self._valores)
+            self._maximos = np.empty_like(self._valores)
+
+        # Número de entradas guardadas ('completo' y 'decimado')
+        self._n = 0
+
+    def _crecer(self) -> None:
+        """Duplica la capacidad de los arrays que crecen."""
+        capacidad = 2 * len(self._valores)
+        for nombre in ('_valores', '_minimos', '_maximos'):
+            actual = getattr(self, nombre)
+            if actual is not None:
+                nuevo = np.empty(capacidad)
+                nuevo[:self._n] = actual[:self._n]
+                setattr(self, nombre, nuevo)
+
+    def agregar(self, valor: float) -> None:
+        """
+        Añade el valor de una nueva generación.
+
+        Args:
+            valor: Valor a añadir
+        """
+        if self.politica == 'ultimos':
+            posicion = self.total % self.retencion
+            self._valores[posicion] = valor
+            self._valores[posicion + self.retencion] = valor
+
+        elif self.politica == 'decimado' and self.total % self.retencion != 0:
+            # Dentro de un bloque: solo actualizar su mínimo y su máximo
+            ultimo = self._n - 1
+            self._minimos[ultimo] = min(self._minimos[ultimo], valor)
+            self._maximos[ultimo] = max(self._maximos[ultimo], valor)
+
+        else:
+            if self._n == len(self._valores):
+                self._crecer()
+            self._valores[self._n] = valor
+            if self.politica == 'decimado':
+                self._minimos[self._n] = valor
+                self._maximos[self._n] = valor
+            self._n += 1
+
+        self.total += 1
+
+    def valores(self) -> np.ndarray:
+        """
+        Obtiene los valores conservados, del más antiguo al más reciente.
+
+        Returns:
+            Vista de los valores (copia de la ventana en la política 'ultimos')
+        """
+        if self.politica == 'ultimos':
+            if self.total < self.retencion:
+                return self._valores[:self.total].copy()
+            inicio = self.total % self.retencion
+            return self._valores[inicio:inicio + self.retencion].copy()
+
+        return self._valores[:self._n]
+
+    def minimos(self) -> np.ndarray:
+        """
+        Obtiene el mínimo de cada entrada (de cada bloque si el historial está decimado).
+
+        Returns:
+            Vista de los mínimos
+        """
+        if self.politica == 'decimado':
+            return self._minimos[:self._n]
+        return self.valores()
+
+    def maximos(self) -> np.ndarray:
+        """
+        Obtiene el máximo de cada entrada (de cada bloque si el historial está decimado).
+
+        Returns:
+            Vista de los máximos
+        """
+        if self.politica == 'decimado':
+            return self._maximos[:self._n]
+        return self.valores()
+
+    def generaciones(self) -> np.ndarray:
+        """
+        Obtiene el índice de generación de cada valor conservado.
+
+        Returns:
+            Array con los índices de generación
+        """
+        if self.politica == 'ultimos':
+            return np.arange(self.total - min(self.total, self.retencion), self.total)
+        if self.politica == 'decimado':
+            return np.arange(self._n) * self.retencion
+        return np.arange(self._n)
+
+    def obtener_estado(self) -> dict:
+        """
+        Obtiene el estado del historial para guardarlo en un checkpoint.
+
+        Returns:
+            Diccionario con la política, los contadores y los arrays ocupados
+        """
+        n = len(self._valores) if self.politica == 'ultimos' else self._n
+        estado = {
+            'politica': self.politica,
+            'retencion': self.retencion,
+            'total': self.total,
+            'valores': self._valores[:n]
+        }
+        if self.politica == 'decimado':
+            estado['minimos'] = self._minimos[:n]
+            estado['maximos'] = self._maximos[:n]
+        return estado
+
+    def restaurar_estado(self, estado: dict) -> None:
+        """
+        Sustituye el contenido del historial por uno obtenido con obtener_estado().
+
+        Args:
+            estado: Estado guardado (los arrays se copian)
+        """
+        self.politica = estado['politica']
+        self.retencion = estado['retencion']
+        self.total = estado['total']
+
+        n = len(estado['valores'])
+        self._n = 0 if self.politica == 'ultimos' else n
+
+        # Copiar los arrays (con capacidad mínima 1 para que _crecer pueda duplicarla)
+        self._valores = np.empty(max(1, n))
+        self._valores[:n] = estado['valores']
+        self._minimos = None
+        self._maximos = None
+        if self.politica == 'decimado':
+            self._minimos = np.empty_like(self._valores)
+            self._maximos = np.empty_like(self._valores)
+            self._minimos[:n] = estado['minimos']
+            self._maximos[:n] = estado['maximos']
+
+    def __len__(self) -> int:
+        if self.politica == 'ultimos':
+            return min(self.total, self.retencion)
+        return self._n
+
+    def __getitem__(self, indice):
+        return self.valores()[indice]
+
+    def __iter__(self):
+        return iter(self.valores())
+
+    def __array__(self, dtype=None, copy=None):
+        valores = self.valores()
+        return valores if dtype is None else valores.astype(dtype)
@@ -0,0 +1,134 @@
+import time
+import tracemalloc
+from typing import Dict
+
+# Etapas de una generación, en el orden en que se ejecutan
+ETAPAS = (
+    'evaluacion',
+    'estadisticas',
+    'emparejamiento',
+    'cruza',
+    'mutacion',
+    'evaluacion_hijos',
+    'combinacion',
+    'poda'
+)
+
+
+class Instrumentacion:
+    """
+    Mide el tiempo y la memoria reservada por cada etapa de paso_generacion.
+
+    Cada llamada a marcar() asigna a la etapa indicada el tiempo transcurrido desde
+    la marca anterior, de modo que basta una marca al final de cada etapa.
+
+    La memoria se mide con tracemalloc, que se activa durante cada generación medida
+    (si ya estaba activo, se usa sin detenerlo): los bytes de una etapa son el pico de
+    memoria reservada por encima de la que había al empezarla. Las vistas y los buffers
+    que se reutilizan no cuentan. El trazado encarece las reservas de memoria, por lo
+    que los tiempos de las etapas que reservan mucho salen algo inflados.
+    """
+
+    def __init__(self):
+        """Inicializa los acumuladores a cero."""
+        self.generaciones = 0
+        self.tiempos_acumulados = dict.fromkeys(ETAPAS, 0.0)
+        self.bytes_acumulados = dict.fromkeys(ETAPAS, 0)
+        self.evaluaciones_acumuladas = 0
+        self.ultima_generacion = None
+
+        self._tiempos_generacion = None
+        self._bytes_generacion = None
+        self._evaluaciones_inicio = 0
+        self._inicio = 0.0
+        self._ultima_marca = 0.0
+        self._memoria_marca = 0
+        self._detener_trazado = False
+
+    def iniciar_generacion(self, evaluaciones: int) -> None:
+        """
+        Comienza la medición de una generación.
+
+        Args:
+            evaluaciones: Evaluaciones de la función objetivo realizadas hasta ahora
+        """
+        self._tiempos_generacion = dict.fromkeys(ETAPAS, 0.0)
+        self._bytes_generacion = dict.fromkeys(ETAPAS, 0)
+        self._evaluaciones_inicio = evaluaciones
+
+        self._detener_trazado = not tracemalloc.is_tracing()
+        if self._detener_trazado:
+            tracemalloc.start()
+        self._reiniciar_pico()
+
+        self._inicio = self._ultima_marca = time.perf_counter()
+
+    def _reiniciar_pico(self) -> None:
+        """Toma la memoria actual como punto de partida de la etapa siguiente."""
+        tracemalloc.reset_peak()
+        self._memoria_marca = tracemalloc.get_traced_memory()[0]
+
+    def marcar(self, etapa: str) -> None:
+        """
+        Cierra una etapa, registrando su duración y su pico de memoria reservada.
+
+        Args:
+            etapa: Nombre de la etapa (uno de ETAPAS)
+        """
+        ahora = time.perf_counter()
+        self._tiempos_generacion[etapa] += ahora - self._ultima_marca
+
+        pico = tracemalloc.get_traced_memory()[1]
+        self._bytes_generacion[etapa] += max(0, pico - self._memoria_marca)
+        self._reiniciar_pico()
+
+        # El tiempo de la medición de memoria no se carga a la etapa siguiente
+        self._ultima_marca = time.perf_counter()
+
+    def terminar_generacion(self, generacion: int, evaluaciones: int) -> Dict:
+        """
+        Termina la medición de la generación actual y la suma a los acumulados.
+
+        Args:
+            generacion: Número de la generación medida
+            evaluaciones: Evaluaciones de la función objetivo realizadas hasta ahora
+
+        Returns:
+            Registro con los tiempos, bytes y evaluaciones de la generación
+        """
+        evaluaciones_generacion = evaluaciones - self._evaluaciones_inicio
+
+        if self._detener_trazado:
+            tracemalloc.stop()
+            self._detener_trazado = False
+
+        for etapa in ETAPAS:
+            self.tiempos_acumulados[etapa] += self._tiempos_generacion[etapa]
+            self.bytes_acumulados[etapa] += self._bytes_generacion[etapa]
+        self.evaluaciones_acumuladas += evaluaciones_generacion
+        self.generaciones += 1
+
+        self.ultima_generacion = {
+            'generacion': generacion,
+            'tiempo_total': self._ultima_marca - self._inicio,
+            'tiempos': self._tiempos_generacion,
+            'bytes': self._bytes_generacion,
+            'evaluaciones': evaluaciones_generacion
+        }
+        return self.ultima_generacion
+
+    def resumen(self) -> Dict:
+        """
+        Obtiene los acumulados de todas las generaciones medidas.
+
+        Returns:
+            Diccionario con tiempos, bytes y evaluaciones acumulados y la última generación
+        """
+        return {
+            'generaciones': self.generaciones,
+            'tiempo_total': sum(self.tiempos_acumulados.values()),
+            'tiempos': dict(self.tiempos_acumulados),
+            'bytes': dict(self.bytes_acumulados),
+            'evaluaciones': self.evaluaciones_acumuladas,
+            'ultima_generacion': self.ultima_generacion
+        }
@@ -0,0 +1,255 @@
+import traceback
+import multiprocessing
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+
+from genetico.algoritmo import AlgoritmoGenetico
+
+TOPOLOGIAS = ('anillo', 'completa', 'aleatoria')
+
+
+def _proceso_isla(conexion, funcion_objetivo: Callable, semilla: int, parametros: dict) -> None:
+    """
+    Bucle de un proceso isla: mantiene su propio AlgoritmoGenetico y atiende órdenes.
+
+    Cada orden es una tupla (nombre, argumento) y siempre se responde con
+    ('ok', resultado) o ('error', traza).
+    """
+    np.random.seed(semilla)
+    algoritmo = AlgoritmoGenetico(funcion_objetivo, **parametros)
+
+    while True:
+        orden, argumento = conexion.recv()
+
+        if orden == 'terminar':
+            algoritmo.cerrar()
+            conexion.send(('ok', None))
+            break
+
+        try:
+            if orden == 'evolucionar':
+                algoritmo.evolucionar(argumento)
+                resultado = (algoritmo.mejor_fitness, algoritmo.generacion_actual)
+            elif orden == 'emigrantes':
+                resultado = algoritmo.obtener_mejores(argumento)
+            elif orden == 'inmigrantes':
+                resultado = algoritmo.recibir_inmigrantes(*argumento)
+            elif orden == 'estadisticas':
+                resultado = algoritmo.obtener_estadisticas()
+            else:
+                raise ValueError(f"Orden desconocida: {orden}")
+            conexion.send(('ok', resultado))
+        except Exception:
+            conexion.send(('error', traceback.format_exc()))
+
+
+class ModeloIslas:
+    """
+    Algoritmo genético paralelo por islas.
+
+    Cada isla es un AlgoritmoGenetico independiente que corre en su propio proceso con
+    los operadores y la semántica de paso_generacion habituales. Cada intervalo_migracion
+    generaciones, los mejores individuos de cada isla viajan a otras según la topología
+    y sustituyen a sus peores individuos.
+    """
+
+    def __init__(
+            self,
+            funcion_objetivo: Callable[[float], float],
+            n_islas: int = 4,
+            intervalo_migracion: int = 10,
+            n_migrantes: int = 2,
+            topologia: str = 'anillo',
+            semilla: Optional[int] = None,
+            **parametros
+    ):
+        """
+        Inicializa el modelo de islas (los procesos se arrancan en la primera evolución).
+
+        Args:
+            funcion_objetivo: Función a maximizar (debe poder serializarse con pickle)
+            n_islas: Número de islas (procesos)
+            intervalo_migracion: Generaciones entre migraciones
+            n_migrantes: Individuos que envía cada isla en cada migración
+            topologia: 'anillo' (a la siguiente isla), 'completa' (a todas las demás)
+                o 'aleatoria' (a otra isla elegida al azar en cada migración)
+            semilla: Semilla de la que se derivan las semillas de cada isla
+            **parametros: Parámetros de AlgoritmoGenetico comunes a todas las islas
+        """
+        if topologia not in TOPOLOGIAS:
+            raise ValueError(f"Topología desconocida: {topologia} (opciones: {', '.join(TOPOLOGIAS)})")
+
+        self.funcion_objetivo = funcion_objetivo
+        self.n_islas = n_islas
+        self.intervalo_migracion = intervalo_migracion
+        self.n_migrantes = n_migrantes
+        self.topologia = topologia
+        self.parametros = parametros
+
+        # Una semilla independiente por isla y otra para sortear los destinos
+        secuencias = np.random.SeedSequence(semilla).spawn(n_islas + 1)
+        self.semillas = [int(secuencia.generate_state(1)[0]) for secuencia in secuencias[:n_islas]]
+        self._generador_migracion = np.random.default_rng(secuencias[n_islas])
+
+        self.generacion_actual = 0
+        self.migraciones = 0
+        self._procesos = []
+        self._conexiones = []
+
+    def iniciar(self) -> None:
+        """Arranca los procesos de las islas si todavía no están en marcha."""
+        if self._procesos:
+            return
+
+        for semilla in self.semillas:
+            conexion_local, conexion_remota = multiprocessing.Pipe()
+            proceso = multiprocessing.Process(
+                target=_proceso_isla,
+                args=(conexion_remota, self.funcion_objetivo, semilla, self.parametros),
+                daemon=True
+            )
+            proceso.start()
+            self._procesos.append(proceso)
+            self._conexiones.append(conexion_local)
+
+    def _enviar(self, ordenes: List[Tuple[str, object]]) -> List:
+        """
+        Envía una orden a cada isla y espera todas las respuestas.
+
+        Args:
+            ordenes: Una orden (nombre, argumento) por isla
+
+        Returns:
+            Resultados de cada isla, en orden
+        """
+        self.iniciar()
+
+        for conexion, orden in zip(self._conexiones, ordenes):
+            conexion.send(orden)
+
+        resultados = []
+        for i, conexion in enumerate(self._conexiones):
+            estado, resultado = conexion.recv()
+            if estado == 'error':
+                raise RuntimeError(f"Error en la isla {i}:\n{resultado}")
+            resultados.append(resultado)
+
+        return resultados
+
+    def _destinos(self) -> Dict[int, List[int]]:
+        """
+        Calcula a qué islas envía migrantes cada isla según la topología.
+
+        Returns:
+            Diccionario isla de origen -> lista de islas de destino
+        """
+        if self.n_islas < 2:
+            return {}
+
+        if self.topologia == 'anillo':
+            return {i: [(i + 1) % self.n_islas] for i in range(self.n_islas)}
+
+        if self.topologia == 'completa':
+            return {i: [j for j in range(self.n_islas) if j != i] for i in range(self.n_islas)}
+
+        # Aleatoria: cada isla elige otra distinta de sí misma
+        desplazamientos = self._generador_migracion.integers(1, self.n_islas, size=self.n_islas)
+        return {i: [int((i + d) % self.n_islas)] for i, d in enumerate(desplazamientos)}
+
+    def migrar(self) -> None:
+        """Envía los mejores individuos de cada isla a sus islas de destino."""
+        emigrantes = self._enviar([('emigrantes', self.n_migrantes)] * self.n_islas)
+
+        llegadas = {i: [] for i in range(self.n_islas)}
+        for origen, destinos in self._destinos().items():
+            for destino in destinos:
+                llegadas[destino].append(emigrantes[origen])
+
+        ordenes = []
+        for destino in range(self.n_islas):
+            if llegadas[destino]:
+                individuos = np.vstack([individuos for individuos, _ in llegadas[destino]])
+                fitness = np.concatenate([fitness for _, fitness in llegadas[destino]])
+                ordenes.append(('inmigrantes', (individuos, fitness)))
+            else:
+                ordenes.append(('inmigrantes', (np.zeros((0, 0), dtype=int), np.zeros(0))))
+
+        self._enviar(ordenes)
+        self.migraciones += 1
+
+    def evolucionar(self, generaciones: Optional[int] = None) -> Tuple[np.ndarray, float, float]:
+        """
+        Evoluciona todas las islas en paralelo, migrando cada intervalo_migracion generaciones.
+
+        Args:
+            generaciones: Número de generaciones (si es None, usa max_generaciones)
+
+        Returns:
+            Mejor individuo global, su valor de fitness y su valor real
+        """
+        if generaciones is None:
+            generaciones = self.parametros.get('max_generaciones', 50)
+
+        restantes = generaciones
+        while restantes > 0:
+            # Evolucionar hasta la próxima migración
+            hasta_migracion = self.intervalo_migracion - self.generacion_actual % self.intervalo_migracion
+            pasos = min(restantes, hasta_migracion)
+            self._enviar([('evolucionar', pasos)] * self.n_islas)
+            self.generacion_actual += pasos
+            restantes -= pasos
+
+            if self.generacion_actual % self.intervalo_migracion == 0:
+                self.migrar()
+
+        estadisticas = self.obtener_estadisticas()
+        return (
+            estadisticas['mejor_solucion_binaria'],
+            estadisticas['mejor_fitness'],
+            estadisticas['mejor_valor_real']
+        )
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene el mejor resultado global y las estadísticas de cada isla.
+
+        Returns:
+            Diccionario con el mejor global y la lista 'islas' con las estadísticas de
+            cada isla (las mismas que AlgoritmoGenetico.obtener_estadisticas)
+        """
+        islas = self._enviar([('estadisticas', None)] * self.n_islas)
+        isla_mejor = int(np.argmax([estadisticas['mejor_fitness'] for estadisticas in islas]))
+        mejor = islas[isla_mejor]
+
+        return {
+            'islas': islas,
+            'isla_mejor': isla_mejor,
+            'generacion_actual': self.generacion_actual,
+            'migraciones': self.migraciones,
+            'mejor_solucion_binaria': mejor['mejor_solucion_binaria'],
+            'mejor_fitness': mejor['mejor_fitness'],
+            'mejor_valor_real': mejor['mejor_valor_real']
+        }
+
+    def cerrar(self) -> None:
+        """Termina los procesos de las islas."""
+        for conexion in self._conexiones:
+            try:
+                conexion.send(('terminar', None))
+                conexion.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+
+        for proceso in self._procesos:
+            proceso.join(timeout=5)
+            if proceso.is_alive():
+                proceso.terminate()
+
+        self._procesos = []
+        self._conexiones = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
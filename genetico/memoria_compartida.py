@@ -0,0 +1,325 @@
+import sys
+import time
+import weakref
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Tuple
+
+from genetico.empaquetado import binario_a_real_empaquetada
+from genetico.evaluacion import EvaluadorProcesos, evaluar_valores
+from genetico.utils import binario_a_real_poblacion
+
+# Descriptor de un array compartido: (nombre del segmento, forma, dtype)
+Descriptor = Tuple[str, Tuple[int, ...], str]
+
+
+def _liberar_segmento(segmento: shared_memory.SharedMemory, propietario: bool) -> None:
+    """
+    Cierra un segmento de memoria compartida y, si este proceso lo creó, lo elimina.
+
+    Args:
+        segmento: Segmento a liberar
+        propietario: Si este proceso creó el segmento
+    """
+    try:
+        segmento.close()
+    except BufferError:
+        # Todavía hay vistas vivas del segmento; la memoria se libera cuando desaparezcan
+        pass
+
+    if propietario:
+        try:
+            segmento.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ArrayCompartido:
+    """
+    Array de NumPy respaldado por un segmento de multiprocessing.shared_memory.
+
+    El proceso que lo crea es su propietario y elimina el segmento al llamar a cerrar(),
+    al ser recolectado o al terminar el intérprete (también si la ejecución se aborta
+    con una excepción). Los demás procesos se adjuntan con su descriptor sin copiar datos.
+    """
+
+    def __init__(self, segmento: shared_memory.SharedMemory, forma: Tuple[int, ...], dtype, propietario: bool):
+        """
+        Envuelve un segmento ya creado o adjuntado (usar crear() o adjuntar()).
+
+        Args:
+            segmento: Segmento de memoria compartida
+            forma: Forma del array
+            dtype: Tipo de dato del array
+            propietario: Si este proceso creó el segmento
+        """
+        self.segmento = segmento
+        self.propietario = propietario
+        self.array = np.ndarray(forma, dtype=dtype, buffer=segmento.buf)
+        self._finalizador = weakref.finalize(self, _liberar_segmento, segmento, propietario)
+
+    @classmethod
+    def crear(cls, forma: Tuple[int, ...], dtype) -> 'ArrayCompartido':
+        """
+        Crea un nuevo array compartido (sin inicializar).
+
+        Args:
+            forma: Forma del array
+            dtype: Tipo de dato del array
+
+        Returns:
+            Array compartido propiedad de este proceso
+        """
+        n_bytes = int(np.prod(forma)) * np.dtype(dtype).itemsize
+        segmento = shared_memory.SharedMemory(create=True, size=max(1, n_bytes))
+        return cls(segmento, tuple(forma), dtype, propietario=True)
+
+    @classmethod
+    def adjuntar(cls, descriptor: Descriptor) -> 'ArrayCompartido':
+        """
+        Se adjunta a un array compartido creado por otro proceso.
+
+        Args:
+            descriptor: Descriptor devuelto por el método descriptor() del propietario
+
+        Returns:
+            Array compartido (vista sin copia de los mismos datos)
+        """
+        nombre, forma, dtype = descriptor
+        if sys.version_info >= (3, 13):
+            segmento = shared_memory.SharedMemory(name=nombre, track=False)
+        else:
+            segmento = shared_memory.SharedMemory(name=nombre)
+        return cls(segmento, tuple(forma), dtype, propietario=False)
+
+    def descriptor(self) -> Descriptor:
+        """
+        Obtiene lo necesario para que otro proceso se adjunte al array.
+
+        Returns:
+            Nombre del segmento, forma y dtype
+        """
+        return self.segmento.name, self.array.shape, self.array.dtype.str
+
+    def cerrar(self) -> None:
+        """Libera el segmento (y lo elimina si este proceso es su propietario)."""
+        self.array = None
+        self._finalizador()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# Arrays compartidos adjuntados por cada trabajador al arrancar
+_valores_trabajador = None
+_fitness_trabajador = None
+
+# Segmentos de poblaciones adjuntados por cada trabajador bajo demanda, por nombre
+_segmentos_trabajador = OrderedDict()
+
+# Número máximo de segmentos que un trabajador mantiene adjuntados
+MAX_SEGMENTOS_TRABAJADOR = 16
+
+
+def _adjuntar_trabajador(descriptor_valores: Descriptor, descriptor_fitness: Descriptor) -> None:
+    """Inicializador de los trabajadores: se adjuntan una sola vez a los buffers compartidos."""
+    global _valores_trabajador, _fitness_trabajador
+    _valores_trabajador = ArrayCompartido.adjuntar(descriptor_valores)
+    _fitness_trabajador = ArrayCompartido.adjuntar(descriptor_fitness)
+
+
+def _evaluar_rango(funcion: Callable, inicio: int, fin: int, vectorizada: bool) -> None:
+    """Evalúa los valores [inicio, fin) del buffer compartido y escribe su fitness en el lugar."""
+    _fitness_trabajador.array[inicio:fin] = evaluar_valores(
+        funcion,
+        _valores_trabajador.array[inicio:fin],
+        vectorizada
+    )
+
+
+def _adjuntar_segmento(descriptor: Descriptor) -> np.ndarray:
+    """
+    Devuelve el array de un segmento compartido, adjuntándose a él la primera vez.
+
+    Args:
+        descriptor: Descriptor del array compartido
+
+    Returns:
+        Array respaldado por el segmento
+    """
+    nombre = descriptor[0]
+    compartido = _segmentos_trabajador.get(nombre)
+
+    if compartido is None:
+        compartido = ArrayCompartido.adjuntar(descriptor)
+        _segmentos_trabajador[nombre] = compartido
+        # Soltar los segmentos usados hace más tiempo (de algoritmos que ya no existen)
+        while len(_segmentos_trabajador) > MAX_SEGMENTOS_TRABAJADOR:
+            _segmentos_trabajador.popitem(last=False)[1].cerrar()
+    else:
+        _segmentos_trabajador.move_to_end(nombre)
+
+    return compartido.array
+
+
+def _evaluar_filas(
+        funcion: Callable,
+        descriptor_poblacion: Descriptor,
+        descriptor_fitness: Descriptor,
+        inicio: int,
+        fin: int,
+        decodificacion: Tuple[float, float, int, bool],
+        vectorizada: bool
+) -> None:
+    """Decodifica y evalúa las filas [inicio, fin) de una población compartida y escribe su fitness en el lugar."""
+    rango_min, rango_max, bits, empaquetado = decodificacion
+    decodificar = binario_a_real_empaquetada if empaquetado else binario_a_real_poblacion
+
+    filas = _adjuntar_segmento(descriptor_poblacion)[inicio:fin]
+    _adjuntar_segmento(descriptor_fitness)[inicio:fin] = evaluar_valores(
+        funcion,
+        decodificar(filas, rango_min, rango_max, bits),
+        vectorizada
+    )
+
+
+class EvaluadorMemoriaCompartida(EvaluadorProcesos):
+    """
+    Evaluador con pool de procesos que intercambia los datos por memoria compartida.
+
+    Los trabajadores se adjuntan a los buffers de valores y de fitness al arrancar; en
+    cada generación el proceso principal solo les envía rangos de índices, y cada
+    trabajador lee y escribe su porción sin copias ni serialización de arrays.
+
+    Con AlgoritmoGenetico(memoria_compartida=True) ni siquiera se copian los valores:
+    evaluar_filas hace que los trabajadores decodifiquen las filas de la población
+    compartida y escriban su fitness directamente en la arena del algoritmo.
+    """
+
+    def __init__(
+            self,
+            n_trabajadores: Optional[int] = None,
+            tamano_bloque: Optional[int] = None,
+            duracion_bloque: float = 0.05,
+            capacidad: int = 1024
+    ):
+        """
+        Inicializa el evaluador.
+
+        Args:
+            n_trabajadores: Número de trabajadores (si es None, uno por CPU)
+            tamano_bloque: Valores por bloque fijo (si es None, se adapta al coste por valor)
+            duracion_bloque: Duración deseada de cada bloque en segundos al adaptar su tamaño
+            capacidad: Número inicial de valores de los buffers (crecen si hace falta)
+        """
+        super().__init__(n_trabajadores, tamano_bloque, duracion_bloque)
+        self.capacidad = capacidad
+        self._valores = None
+        self._fitness = None
+
+    def _crear_ejecutor(self) -> Executor:
+        """Crea los buffers compartidos y un pool cuyos trabajadores se adjuntan a ellos."""
+        self._valores = ArrayCompartido.crear((self.capacidad,), np.float64)
+        self._fitness = ArrayCompartido.crear((self.capacidad,), np.float64)
+        return ProcessPoolExecutor(
+            max_workers=self.n_trabajadores,
+            initializer=_adjuntar_trabajador,
+            initargs=(self._valores.descriptor(), self._fitness.descriptor())
+        )
+
+    def evaluar(self, funcion: Callable, valores: np.ndarray, vectorizada: bool) -> np.ndarray:
+        """
+        Evalúa la función objetivo sobre un conjunto de valores reales en los trabajadores.
+
+        Args:
+            funcion: Función objetivo
+            valores: Array con los valores reales a evaluar
+            vectorizada: Si la función acepta el array completo en una sola llamada
+
+        Returns:
+            Array con los valores de fitness, en el mismo orden que los valores
+        """
+        n_valores = len(valores)
+
+        if n_valores == 0:
+            return np.zeros(0)
+
+        # Si los buffers se quedan pequeños, recrearlos junto con el pool
+        if n_valores > self.capacidad:
+            self.cerrar()
+            self.capacidad = max(n_valores, 2 * self.capacidad)
+
+        if self._ejecutor is None:
+            self._ejecutor = self._crear_ejecutor()
+
+        self._valores.array[:n_valores] = valores
+        tamano = self._calcular_tamano_bloque(n_valores)
+        inicio = time.perf_counter()
+
+        futuros = [
+            self._ejecutor.submit(_evaluar_rango, funcion, i, min(i + tamano, n_valores), vectorizada)
+            for i in range(0, n_valores, tamano)
+        ]
+        self._medir_bloques(futuros, n_valores, inicio)
+
+        return self._fitness.array[:n_valores].copy()
+
+    def evaluar_filas(
+            self,
+            funcion: Callable,
+            descriptor_poblacion: Descriptor,
+            descriptor_fitness: Descriptor,
+            inicio: int,
+            fin: int,
+            decodificacion: Tuple[float, float, int, bool],
+            vectorizada: bool
+    ) -> None:
+        """
+        Evalúa las filas [inicio, fin) de una población guardada en memoria compartida.
+
+        Cada trabajador se adjunta a los segmentos la primera vez que los ve, decodifica
+        su rango de filas y escribe el fitness en el segmento de fitness, en las mismas
+        filas; el proceso principal solo envía índices.
+
+        Args:
+            funcion: Función objetivo
+            descriptor_poblacion: Descriptor de la matriz de individuos (binaria o empaquetada)
+            descriptor_fitness: Descriptor del array de fitness (mismo número de filas)
+            inicio: Primera fila a evaluar
+            fin: Fila siguiente a la última
+            decodificacion: Rango mínimo, rango máximo, bits y si los individuos están empaquetados
+            vectorizada: Si la función acepta el array completo en una sola llamada
+        """
+        n_valores = fin - inicio
+
+        if n_valores <= 0:
+            return
+
+        if self._ejecutor is None:
+            self._ejecutor = self._crear_ejecutor()
+
+        tamano = self._calcular_tamano_bloque(n_valores)
+        inicio_envio = time.perf_counter()
+
+        futuros = [
+            self._ejecutor.submit(
+                _evaluar_filas, funcion, descriptor_poblacion, descriptor_fitness,
+                i, min(i + tamano, fin), decodificacion, vectorizada
+            )
+            for i in range(inicio, fin, tamano)
+        ]
+        self._medir_bloques(futuros, n_valores, inicio_envio)
+
+    def cerrar(self) -> None:
+        """Detiene el pool y libera los buffers compartidos."""
+        super().cerrar()
+        for buffer in (self._valores, self._fitness):
+            if buffer is not None:
+                buffer.cerrar()
+        self._valores = None
+        self._fitness = None
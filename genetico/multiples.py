@@ -0,0 +1,373 @@
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+
+from genetico.cache import construir_tabla_fitness
+from genetico.evaluacion import detectar_vectorizacion, evaluar_valores
+from genetico.operadores import cruza_dos_puntos_poblacion, mutacion_complemento_inplace
+from genetico.utils import (
+    contar_bits_valor_real,
+    binario_a_real_poblacion,
+    binario_a_decimal_poblacion,
+    calcular_estadisticas_convergencia
+)
+
+
+class EjecucionesMultiples:
+    """
+    Evoluciona R poblaciones independientes de la misma configuración en un único array.
+
+    Las poblaciones se guardan como un array (R, n, bits) y cada etapa de la generación
+    (emparejamiento, cruza, mutación, evaluación y poda elitista) se aplica a todas las
+    ejecuciones con una sola operación vectorizada. La semántica de cada ejecución es
+    la de AlgoritmoGenetico.paso_generacion.
+    """
+
+    def __init__(
+            self,
+            funcion_objetivo: Callable[[float], float],
+            n_ejecuciones: int = 100,
+            rango_min: float = 10.60,
+            rango_max: float = 18.20,
+            precision: float = 0.04,
+            tamano_poblacion: int = 100,
+            tasa_mutacion_individuo: float = 0.3,
+            tasa_mutacion_gen: float = 0.1,
+            max_generaciones: int = 50,
+            factor_crecimiento: float = 1.5,
+            n_elites: int = 1,
+            evaluacion_vectorizada: Optional[bool] = None,
+            umbral_tabla_fitness: int = 2 ** 16
+    ):
+        """
+        Inicializa las ejecuciones.
+
+        Args:
+            funcion_objetivo: Función a maximizar
+            n_ejecuciones: Número de ejecuciones independientes (R)
+            rango_min: Valor mínimo del rango
+            rango_max: Valor máximo del rango
+            precision: Precisión requerida
+            tamano_poblacion: Número de individuos de cada población
+            tasa_mutacion_individuo: Umbral PMI (porcentaje de mutación del individuo)
+            tasa_mutacion_gen: Umbral PMG (porcentaje de mutación del gen)
+            max_generaciones: Número máximo de generaciones
+            factor_crecimiento: Factor de crecimiento de la población tras cruza
+            n_elites: Número de mejores individuos que la poda conserva siempre
+            evaluacion_vectorizada: Si la función objetivo acepta arrays (si es None, se detecta)
+            umbral_tabla_fitness: Si 2**bits no supera este valor, se precalcula el fitness
+                de todos los genotipos (0 lo desactiva)
+        """
+        self.funcion_objetivo = funcion_objetivo
+        self.n_ejecuciones = n_ejecuciones
+        self.rango_min = rango_min
+        self.rango_max = rango_max
+        self.precision = precision
+        self.tamano_poblacion = tamano_poblacion
+        self.tasa_mutacion_individuo = tasa_mutacion_individuo
+        self.tasa_mutacion_gen = tasa_mutacion_gen
+        self.max_generaciones = max_generaciones
+        self.factor_crecimiento = factor_crecimiento
+        self.n_elites = max(1, min(n_elites, tamano_poblacion))
+        self.evaluacion_vectorizada = evaluacion_vectorizada
+
+        # Calcular bits necesarios
+        self.bits = contar_bits_valor_real(rango_min, rango_max, precision)
+
+        self.usar_tabla_fitness = 0 < 2 ** self.bits <= umbral_tabla_fitness
+        self.tabla_fitness = None
+        self.evaluaciones = 0
+
+        # Crear las poblaciones iniciales (R, n, bits)
+        self.poblaciones = np.random.randint(2, size=(n_ejecuciones, tamano_poblacion, self.bits)).astype(np.uint8)
+        self.fitness = None
+
+        # Historiales preasignados (R, capacidad): la columna g es la generación g. La
+        # capacidad inicial es max_generaciones y se duplica si se evoluciona más
+        capacidad = max(1, max_generaciones)
+        self._mejor_fitness_historico = np.empty((n_ejecuciones, capacidad))
+        self._fitness_promedio_historico = np.empty((n_ejecuciones, capacidad))
+        self._mejor_individuo_historico = np.empty((n_ejecuciones, capacidad))
+        self.generacion_actual = 0
+
+        # Mejor solución de cada ejecución
+        self.mejores_soluciones = np.zeros((n_ejecuciones, self.bits), dtype=np.uint8)
+        self.mejores_fitness = np.full(n_ejecuciones, -np.inf)
+
+    def _evaluar(self, individuos: np.ndarray) -> np.ndarray:
+        """
+        Evalúa individuos de cualquier forma (..., bits) en una sola llamada.
+
+        Args:
+            individuos: Array binario cuya última dimensión son los genes
+
+        Returns:
+            Array de fitness con la forma de individuos sin la última dimensión
+        """
+        forma = individuos.shape[:-1]
+        planos = individuos.reshape(-1, self.bits)
+
+        if self.usar_tabla_fitness:
+            if self.tabla_fitness is None:
+                self.tabla_fitness = construir_tabla_fitness(
+                    self._evaluar_valores,
+                    self.rango_min,
+                    self.rango_max,
+                    self.bits
+                )
+            return self.tabla_fitness[binario_a_decimal_poblacion(planos)].reshape(forma)
+
+        valores_reales = binario_a_real_poblacion(planos, self.rango_min, self.rango_max, self.bits)
+        return self._evaluar_valores(valores_reales).reshape(forma)
+
+    def _evaluar_valores(self, valores_reales: np.ndarray) -> np.ndarray:
+        """
+        Evalúa la función objetivo sobre un conjunto de valores reales.
+
+        Args:
+            valores_reales: Array con los valores reales a evaluar
+
+        Returns:
+            Array con los valores de fitness
+        """
+        if self.evaluacion_vectorizada is None:
+            self.evaluacion_vectorizada = detectar_vectorizacion(self.funcion_objetivo, valores_reales)
+
+        self.evaluaciones += len(valores_reales)
+        return evaluar_valores(self.funcion_objetivo, valores_reales, self.evaluacion_vectorizada)
+
+    def _registrar_historial(
+            self,
+            mejor_fitness: np.ndarray,
+            fitness_promedio: np.ndarray,
+            mejor_valor_real: np.ndarray
+    ) -> None:
+        """
+        Escribe las estadísticas de la generación actual en la columna que le corresponde.
+
+        Args:
+            mejor_fitness: Mejor fitness de cada ejecución
+            fitness_promedio: Fitness promedio de cada ejecución
+            mejor_valor_real: Valor real del mejor individuo de cada ejecución
+        """
+        generacion = self.generacion_actual
+
+        # Duplicar la capacidad de los historiales si están llenos
+        if generacion == self._mejor_fitness_historico.shape[1]:
+            for nombre in ('_mejor_fitness_historico', '_fitness_promedio_historico', '_mejor_individuo_historico'):
+                actual = getattr(self, nombre)
+                nuevo = np.empty((self.n_ejecuciones, 2 * actual.shape[1]))
+                nuevo[:, :generacion] = actual
+                setattr(self, nombre, nuevo)
+
+        self._mejor_fitness_historico[:, generacion] = mejor_fitness
+        self._fitness_promedio_historico[:, generacion] = fitness_promedio
+        self._mejor_individuo_historico[:, generacion] = mejor_valor_real
+
+    def _podar(self, poblaciones: np.ndarray, fitness: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce cada población al tamaño original conservando a sus élites y eligiendo
+        al resto al azar sin reemplazo.
+
+        A cada individuo se le asigna una clave aleatoria (las élites, la mínima) y se
+        conservan los de menor clave, lo que equivale a un muestreo uniforme sin reemplazo.
+
+        Args:
+            poblaciones: Array (R, m, bits) con padres e hijos
+            fitness: Array (R, m) con su fitness
+
+        Returns:
+            Poblaciones (R, n, bits) y fitness (R, n) supervivientes
+        """
+        tamano_combinado = fitness.shape[1]
+        if tamano_combinado <= self.tamano_poblacion:
+            return poblaciones, fitness
+
+        claves = np.random.random(fitness.shape)
+        if self.n_elites == 1:
+            idx_elites = np.argmax(fitness, axis=1)[:, np.newaxis]
+        else:
+            idx_elites = np.argpartition(-fitness, self.n_elites - 1, axis=1)[:, :self.n_elites]
+        np.put_along_axis(claves, idx_elites, -1.0, axis=1)
+
+        indices = np.argpartition(claves, self.tamano_poblacion - 1, axis=1)[:, :self.tamano_poblacion]
+
+        return (
+            np.take_along_axis(poblaciones, indices[:, :, np.newaxis], axis=1),
+            np.take_along_axis(fitness, indices, axis=1)
+        )
+
+    def paso_generacion(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ejecuta una generación en todas las ejecuciones a la vez.
+
+        Returns:
+            Arrays (R,) con el mejor fitness y el fitness promedio, y (R, bits) con el mejor
+            individuo de cada ejecución
+        """
+        n_ejecuciones, tamano, bits = self.poblaciones.shape
+        ejecuciones = np.arange(n_ejecuciones)
+
+        # Evaluar las poblaciones solo si su fitness no viene de la generación anterior
+        if self.fitness is None:
+            self.fitness = self._evaluar(self.poblaciones)
+        fitness = self.fitness
+
+        # Mejor individuo de cada ejecución
+        idx_mejor = np.argmax(fitness, axis=1)
+        mejor_fitness = fitness[ejecuciones, idx_mejor]
+        mejor_individuo = self.poblaciones[ejecuciones, idx_mejor]
+
+        # Actualizar la mejor solución de las ejecuciones que mejoran
+        mejoran = mejor_fitness > self.mejores_fitness
+        self.mejores_soluciones[mejoran] = mejor_individuo[mejoran]
+        self.mejores_fitness[mejoran] = mejor_fitness[mejoran]
+
+        # Guardar estadísticas
+        fitness_promedio = np.mean(fitness, axis=1)
+        self._registrar_historial(
+            mejor_fitness,
+            fitness_promedio,
+            binario_a_real_poblacion(mejor_individuo, self.rango_min, self.rango_max, self.bits)
+        )
+
+        # Emparejamiento: el individuo i de cada ejecución con otro al azar de la misma
+        n_hijos = min(2 * tamano, int(tamano * 2 * self.factor_crecimiento))
+        n_parejas = (n_hijos + 1) // 2
+        companeros = np.random.randint(0, tamano, size=(n_ejecuciones, n_parejas))
+
+        # Cruza de todas las parejas de todas las ejecuciones a la vez
+        padres1 = self.poblaciones[:, :n_parejas]
+        padres2 = np.take_along_axis(self.poblaciones, companeros[:, :, np.newaxis], axis=1)
+        hijos = cruza_dos_puntos_poblacion(
+            padres1.reshape(-1, bits),
+            padres2.reshape(-1, bits)
+        ).reshape(n_ejecuciones, 2 * n_parejas, bits)
+        hijos = np.ascontiguousarray(hijos[:, :n_hijos])
+
+        # Mutación en el lugar sobre todos los hijos
+        mutacion_complemento_inplace(
+            hijos.reshape(-1, bits),
+            self.tasa_mutacion_individuo,
+            self.tasa_mutacion_gen
+        )
+
+        # Evaluar todos los hijos con una sola llamada
+        fitness_hijos = self._evaluar(hijos)
+
+        # Combinar padres e hijos y podar
+        self.poblaciones, self.fitness = self._podar(
+            np.concatenate([self.poblaciones, hijos], axis=1),
+            np.concatenate([fitness, fitness_hijos], axis=1)
+        )
+
+        self.generacion_actual += 1
+
+        return mejor_fitness, fitness_promedio, mejor_individuo
+
+    def evolucionar(self, pasos: int = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ejecuta todas las ejecuciones durante un número de generaciones.
+
+        Args:
+            pasos: Número de pasos de evolución (si es None, usa max_generaciones)
+
+        Returns:
+            Mejor individuo, su fitness y su valor real para cada ejecución
+        """
+        if pasos is None:
+            pasos = self.max_generaciones
+
+        for _ in range(pasos):
+            self.paso_generacion()
+
+        mejores_valores = binario_a_real_poblacion(
+            self.mejores_soluciones,
+            self.rango_min,
+            self.rango_max,
+            self.bits
+        )
+
+        return self.mejores_soluciones, self.mejores_fitness, mejores_valores
+
+    def obtener_estadisticas(self, ejecucion: Optional[int] = None) -> dict:
+        """
+        Obtiene estadísticas del proceso evolutivo.
+
+        Los historiales se devuelven como vistas de los arrays internos, sin copiarlos.
+        No hay caché de fitness ni instrumentación, así que aciertos_cache y fallos_cache
+        valen 0 e instrumentacion es None; la diversidad no se registra (historial vacío).
+
+        Args:
+            ejecucion: Índice de una ejecución concreta; si es None se devuelven todas
+
+        Returns:
+            Diccionario con las mismas claves y tipos que AlgoritmoGenetico.obtener_estadisticas.
+            Para una ejecución los valores son los de esa ejecución (sus evaluaciones son
+            las totales repartidas entre las ejecuciones, ya que la tabla de fitness es
+            común); para todas, los historiales son arrays (R, generaciones), el resto
+            arrays (R,) o (R, bits) y convergencia una lista con un diccionario por ejecución
+        """
+        generaciones = self.generacion_actual
+        mejor_fitness_historico = self._mejor_fitness_historico[:, :generaciones]
+        fitness_promedio_historico = self._fitness_promedio_historico[:, :generaciones]
+        mejor_individuo_historico = self._mejor_individuo_historico[:, :generaciones]
+
+        mejores_valores = binario_a_real_poblacion(
+            self.mejores_soluciones,
+            self.rango_min,
+            self.rango_max,
+            self.bits
+        )
+
+        if ejecucion is None:
+            return {
+                'mejor_fitness_historico': mejor_fitness_historico,
+                'fitness_promedio_historico': fitness_promedio_historico,
+                'mejor_individuo_historico': mejor_individuo_historico,
+                'diversidad_historico': np.zeros((self.n_ejecuciones, 0)),
+                'generaciones_historico': np.arange(generaciones),
+                'generacion_actual': generaciones,
+                'mejor_solucion_binaria': self.mejores_soluciones,
+                'mejor_fitness': self.mejores_fitness,
+                'mejor_valor_real': mejores_valores,
+                'aciertos_cache': 0,
+                'fallos_cache': 0,
+                'evaluaciones': self.evaluaciones,
+                'convergencia': [
+                    calcular_estadisticas_convergencia(mejor_fitness_historico[r], fitness_promedio_historico[r])
+                    for r in range(self.n_ejecuciones)
+                ],
+                'instrumentacion': None
+            }
+
+        # Igual que AlgoritmoGenetico: sin solución hasta completar la primera generación
+        hay_solucion = generaciones > 0
+
+        return {
+            'mejor_fitness_historico': mejor_fitness_historico[ejecucion],
+            'fitness_promedio_historico': fitness_promedio_historico[ejecucion],
+            'mejor_individuo_historico': mejor_individuo_historico[ejecucion],
+            'diversidad_historico': np.zeros(0),
+            'generaciones_historico': np.arange(generaciones),
+            'generacion_actual': generaciones,
+            'mejor_solucion_binaria': self.mejores_soluciones[ejecucion].astype(int) if hay_solucion else None,
+            'mejor_fitness': self.mejores_fitness[ejecucion],
+            'mejor_valor_real': mejores_valores[ejecucion] if hay_solucion else None,
+            'aciertos_cache': 0,
+            'fallos_cache': 0,
+            'evaluaciones': self.evaluaciones // self.n_ejecuciones,
+            'convergencia': calcular_estadisticas_convergencia(
+                mejor_fitness_historico[ejecucion],
+                fitness_promedio_historico[ejecucion]
+            ),
+            'instrumentacion': None
+        }
+
+    def obtener_estadisticas_ejecuciones(self) -> List[dict]:
+        """
+        Obtiene las estadísticas de cada ejecución por separado.
+
+        Returns:
+            Lista con un diccionario por ejecución
+        """
+        return [self.obtener_estadisticas(r) for r in range(self.n_ejecuciones)]
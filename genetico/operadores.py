@@ -1,8 +1,8 @@
 import numpy as np
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 
-def emparejamiento_aleatorio(poblacion: np.ndarray) -> List[Tuple[int, int]]:
+def emparejamiento_aleatorio(poblacion: np.ndarray) -> np.ndarray:
     """
     Cada individuo genera una pareja con otro individuo aleatorio, incluyéndose a sí mismo.
 
@@ -10,15 +10,14 @@ def emparejamiento_aleatorio(poblacion: np.ndarray) -> List[Tuple[int, int]]:
         poblacion: Población binaria
 
     Returns:
-        Lista de parejas (tuplas de índices)
+        Array (n, 2) de índices: la fila i contiene el individuo i y su pareja
     """
     tam_poblacion = len(poblacion)
-    parejas = []
+    parejas = np.empty((tam_poblacion, 2), dtype=np.intp)
 
-    for i in range(tam_poblacion):
-        # Seleccionar otro individuo aleatorio (puede ser el mismo)
-        j = np.random.randint(0, tam_poblacion)
-        parejas.append((i, j))
+    parejas[:, 0] = np.arange(tam_poblacion)
+    # Seleccionar otro individuo aleatorio para cada uno (puede ser el mismo)
+    parejas[:, 1] = np.random.randint(0, tam_poblacion, size=tam_poblacion)
 
     return parejas
 
@@ -59,54 +58,183 @@ def cruza_dos_puntos(padre1: np.ndarray, padre2: np.ndarray) -> Tuple[np.ndarray
     return hijo1, hijo2
 
 
-def mutacion_complemento(
+def sortear_puntos_cruza(n_parejas: int, longitud: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sortea dos puntos de cruza distintos en [1, longitud - 1] para cada pareja.
+
+    Args:
+        n_parejas: Número de parejas
+        longitud: Longitud en bits de los individuos (mayor que 2)
+
+    Returns:
+        Inicio y fin (exclusivo) del segmento central de cada pareja
+    """
+    punto1 = np.random.randint(1, longitud, size=n_parejas)
+    punto2 = np.random.randint(1, longitud - 1, size=n_parejas)
+    punto2 += punto2 >= punto1
+    return np.minimum(punto1, punto2), np.maximum(punto1, punto2)
+
+
+def cruza_dos_puntos_poblacion(
+        padres1: np.ndarray,
+        padres2: np.ndarray,
+        salida: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Realiza la cruza de dos puntos sobre todas las parejas a la vez.
+
+    Los puntos de corte de cada pareja se sortean igual que en cruza_dos_puntos y
+    los hijos se construyen con una máscara sobre las matrices de padres.
+
+    Args:
+        padres1: Matriz (m, bits) con el primer padre de cada pareja
+        padres2: Matriz (m, bits) con el segundo padre de cada pareja
+        salida: Matriz (2m, bits) donde escribir los hijos (opcional)
+
+    Returns:
+        Matriz (2m, bits) con los hijos; los de la pareja i ocupan las filas 2i y 2i + 1
+    """
+    n_parejas, longitud = padres1.shape
+
+    if salida is None:
+        salida = np.empty((2 * n_parejas, longitud), dtype=padres1.dtype)
+
+    hijos1 = salida[0::2]
+    hijos2 = salida[1::2]
+    np.copyto(hijos1, padres1)
+    np.copyto(hijos2, padres2)
+
+    # Asegurarse de que el tamaño sea suficiente para dos puntos de cruza
+    if longitud <= 2 or n_parejas == 0:
+        return salida
+
+    # Generar dos puntos de cruza distintos para cada pareja
+    inicio, fin = sortear_puntos_cruza(n_parejas, longitud)
+
+    # Intercambiar el segmento central de cada pareja
+    posiciones = np.arange(longitud)
+    mascara = (posiciones >= inicio[:, np.newaxis]) & (posiciones < fin[:, np.newaxis])
+    np.copyto(hijos1, padres2, where=mascara)
+    np.copyto(hijos2, padres1, where=mascara)
+
+    return salida
+
+
+def mutacion_complemento_inplace(
         poblacion: np.ndarray,
         pmi: float,
         pmg: float
 ) -> np.ndarray:
+    """
+    Aplica la mutación por complemento directamente sobre la población, sin copiarla.
+
+    Args:
+        poblacion: Población binaria (se modifica en el lugar)
+        pmi: Umbral PMI (porcentaje de mutación del individuo)
+        pmg: Umbral PMG (porcentaje de mutación del gen)
 
-    poblacion_mutada = poblacion.copy()
+    Returns:
+        La misma población, ya mutada
+    """
     tam_poblacion, longitud_individuo = poblacion.shape
 
-    for i in range(tam_poblacion):
-        # Decidir si el individuo muta
-        if np.random.random() > pmi:  # Solo mutan los que NO superan el umbral
-            # Para cada gen del individuo
-            for j in range(longitud_individuo):
-                # Decidir si el gen muta
-                if np.random.random() > pmg:  # Solo mutan los genes que NO superan el umbral
-                    # Complementar el valor del gen (0->1, 1->0)
-                    poblacion_mutada[i, j] = 1 - poblacion_mutada[i, j]
+    # Decidir qué individuos mutan (solo mutan los que NO superan el umbral)
+    individuos_mutan = np.flatnonzero(np.random.random(tam_poblacion) > pmi)
+    if len(individuos_mutan) == 0:
+        return poblacion
 
-    return poblacion_mutada
+    # Decidir qué genes de esos individuos mutan (solo mutan los que NO superan el umbral)
+    genes_mutan = np.random.random((len(individuos_mutan), longitud_individuo)) > pmg
 
+    # Complementar el valor de los genes (0->1, 1->0)
+    poblacion[individuos_mutan] ^= genes_mutan.astype(poblacion.dtype)
 
-def poda_aleatoria_conservando_mejor(
+    return poblacion
+
+
+def mutacion_complemento(
         poblacion: np.ndarray,
-        fitness: np.ndarray,
-        tamano_nueva_poblacion: int
-) -> Tuple[np.ndarray, np.ndarray]:
+        pmi: float,
+        pmg: float
+) -> np.ndarray:
+    """
+    Aplica la mutación por complemento sobre una copia de la población.
+
+    Args:
+        poblacion: Población binaria
+        pmi: Umbral PMI (porcentaje de mutación del individuo)
+        pmg: Umbral PMG (porcentaje de mutación del gen)
 
-    if len(poblacion) <= tamano_nueva_poblacion:
-        return poblacion, fitness
+    Returns:
+        Población mutada
+    """
+    return mutacion_complemento_inplace(poblacion.copy(), pmi, pmg)
 
-    # Encontrar el índice del mejor individuo
-    idx_mejor = np.argmax(fitness)
 
-    # Seleccionar índices aleatorios para conservar (excluyendo el mejor, que ya se conserva)
-    indices_disponibles = list(range(len(poblacion)))
-    indices_disponibles.remove(idx_mejor)
-    indices_a_conservar = np.random.choice(
-        indices_disponibles,
-        size=tamano_nueva_poblacion - 1,
-        replace=False
-    )
+def poda_aleatoria_conservando_mejor(
+        poblacion: np.ndarray,
+        fitness: np.ndarray,
+        tamano_nueva_poblacion: int,
+        n_elites: int = 1,
+        salida: Optional[np.ndarray] = None,
+        salida_fitness: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce la población conservando a los mejores y eligiendo al resto al azar sin reemplazo.
 
-    # Añadir el índice del mejor individuo
-    indices_a_conservar = np.append(indices_a_conservar, idx_mejor)
+    Args:
+        poblacion: Población binaria
+        fitness: Valores de fitness de la población
+        tamano_nueva_poblacion: Tamaño de la población resultante
+        n_elites: Número de mejores individuos que se conservan siempre
+        salida: Matriz donde escribir los supervivientes (opcional)
+        salida_fitness: Array donde escribir el fitness de los supervivientes (opcional)
 
-    # Crear nueva población y sus valores de fitness
-    nueva_poblacion = poblacion[indices_a_conservar]
-    nuevo_fitness = fitness[indices_a_conservar]
+    Returns:
+        Nueva población y sus valores de fitness
+    """
+    tam_poblacion = len(poblacion)
 
-    return nueva_poblacion, nuevo_fitness
\ No newline at end of file
+    if tam_poblacion <= tamano_nueva_poblacion:
+        if salida is None and salida_fitness is None:
+            return poblacion, fitness
+        indices_a_conservar = np.arange(tam_poblacion)
+    else:
+        n_elites = max(1, min(n_elites, tamano_nueva_poblacion))
+
+        # Encontrar los índices de los mejores individuos
+        if n_elites == 1:
+            idx_elites = np.array([np.argmax(fitness)])
+        else:
+            idx_elites = np.argpartition(fitness, tam_poblacion - n_elites)[tam_poblacion - n_elites:]
+
+        # Elegir al resto entre los índices que no son élite, numerados sin huecos
+        indices_a_conservar = np.empty(tamano_nueva_poblacion, dtype=np.intp)
+        muestra = indices_a_conservar[:tamano_nueva_poblacion - n_elites]
+        muestra[:] = np.random.choice(
+            tam_poblacion - n_elites,
+            size=tamano_nueva_poblacion - n_elites,
+            replace=False
+        )
+
+        # Saltar los huecos que dejan las élites para volver a los índices originales
+        elites_ordenadas = np.sort(idx_elites)
+        muestra += np.searchsorted(elites_ordenadas - np.arange(n_elites), muestra, side='right')
+
+        # Añadir los índices de las élites al final
+        indices_a_conservar[tamano_nueva_poblacion - n_elites:] = idx_elites
+
+    # Crear nueva población y sus valores de fitness (los índices ya son válidos: mode='clip' evita el buffer)
+    n_supervivientes = len(indices_a_conservar)
+
+    if salida is None:
+        nueva_poblacion = poblacion[indices_a_conservar]
+    else:
+        nueva_poblacion = np.take(poblacion, indices_a_conservar, axis=0, out=salida[:n_supervivientes], mode='clip')
+
+    if salida_fitness is None:
+        nuevo_fitness = fitness[indices_a_conservar]
+    else:
+        nuevo_fitness = np.take(fitness, indices_a_conservar, out=salida_fitness[:n_supervivientes], mode='clip')
+
+    return nueva_poblacion, nuevo_fitness
@@ -1,5 +1,6 @@
 import numpy as np
-from typing import Tuple, List
+from statistics import NormalDist
+from typing import Tuple, List, Optional
 
 
 def contar_bits_valor_real(rango_min: float, rango_max: float, precision: float) -> int:
@@ -98,6 +99,84 @@ def binario_a_real(individuo_binario: np.ndarray, rango_min: float, rango_max: f
     return valor_real
 
 
+def _pesos_binarios(bits: int) -> np.ndarray:
+    """
+    Calcula el peso de cada posición de un cromosoma (el bit más significativo primero).
+
+    Args:
+        bits: Número de bits del cromosoma
+
+    Returns:
+        Array con las potencias de dos (enteras si caben en 64 bits, reales si no)
+    """
+    exponentes = np.arange(bits - 1, -1, -1)
+    if bits <= 63:
+        return np.left_shift(np.int64(1), exponentes.astype(np.int64))
+    return np.power(2.0, exponentes)
+
+
+def binario_a_decimal_poblacion(poblacion: np.ndarray) -> np.ndarray:
+    """
+    Convierte todos los individuos binarios de una población a su valor decimal.
+
+    Args:
+        poblacion: Matriz (n, bits) con la representación binaria de cada individuo
+
+    Returns:
+        Array con el valor decimal de cada individuo
+    """
+    poblacion = np.asarray(poblacion)
+    pesos = _pesos_binarios(poblacion.shape[-1])
+    return poblacion.astype(pesos.dtype, copy=False) @ pesos
+
+
+def binario_a_real_poblacion(poblacion: np.ndarray, rango_min: float, rango_max: float, bits: int) -> np.ndarray:
+    """
+    Convierte todos los individuos binarios de una población a su valor real en una sola operación.
+
+    Args:
+        poblacion: Matriz (n, bits) con la representación binaria de cada individuo
+        rango_min: Valor mínimo del rango
+        rango_max: Valor máximo del rango
+        bits: Número de bits usados para la codificación
+
+    Returns:
+        Array con el valor real de cada individuo
+    """
+    valores_decimales = binario_a_decimal_poblacion(poblacion)
+    max_decimal = 2 ** bits - 1
+    return rango_min + (valores_decimales / max_decimal) * (rango_max - rango_min)
+
+
+def real_a_binario_poblacion(valores_reales: np.ndarray, rango_min: float, rango_max: float,
+                             bits: int) -> np.ndarray:
+    """
+    Convierte un conjunto de valores reales a su representación binaria en una sola operación.
+
+    Args:
+        valores_reales: Array con los valores reales a convertir
+        rango_min: Valor mínimo del rango
+        rango_max: Valor máximo del rango
+        bits: Número de bits para la representación (como máximo 63)
+
+    Returns:
+        Matriz (n, bits) con la representación binaria de cada valor
+    """
+    if bits > 63:
+        raise ValueError("La codificación por lotes admite como máximo 63 bits")
+
+    # Normalizar los valores reales al rango [0, 1]
+    valores_normalizados = (np.asarray(valores_reales, dtype=float) - rango_min) / (rango_max - rango_min)
+
+    # Convertir a valores decimales (truncando, igual que real_a_binario)
+    max_decimal = 2 ** bits - 1
+    valores_decimales = (valores_normalizados * max_decimal).astype(np.int64)
+
+    # Extraer los bits, el más significativo primero
+    desplazamientos = np.arange(bits - 1, -1, -1, dtype=np.int64)
+    return ((valores_decimales[:, np.newaxis] >> desplazamientos) & 1).astype(int)
+
+
 def imprimir_poblacion_info(poblacion: np.ndarray, fitness: np.ndarray, rango_min: float, rango_max: float,
                             bits: int) -> None:
     """
@@ -134,10 +213,37 @@ def imprimir_poblacion_info(poblacion: np.ndarray, fitness: np.ndarray, rango_mi
     print(f"Desviación estándar: {np.std(fitness):.6f}")
 
 
+def diversidad_hamming_desde_conteos(unos_por_columna: np.ndarray, n_individuos: int) -> float:
+    """
+    Calcula la distancia de Hamming promedio entre pares a partir del número de unos de cada gen.
+
+    En cada posición, los pares que difieren son los que combinan un uno y un cero,
+    es decir unos * (n - unos); sumando todas las posiciones se obtiene la distancia total.
+
+    Args:
+        unos_por_columna: Número de individuos con un 1 en cada posición
+        n_individuos: Número de individuos de la población
+
+    Returns:
+        Diversidad promedio (distancia de Hamming promedio entre pares de individuos)
+    """
+    if n_individuos <= 1:
+        return 0.0
+
+    unos_por_columna = np.asarray(unos_por_columna, dtype=np.int64)
+    distancia_total = np.sum(unos_por_columna * (n_individuos - unos_por_columna))
+    pares_comparados = n_individuos * (n_individuos - 1) // 2
+
+    return float(distancia_total / pares_comparados)
+
+
 def calcular_diversidad_hamming(poblacion: np.ndarray) -> float:
     """
     Calcula la diversidad de la población usando la distancia de Hamming.
 
+    El resultado es exacto y se obtiene contando los unos de cada gen, en tiempo
+    lineal en el tamaño de la población.
+
     Args:
         poblacion: Población binaria
 
@@ -149,17 +255,49 @@ def calcular_diversidad_hamming(poblacion: np.ndarray) -> float:
     if n_individuos <= 1:
         return 0.0
 
-    distancia_total = 0
-    pares_comparados = 0
+    return diversidad_hamming_desde_conteos(np.count_nonzero(poblacion, axis=0), n_individuos)
+
+
+def estimar_diversidad_hamming(
+        poblacion: np.ndarray,
+        n_muestras: int = 1000,
+        confianza: float = 0.95,
+        semilla: Optional[int] = None
+) -> Tuple[float, float, float]:
+    """
+    Estima la diversidad de la población muestreando pares de individuos al azar.
+
+    Usa un generador propio para no alterar la secuencia aleatoria de la evolución.
+
+    Args:
+        poblacion: Población binaria
+        n_muestras: Número de pares muestreados
+        confianza: Nivel de confianza del intervalo
+        semilla: Semilla del generador de muestreo (opcional)
+
+    Returns:
+        Diversidad estimada y límites inferior y superior del intervalo de confianza
+    """
+    n_individuos = len(poblacion)
+
+    if n_individuos <= 1:
+        return 0.0, 0.0, 0.0
 
-    for i in range(n_individuos):
-        for j in range(i + 1, n_individuos):
-            # Distancia de Hamming (número de bits diferentes)
-            distancia = np.sum(poblacion[i] != poblacion[j])
-            distancia_total += distancia
-            pares_comparados += 1
+    generador = np.random.default_rng(semilla)
 
-    return distancia_total / pares_comparados if pares_comparados > 0 else 0.0
+    # Pares (i, j) con i != j
+    i = generador.integers(0, n_individuos, size=n_muestras)
+    j = generador.integers(0, n_individuos - 1, size=n_muestras)
+    j += j >= i
+
+    distancias = np.count_nonzero(poblacion[i] != poblacion[j], axis=1)
+    estimacion = float(np.mean(distancias))
+
+    # Intervalo de confianza por aproximación normal
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+    margen = z * float(np.std(distancias, ddof=1)) / float(np.sqrt(n_muestras)) if n_muestras > 1 else np.inf
+
+    return estimacion, estimacion - margen, estimacion + margen
 
 
 def calcular_estadisticas_convergencia(
@@ -169,6 +307,9 @@ def calcular_estadisticas_convergencia(
     """
     Calcula estadísticas para analizar la convergencia del algoritmo.
 
+    Recorre todo el historial; para seguirla generación a generación, usar
+    genetico.convergencia.DetectorConvergencia, que da los mismos resultados.
+
     Args:
         mejor_fitness_historico: Lista con el mejor fitness de cada generación
         fitness_promedio_historico: Lista con el fitness promedio de cada generación
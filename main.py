@@ -1,15 +1,15 @@
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from genetico.algoritmo import AlgoritmoGenetico
 from funciones.objetivo import funcion_objetivo
-from visualizacion.graficador import graficar_evolucion, graficar_funcion
+from visualizacion.lienzos import LienzoEvolucion, LienzoFuncion
+from visualizacion.ejecutor import ControlEvolucion
 
 
-class AplicacionAG(tk.Tk):
+class AplicacionAG(ControlEvolucion, tk.Tk):
     def __init__(self):
         super().__init__()
 
@@ -17,6 +17,16 @@ class AplicacionAG(tk.Tk):
         self.geometry("1200x800")
         self.configure(background='white')
 
+        # Evolución en segundo plano (el cerrojo protege al algoritmo mientras avanza)
+        self.bloqueo = threading.Lock()
+        self.ejecutor = None
+        self.ultimo_redibujo = 0.0
+        self.protocol("WM_DELETE_WINDOW", self.cerrar)
+
+        # Gráficos persistentes (se crean en la primera actualización)
+        self.lienzo_evolucion = None
+        self.lienzo_funcion = None
+
         # Crear algoritmo genético con valores predeterminados
         self.algoritmo = AlgoritmoGenetico(
             funcion_objetivo=funcion_objetivo,
@@ -101,6 +111,10 @@ class AplicacionAG(tk.Tk):
         ttk.Button(buttons_frame, text="Inicializar", command=self.inicializar).pack(fill=tk.X, padx=5, pady=2)
         ttk.Button(buttons_frame, text="Paso", command=self.paso).pack(fill=tk.X, padx=5, pady=2)
         ttk.Button(buttons_frame, text="Evolucionar", command=self.evolucionar).pack(fill=tk.X, padx=5, pady=2)
+        self.boton_pausa = ttk.Button(buttons_frame, text="Pausar", command=self.pausar_reanudar)
+        self.boton_pausa.pack(fill=tk.X, padx=5, pady=2)
+        self.boton_cancelar = ttk.Button(buttons_frame, text="Cancelar", command=self.cancelar)
+        self.boton_cancelar.pack(fill=tk.X, padx=5, pady=2)
         ttk.Button(buttons_frame, text="Mostrar Resultado", command=self.mostrar_resultado).pack(fill=tk.X, padx=5,
                                                                                                  pady=2)
 
@@ -148,42 +162,30 @@ class AplicacionAG(tk.Tk):
     def actualizar_graficos(self):
         """Actualiza los gráficos de la aplicación."""
         try:
-            # Limpiar frames
-            for widget in self.evolucion_frame.winfo_children():
-                widget.destroy()
-
-            for widget in self.funcion_frame.winfo_children():
-                widget.destroy()
-
-            # Obtener estadísticas
-            stats = self.algoritmo.obtener_estadisticas()
-
-            # Gráfico de evolución
-            if stats['generacion_actual'] > 0:
-                fig_evolucion = graficar_evolucion(
-                    stats['mejor_fitness_historico'],
-                    stats['fitness_promedio_historico']
+            # Obtener estadísticas sin interferir con una evolución en curso
+            with self.bloqueo:
+                stats = self.algoritmo.obtener_estadisticas()
+
+            # Los gráficos se crean una sola vez y después solo se actualizan sus datos
+            if self.lienzo_evolucion is None:
+                self.lienzo_evolucion = LienzoEvolucion(self.evolucion_frame)
+            if self.lienzo_funcion is None:
+                self.lienzo_funcion = LienzoFuncion(
+                    self.funcion_frame,
+                    funcion_objetivo,
+                    self.algoritmo.rango_min,
+                    self.algoritmo.rango_max
                 )
 
-                canvas_evolucion = FigureCanvasTkAgg(fig_evolucion, self.evolucion_frame)
-                canvas_evolucion.draw()
-                canvas_evolucion.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            else:
-                # Mostrar mensaje cuando no hay datos
-                label = ttk.Label(self.evolucion_frame, text="No hay datos de evolución disponibles")
-                label.pack(pady=50)
-
-            # Gráfico de función
-            fig_funcion = graficar_funcion(
-                funcion_objetivo,
-                self.algoritmo.rango_min,
-                self.algoritmo.rango_max,
-                stats['mejor_valor_real']
+            # Gráfico de evolución
+            self.lienzo_evolucion.actualizar(
+                stats['generaciones_historico'],
+                stats['mejor_fitness_historico'],
+                stats['fitness_promedio_historico']
             )
 
-            canvas_funcion = FigureCanvasTkAgg(fig_funcion, self.funcion_frame)
-            canvas_funcion.draw()
-            canvas_funcion.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Gráfico de función
+            self.lienzo_funcion.actualizar(stats['mejor_valor_real'])
 
             # Actualizar etiquetas de información
             self.generacion_label.config(text=str(stats['generacion_actual']))
@@ -219,6 +221,10 @@ class AplicacionAG(tk.Tk):
             if tamano_poblacion <= 0 or pmi < 0 or pmi > 1 or pmg < 0 or pmg > 1 or factor_crecimiento <= 0:
                 raise ValueError("Parámetros inválidos")
 
+            # Descartar la evolución en curso (su última generación termina sola) antes de
+            # sustituir el algoritmo
+            self.descartar_evolucion()
+
             # Crear nuevo algoritmo
             self.algoritmo = AlgoritmoGenetico(
                 funcion_objetivo=funcion_objetivo,
@@ -243,6 +249,10 @@ class AplicacionAG(tk.Tk):
 
     def paso(self):
         """Ejecuta un paso de evolución."""
+        if self.evolucion_en_curso():
+            messagebox.showinfo("Información", "Hay una evolución en curso")
+            return
+
         try:
             mejor_fitness, fitness_promedio, _ = self.algoritmo.paso_generacion()
 
@@ -256,7 +266,11 @@ class AplicacionAG(tk.Tk):
             print(f"Error en paso: {e}")
 
     def evolucionar(self):
-        """Evoluciona el algoritmo hasta el máximo de generaciones."""
+        """Evoluciona el algoritmo hasta el máximo de generaciones en un hilo de fondo."""
+        if self.evolucion_en_curso():
+            messagebox.showinfo("Información", "Hay una evolución en curso")
+            return
+
         try:
             # Generaciones restantes
             gen_actual = self.algoritmo.generacion_actual
@@ -267,14 +281,8 @@ class AplicacionAG(tk.Tk):
                 messagebox.showinfo("Información", "Ya se alcanzó el máximo de generaciones")
                 return
 
-            # Ejecutar evolución
-            _, mejor_fitness, mejor_valor = self.algoritmo.evolucionar(pasos_restantes)
-
-            self.log(f"Evolución completada: {pasos_restantes} generaciones")
-            self.log(f"Mejor fitness: {mejor_fitness:.6f}")
-            self.log(f"Mejor solución: x = {mejor_valor:.6f}")
-
-            self.actualizar_graficos()
+            # Ejecutar evolución sin bloquear la interfaz
+            self.lanzar_evolucion(pasos_restantes)
 
         except Exception as e:
             messagebox.showerror("Error", f"Error al evolucionar: {str(e)}")
@@ -282,7 +290,8 @@ class AplicacionAG(tk.Tk):
 
     def mostrar_resultado(self):
         """Muestra los resultados del algoritmo."""
-        stats = self.algoritmo.obtener_estadisticas()
+        with self.bloqueo:
+            stats = self.algoritmo.obtener_estadisticas()
 
         if stats['mejor_valor_real'] is None:
             messagebox.showinfo("Información", "No hay resultados disponibles")
@@ -0,0 +1,255 @@
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import messagebox
+from typing import List, Optional, Tuple
+
+from genetico.algoritmo import AlgoritmoGenetico
+
+# Cada cuántos milisegundos la interfaz revisa la cola de mensajes
+INTERVALO_SONDEO_MS = 50
+
+# Tiempo mínimo en segundos entre dos redibujados de los gráficos durante una evolución
+INTERVALO_REDIBUJO = 0.25
+
+# Segundos máximos que se espera al hilo de evolución al cerrar la ventana
+ESPERA_CIERRE = 2.0
+
+
+class EjecutorEvolucion:
+    """
+    Ejecuta la evolución de un AlgoritmoGenetico en un hilo de fondo.
+
+    El hilo envía un mensaje por generación a una cola que la interfaz vacía
+    periódicamente con after(), de modo que el bucle de eventos de Tk nunca se
+    bloquea. Cada generación se ejecuta con el cerrojo tomado: la interfaz debe
+    tomarlo también para leer el estado del algoritmo mientras la evolución sigue.
+
+    Mensajes de la cola (tuplas (tipo, dato)):
+        - ('generacion', registro): registro devuelto por AlgoritmoGenetico.iterar
+        - ('fin', criterio): criterio de parada, o 'cancelado'
+        - ('error', mensaje): la evolución terminó con una excepción
+    """
+
+    def __init__(
+            self,
+            algoritmo: AlgoritmoGenetico,
+            pasos: int,
+            bloqueo: Optional[threading.Lock] = None,
+            **criterios_parada
+    ):
+        """
+        Prepara la ejecución (no la inicia).
+
+        Args:
+            algoritmo: Algoritmo a evolucionar
+            pasos: Número máximo de generaciones
+            bloqueo: Cerrojo que protege al algoritmo (si es None, se crea uno)
+            **criterios_parada: Criterios de parada anticipada (ver AlgoritmoGenetico.iterar)
+        """
+        self.algoritmo = algoritmo
+        self.pasos = pasos
+        self.bloqueo = bloqueo if bloqueo is not None else threading.Lock()
+        self.criterios_parada = criterios_parada
+
+        self.cola = queue.Queue()
+        self._continuar = threading.Event()
+        self._continuar.set()
+        self._cancelado = threading.Event()
+        self._hilo = None
+
+    def iniciar(self) -> None:
+        """Lanza el hilo de evolución."""
+        self._hilo = threading.Thread(target=self._ejecutar, name='EjecutorEvolucion', daemon=True)
+        self._hilo.start()
+
+    def _ejecutar(self) -> None:
+        """Cuerpo del hilo: avanza generación a generación atendiendo pausa y cancelación."""
+        try:
+            iterador = self.algoritmo.iterar(self.pasos, **self.criterios_parada)
+            while True:
+                self._continuar.wait()
+                if self._cancelado.is_set():
+                    self.cola.put(('fin', 'cancelado'))
+                    return
+
+                with self.bloqueo:
+                    registro = next(iterador, None)
+
+                if registro is None:
+                    self.cola.put(('fin', self.algoritmo.criterio_parada))
+                    return
+                self.cola.put(('generacion', registro))
+
+        except Exception as e:
+            self.cola.put(('error', str(e)))
+
+    def pausar(self) -> None:
+        """Detiene la evolución al terminar la generación en curso."""
+        self._continuar.clear()
+
+    def reanudar(self) -> None:
+        """Continúa una evolución pausada."""
+        self._continuar.set()
+
+    def cancelar(self) -> None:
+        """Termina la evolución al acabar la generación en curso (también si está pausada)."""
+        self._cancelado.set()
+        self._continuar.set()
+
+    def esperar(self, tiempo_maximo: Optional[float] = None) -> None:
+        """
+        Espera a que el hilo de evolución termine.
+
+        Args:
+            tiempo_maximo: Segundos máximos de espera (None espera indefinidamente)
+        """
+        if self._hilo is not None:
+            self._hilo.join(tiempo_maximo)
+
+    @property
+    def pausado(self) -> bool:
+        """Si la evolución está pausada."""
+        return not self._continuar.is_set()
+
+    @property
+    def en_ejecucion(self) -> bool:
+        """Si el hilo de evolución sigue vivo."""
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def obtener_mensajes(self) -> List[Tuple[str, object]]:
+        """
+        Vacía la cola sin bloquear.
+
+        Returns:
+            Lista de mensajes pendientes, en orden de llegada
+        """
+        mensajes = []
+        while True:
+            try:
+                mensajes.append(self.cola.get_nowait())
+            except queue.Empty:
+                return mensajes
+
+
+class ControlEvolucion:
+    """
+    Mezcla para las ventanas de Tk que evolucionan un AlgoritmoGenetico con EjecutorEvolucion.
+
+    Reúne el lanzamiento, el sondeo de la cola, la pausa, la cancelación y el cierre
+    de la ventana. La clase que la usa debe definir los atributos bloqueo, ejecutor,
+    ultimo_redibujo, algoritmo, boton_pausa, boton_cancelar y generacion_label, y los
+    métodos log y actualizar_graficos.
+
+    Ninguna operación espera al hilo en el bucle de eventos salvo cerrar(), y solo
+    ESPERA_CIERRE segundos: la cancelación se pide al hilo y el sondeo recoge su fin.
+    """
+
+    def lanzar_evolucion(self, pasos: int) -> None:
+        """
+        Inicia la evolución en segundo plano y programa su sondeo.
+
+        Args:
+            pasos: Número máximo de generaciones
+        """
+        self.log(f"Evolucionando por {pasos} generaciones...")
+        self.ejecutor = EjecutorEvolucion(self.algoritmo, pasos, bloqueo=self.bloqueo)
+        self.ejecutor.iniciar()
+        self._activar_controles_evolucion(True)
+        self.after(INTERVALO_SONDEO_MS, self.sondear_evolucion, self.ejecutor)
+
+    def _activar_controles_evolucion(self, activos: bool) -> None:
+        """Habilita o deshabilita los botones de pausa y cancelación."""
+        estado = tk.NORMAL if activos else tk.DISABLED
+        self.boton_pausa.config(text="Pausar", state=estado)
+        self.boton_cancelar.config(state=estado)
+
+    def evolucion_en_curso(self) -> bool:
+        """Indica si hay una evolución en segundo plano cuyo final no se ha procesado."""
+        return self.ejecutor is not None
+
+    def sondear_evolucion(self, ejecutor: EjecutorEvolucion) -> None:
+        """Procesa los mensajes de la evolución en curso y redibuja como mucho cada INTERVALO_REDIBUJO."""
+        # Ignorar sondeos pendientes de una evolución ya descartada
+        if ejecutor is not self.ejecutor:
+            return
+
+        terminado = False
+        for tipo, dato in ejecutor.obtener_mensajes():
+            if tipo == 'generacion':
+                self.generacion_label.config(text=str(dato['generacion']))
+            elif tipo == 'fin':
+                terminado = True
+                stats = ejecutor.algoritmo.obtener_estadisticas()
+                if dato == 'cancelado':
+                    self.log(f"Evolución cancelada en la generación {stats['generacion_actual']}")
+                else:
+                    self.log(f"Evolución completada: {stats['generacion_actual']} generaciones")
+                if stats['mejor_valor_real'] is not None:
+                    self.log(f"Mejor fitness: {stats['mejor_fitness']:.6f}")
+                    self.log(f"Mejor solución: x = {stats['mejor_valor_real']:.6f}")
+            elif tipo == 'error':
+                terminado = True
+                messagebox.showerror("Error", f"Error al evolucionar: {dato}")
+
+        ahora = time.perf_counter()
+        if terminado or ahora - self.ultimo_redibujo >= INTERVALO_REDIBUJO:
+            self.actualizar_graficos()
+            self.ultimo_redibujo = ahora
+
+        if terminado:
+            self.ejecutor = None
+            self._activar_controles_evolucion(True)
+        else:
+            self.after(INTERVALO_SONDEO_MS, self.sondear_evolucion, ejecutor)
+
+    def pausar_reanudar(self) -> None:
+        """Pausa o reanuda la evolución en curso."""
+        if not self.evolucion_en_curso():
+            return
+
+        if self.ejecutor.pausado:
+            self.ejecutor.reanudar()
+            self.boton_pausa.config(text="Pausar")
+            self.log("Evolución reanudada")
+        else:
+            self.ejecutor.pausar()
+            self.boton_pausa.config(text="Reanudar")
+            self.log("Evolución pausada")
+
+    def cancelar(self) -> None:
+        """
+        Pide la cancelación de la evolución en curso sin esperarla.
+
+        El hilo termina al acabar la generación actual y el sondeo procesa su mensaje
+        de fin; hasta entonces los controles de la evolución quedan deshabilitados.
+        """
+        if not self.evolucion_en_curso():
+            return
+
+        self.ejecutor.cancelar()
+        self._activar_controles_evolucion(False)
+
+    def descartar_evolucion(self) -> None:
+        """
+        Cancela la evolución en curso sin esperarla y deja de sondearla.
+
+        Su última generación termina en segundo plano sobre el algoritmo y el cerrojo que
+        tenía; la ventana toma un cerrojo nuevo, de modo que puede sustituir el algoritmo
+        y leerlo inmediatamente.
+        """
+        if not self.evolucion_en_curso():
+            return
+
+        self.ejecutor.cancelar()
+        self.ejecutor = None
+        self.bloqueo = threading.Lock()
+        self._activar_controles_evolucion(True)
+
+    def cerrar(self) -> None:
+        """Cancela la evolución en curso y cierra la ventana, esperando al hilo como mucho ESPERA_CIERRE segundos."""
+        if self.evolucion_en_curso():
+            self.ejecutor.cancelar()
+            self.ejecutor.esperar(ESPERA_CIERRE)
+        self.destroy()
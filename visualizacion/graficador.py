@@ -1,39 +1,100 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Callable, Optional
+from functools import lru_cache
+from typing import List, Callable, Optional, Sequence, Tuple
 from matplotlib.figure import Figure
 
+from genetico.evaluacion import detectar_vectorizacion, evaluar_valores
+
+
+# Número mínimo de puntos de la curva, sea cual sea el ancho del lienzo
+PUNTOS_MINIMOS = 100
+
+
+@lru_cache(maxsize=32)
+def curva_funcion(
+        funcion: Callable[[float], float],
+        rango_min: float,
+        rango_max: float,
+        puntos: int = 1000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Muestrea la función objetivo en puntos equiespaciados del rango.
+
+    La función se evalúa con una sola llamada si acepta arrays (valor a valor si no) y
+    el resultado se guarda en caché por (función, rango, puntos): los arrays devueltos
+    son de solo lectura y se comparten entre llamadas.
+
+    Args:
+        funcion: Función objetivo
+        rango_min: Valor mínimo del rango
+        rango_max: Valor máximo del rango
+        puntos: Número de puntos
+
+    Returns:
+        Arrays x e y de la curva
+    """
+    x = np.linspace(rango_min, rango_max, puntos)
+    y = evaluar_valores(funcion, x, detectar_vectorizacion(funcion, x))
+
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+def puntos_para_ancho(ancho_pixeles: float, paso: int = 50) -> int:
+    """
+    Calcula la resolución de la curva para un ancho de ejes en píxeles.
+
+    Basta un punto por píxel; el ancho se redondea hacia arriba a un múltiplo de paso
+    para que los cambios de tamaño pequeños reutilicen la curva en caché.
+
+    Args:
+        ancho_pixeles: Ancho de la zona de ejes en píxeles
+        paso: Granularidad del redondeo
+
+    Returns:
+        Número de puntos de la curva
+    """
+    return max(PUNTOS_MINIMOS, int(np.ceil(ancho_pixeles / paso)) * paso)
+
 
 def graficar_evolucion(
         mejor_fitness: List[float],
         fitness_promedio: List[float],
-        titulo: str = "Evolución del Fitness"
+        titulo: str = "Evolución del Fitness",
+        generaciones: Optional[Sequence[int]] = None
 ) -> Figure:
     """
     Grafica la evolución del fitness a lo largo de las generaciones.
 
+    La figura no se registra en pyplot, así que se libera cuando deja de usarse.
+
     Args:
         mejor_fitness: Lista con el mejor fitness de cada generación
         fitness_promedio: Lista con el fitness promedio de cada generación
         titulo: Título del gráfico
+        generaciones: Número de generación de cada valor (por defecto, su posición; hace
+            falta con las políticas de historial que no guardan todas las generaciones)
 
     Returns:
         Figura de matplotlib
     """
-    fig = plt.figure(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ejes = fig.add_subplot()
 
-    generaciones = range(len(mejor_fitness))
+    if generaciones is None:
+        generaciones = range(len(mejor_fitness))
 
-    plt.plot(generaciones, mejor_fitness, 'b-', label='Mejor Fitness')
-    plt.plot(generaciones, fitness_promedio, 'r-', label='Fitness Promedio')
+    ejes.plot(generaciones, mejor_fitness, 'b-', label='Mejor Fitness')
+    ejes.plot(generaciones, fitness_promedio, 'r-', label='Fitness Promedio')
 
-    plt.xlabel('Generación')
-    plt.ylabel('Fitness (maximización)')
-    plt.title(titulo)
-    plt.legend()
-    plt.grid(True)
+    ejes.set_xlabel('Generación')
+    ejes.set_ylabel('Fitness (maximización)')
+    ejes.set_title(titulo)
+    ejes.legend()
+    ejes.grid(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     return fig
 
@@ -49,6 +110,8 @@ def graficar_funcion(
     """
     Grafica la función objetivo y opcionalmente marca el mejor valor encontrado.
 
+    La figura no se registra en pyplot, así que se libera cuando deja de usarse.
+
     Args:
         funcion: Función objetivo
         rango_min: Valor mínimo del rango
@@ -60,19 +123,19 @@ def graficar_funcion(
     Returns:
         Figura de matplotlib
     """
-    fig = plt.figure(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ejes = fig.add_subplot()
 
     # Crear puntos para graficar la función
-    x = np.linspace(rango_min, rango_max, puntos)
-    y = np.array([funcion(xi) for xi in x])
+    x, y = curva_funcion(funcion, rango_min, rango_max, puntos)
 
     # Graficar función
-    plt.plot(x, y, 'b-', label='Función Objetivo')
+    ejes.plot(x, y, 'b-', label='Función Objetivo')
 
     # Marcar mejor valor si se proporciona
     if mejor_valor is not None:
         mejor_y = funcion(mejor_valor)
-        plt.scatter(
+        ejes.scatter(
             mejor_valor,
             mejor_y,
             c='r',
@@ -80,12 +143,12 @@ def graficar_funcion(
             label=f'Mejor Solución (x={mejor_valor:.4f}, f(x)={mejor_y:.4f})'
         )
 
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.title(titulo)
-    plt.legend()
-    plt.grid(True)
+    ejes.set_xlabel('x')
+    ejes.set_ylabel('f(x)')
+    ejes.set_title(titulo)
+    ejes.legend()
+    ejes.grid(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    return fig
\ No newline at end of file
+    return fig
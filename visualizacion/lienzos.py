@@ -0,0 +1,251 @@
+import tkinter as tk
+import numpy as np
+from typing import Callable, Optional
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from visualizacion.graficador import curva_funcion, puntos_para_ancho
+
+
+class LienzoEvolucion:
+    """
+    Gráfico persistente de la evolución del fitness incrustado en un contenedor de Tk.
+
+    La figura y el lienzo se crean una sola vez. Cada actualización cambia los datos de
+    las líneas con set_data y, mientras quepan en los límites actuales, solo las vuelve
+    a pintar sobre el fondo guardado (blitting). Los límites del eje x crecen al doble
+    cuando se llenan, así que el redibujado completo solo ocurre O(log n) veces.
+    """
+
+    def __init__(self, contenedor: tk.Widget, titulo: str = "Evolución del Fitness"):
+        """
+        Crea la figura y el lienzo y los empaqueta en el contenedor.
+
+        Args:
+            contenedor: Widget de Tk donde se muestra el gráfico
+            titulo: Título del gráfico
+        """
+        self.figura = Figure(figsize=(10, 6))
+        self.ejes = self.figura.add_subplot()
+
+        # Las líneas son animadas: no forman parte del fondo guardado
+        self.linea_mejor, = self.ejes.plot([], [], 'b-', label='Mejor Fitness', animated=True)
+        self.linea_promedio, = self.ejes.plot([], [], 'r-', label='Fitness Promedio', animated=True)
+
+        self.ejes.set_xlabel('Generación')
+        self.ejes.set_ylabel('Fitness (maximización)')
+        self.ejes.set_title(titulo)
+        self.ejes.legend()
+        self.ejes.grid(True)
+        self.ejes.set_xlim(0, 10)
+        self.ejes.set_ylim(0, 1)
+        self.figura.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(self.figura, contenedor)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Fondo (todo salvo las líneas) capturado tras cada redibujado completo
+        self._fondo = None
+        self._n_puntos = 0
+        self.canvas.mpl_connect('draw_event', self._al_dibujar)
+        self.canvas.draw()
+
+    def _al_dibujar(self, evento) -> None:
+        """Guarda el fondo tras un redibujado completo y pinta las líneas encima."""
+        self._fondo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self._dibujar_lineas()
+
+    def _dibujar_lineas(self) -> None:
+        """Pinta las líneas animadas en el buffer de la figura."""
+        self.ejes.draw_artist(self.linea_mejor)
+        self.ejes.draw_artist(self.linea_promedio)
+
+    def _ajustar_limites(
+            self,
+            generaciones: np.ndarray,
+            mejor: np.ndarray,
+            promedio: np.ndarray,
+            desde_cero: bool
+    ) -> bool:
+        """
+        Amplía los límites de los ejes si los datos no caben.
+
+        Args:
+            generaciones: Índice de generación de cada valor
+            mejor: Mejor fitness de cada generación
+            promedio: Fitness promedio de cada generación
+            desde_cero: Si los límites del eje y se calculan solo a partir de los datos
+
+        Returns:
+            Si los límites han cambiado (hace falta un redibujado completo)
+        """
+        if len(generaciones) == 0:
+            return False
+
+        cambiado = False
+        x_min, x_max = self.ejes.get_xlim()
+        ultima = generaciones[-1]
+        if ultima > x_max or generaciones[0] < x_min:
+            # Duplicar el ancho para que el siguiente ajuste tarde el doble en llegar
+            ancho = max(10, 2 * (ultima - generaciones[0]))
+            self.ejes.set_xlim(generaciones[0], generaciones[0] + ancho)
+            cambiado = True
+
+        # Los valores infinitos (p. ej. de una función objetivo penalizada) no se pueden mostrar
+        valores = np.concatenate((mejor, promedio))
+        valores = valores[np.isfinite(valores)]
+        if len(valores) == 0:
+            return cambiado
+
+        y_min, y_max = (np.inf, -np.inf) if desde_cero else self.ejes.get_ylim()
+        datos_min = np.min(valores)
+        datos_max = np.max(valores)
+        if datos_min < y_min or datos_max > y_max:
+            margen = 0.1 * max(datos_max - datos_min, 1e-9)
+            self.ejes.set_ylim(min(y_min, datos_min - margen), max(y_max, datos_max + margen))
+            cambiado = True
+
+        return cambiado
+
+    def actualizar(self, generaciones: np.ndarray, mejor_fitness: np.ndarray, fitness_promedio: np.ndarray) -> None:
+        """
+        Actualiza las líneas con el historial actual.
+
+        Args:
+            generaciones: Índice de generación de cada valor
+            mejor_fitness: Mejor fitness de cada generación
+            fitness_promedio: Fitness promedio de cada generación
+        """
+        # Un historial más corto que el anterior es una ejecución nueva: restablecer los límites
+        redibujar = self._fondo is None
+        if len(generaciones) < self._n_puntos:
+            self.ejes.set_xlim(0, 10)
+            self.ejes.set_ylim(0, 1)
+            redibujar = True
+        desde_cero = self._n_puntos == 0 or redibujar
+        self._n_puntos = len(generaciones)
+
+        self.linea_mejor.set_data(generaciones, mejor_fitness)
+        self.linea_promedio.set_data(generaciones, fitness_promedio)
+
+        if self._ajustar_limites(generaciones, mejor_fitness, fitness_promedio, desde_cero) or redibujar:
+            # El redibujado completo vuelve a capturar el fondo y pinta las líneas
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self._fondo)
+        self._dibujar_lineas()
+        self.canvas.blit(self.figura.bbox)
+
+
+class LienzoFuncion:
+    """
+    Gráfico persistente de la función objetivo con la mejor solución marcada.
+
+    La curva se calcula una sola vez por resolución (en caché, ver curva_funcion) con
+    un punto por píxel de ancho de los ejes, y solo se vuelve a muestrear si el lienzo
+    cambia de tamaño. Cada actualización solo mueve el marcador de la mejor solución,
+    y únicamente cuando esta cambia.
+    """
+
+    def __init__(
+            self,
+            contenedor: tk.Widget,
+            funcion: Callable[[float], float],
+            rango_min: float,
+            rango_max: float,
+            titulo: str = "Función Objetivo",
+            puntos: Optional[int] = None
+    ):
+        """
+        Crea la figura con la curva de la función y la empaqueta en el contenedor.
+
+        Args:
+            contenedor: Widget de Tk donde se muestra el gráfico
+            funcion: Función objetivo
+            rango_min: Valor mínimo del rango
+            rango_max: Valor máximo del rango
+            titulo: Título del gráfico
+            puntos: Número de puntos para graficar la función (si es None, se adapta
+                al ancho en píxeles de los ejes)
+        """
+        self.funcion = funcion
+        self.rango_min = rango_min
+        self.rango_max = rango_max
+        self.puntos = puntos
+        self.figura = Figure(figsize=(10, 6))
+        self.ejes = self.figura.add_subplot()
+
+        self.curva, = self.ejes.plot([], [], 'b-', label='Función Objetivo')
+        self.ejes.set_xlim(rango_min, rango_max)
+
+        # Marcador de la mejor solución (oculto hasta que exista una)
+        self.marcador = self.ejes.scatter([np.nan], [np.nan], c='r', s=100, label='Mejor Solución')
+
+        self.ejes.set_xlabel('x')
+        self.ejes.set_ylabel('f(x)')
+        self.ejes.set_title(titulo)
+        self.leyenda = self.ejes.legend()
+
+        # Ocultarlo después de crear la leyenda para que esta conserve su símbolo
+        self.marcador.set_visible(False)
+        self.ejes.grid(True)
+        self.figura.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(self.figura, contenedor)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self._puntos_curva = 0
+        self._muestrear_curva()
+        self.canvas.mpl_connect('resize_event', self._al_redimensionar)
+        self.canvas.draw()
+
+        self._mejor_valor = None
+
+    def _muestrear_curva(self) -> bool:
+        """
+        Ajusta la curva a la resolución que corresponde al tamaño actual de los ejes.
+
+        Returns:
+            Si la curva ha cambiado
+        """
+        puntos = self.puntos if self.puntos is not None else puntos_para_ancho(self.ejes.bbox.width)
+        if puntos == self._puntos_curva:
+            return False
+
+        x, y = curva_funcion(self.funcion, self.rango_min, self.rango_max, puntos)
+        self.curva.set_data(x, y)
+        self._puntos_curva = puntos
+
+        # Límites del eje y a partir de la curva, con el mismo margen que el autoescalado
+        margen = 0.05 * max(np.ptp(y), 1e-9)
+        self.ejes.set_ylim(np.min(y) - margen, np.max(y) + margen)
+        return True
+
+    def _al_redimensionar(self, evento) -> None:
+        """Vuelve a muestrear la curva si el nuevo ancho pide otra resolución."""
+        if self._muestrear_curva():
+            self.canvas.draw_idle()
+
+    def actualizar(self, mejor_valor: Optional[float]) -> None:
+        """
+        Mueve el marcador a la mejor solución si ha cambiado.
+
+        Args:
+            mejor_valor: Mejor valor encontrado (None oculta el marcador)
+        """
+        if mejor_valor == self._mejor_valor:
+            return
+        self._mejor_valor = mejor_valor
+
+        if mejor_valor is None:
+            self.marcador.set_visible(False)
+            self.leyenda.get_texts()[1].set_text('Mejor Solución')
+        else:
+            mejor_y = self.funcion(mejor_valor)
+            self.marcador.set_offsets([[mejor_valor, mejor_y]])
+            self.marcador.set_visible(True)
+            self.leyenda.get_texts()[1].set_text(f'Mejor Solución (x={mejor_valor:.4f}, f(x)={mejor_y:.4f})')
+
+        # La leyenda cambia con el marcador, así que se redibuja la figura completa
+        self.canvas.draw_idle()